@@ -11,10 +11,13 @@ bl_info = {
 }
 
 import bpy
-import re
 import json
+import os
+import re
 import math
+import time
 import numpy as np
+from bpy.app.handlers import persistent
 from bpy.props import (
     CollectionProperty,
     StringProperty,
@@ -27,11 +30,107 @@ from bpy.props import (
 )
 from random import uniform
 
+from . import lod_workers
+from . import lod_export
+from .lod_logic import LODEngine, LODSchedule, encode_schedule, solve_budget, budget_usage, validate_chains, ISSUE_NAMES
+
 LOD_PATTERN = re.compile(r".*_LOD(\d+)$", re.IGNORECASE)
 
-# Global cache for LOD groups and color state
+# Global cache for LOD groups of the tracked scene (LOD_SCAN_STATE["scene"]).
+# Group entry: {"base_name", "lods": [(lod_num, session_uid)], "max_index"}
 LOD_GROUPS_CACHE = []
-COLORING_ENABLED_LAST = False
+# Base name -> row in LOD_GROUPS_CACHE (and LOD_ENGINE / STATS_TABLE)
+LOD_GROUP_ROWS = {}
+# Scene ID property holding the group index: base name -> parallel arrays of object names and LOD levels
+# (session_uids are not stable across file loads, names are)
+GROUP_INDEX_KEY = "lod_group_index"
+# Base positions and LOD results of LOD_GROUPS_CACHE as NumPy arrays
+LOD_ENGINE = LODEngine()
+# Shadow state: object session_uid -> [hide_render, hide_viewport, color] as last written
+LOD_SHADOW_STATE = {}
+# Custom property keeping an object's own display type while it is drawn as a proxy
+DISPLAY_TYPE_KEY = "lod_display_type"
+# session_uids of objects currently switched to a proxy display type (BOUNDS / WIRE)
+LOD_PROXY_UIDS = set()
+# Settings the last auto pass was applied with (None forces a full pass)
+LOD_APPLY_STATE = {"signature": None, "object_count": -1, "proxy": None}
+WHITE = (1.0, 1.0, 1.0, 1.0)
+# Base object session_uid -> group index in LOD_GROUPS_CACHE (for depsgraph filtering)
+LOD_BASE_INDEX = {}
+# Groups whose base position must be re-read ("all" after rebuild, load, undo or frame change)
+LOD_DIRTY_POSITIONS = {"all": True, "groups": set()}
+# More dirty groups than this are re-read in bulk (read_object_transforms) instead of one by one
+BULK_POSITIONS_MIN = 64
+# Base object session_uid of every group of LOD_GROUPS_CACHE, for the GROUP_BROWSER groups_version
+LOD_BASE_UIDS = {"version": -1, "uids": np.zeros(0, dtype=np.int64)}
+# Geometry statistics read with foreach_get: mesh session_uid -> (polys, tris, verts)
+MESH_STATS_CACHE = {}
+# Statistics after modifiers for objects that have modifiers: object session_uid -> (polys, tris, verts)
+EVAL_STATS_CACHE = {}
+STAT_FIELDS = ("polys", "tris", "verts", "eval_polys", "eval_tris", "eval_verts")
+# Per group / per LOD slot statistics of LOD_GROUPS_CACHE, rebuilt only when invalidated
+# (uids: session_uid of each slot's object, -1 for padding and objects that are not in the scene)
+STATS_TABLE = {
+    "valid": False,
+    "values": np.zeros((0, 0, len(STAT_FIELDS)), dtype=np.int64),
+    "levels": np.zeros((0, 0), dtype=np.int64),
+    "uids": np.zeros((0, 0), dtype=np.int64),
+    "object_uids": set(),
+}
+# Precomputed polycount totals for the panel: {"mode", "levels": [(lvl, total, visible)], "visible"}
+POLYCOUNT_STATS = {"mode": "", "levels": [], "visible": None}
+# Objects (session_uid) written by the last update, their next depsgraph echo is ignored
+LOD_WRITTEN_UIDS = set()
+# Deferred (coalesced) update state for lod_handler
+LOD_UPDATE_STATE = {"scene_name": "", "last_run": 0.0, "applying": False, "reconcile": False}
+# Time-sliced auto pass still being applied: remaining groups (nearest first) and the write settings
+LOD_APPLY_JOB = {"scene": "", "groups": [], "settings": None}
+# Groups written between two checks of the slice time budget
+APPLY_CHUNK = 64
+# Live group index: base name -> group entry (the same dicts as in LOD_GROUPS_CACHE)
+LOD_GROUP_INDEX = {}
+# Tracked LOD object name -> (base name, lod number, session_uid)
+LOD_OBJECT_BASES = {}
+# session_uid -> object for the scene's objects, resolved in bulk and refreshed after undo/redo/load
+LOD_OBJECT_MAP = {}
+LOD_OBJECT_MAP_STATE = {"scene": "", "valid": False}
+# Object names of the scanned scene, diffed to find added/removed/renamed objects
+LOD_SCAN_STATE = {"scene": "", "names": set(), "data_count": -1}
+# Owner of the msgbus subscription for object renames
+LOD_MSGBUS_OWNER = object()
+# Last LOD chain validation: flagged groups (indices into LOD_GROUPS_CACHE) with their findings,
+# and the last filter/sort result of the report list
+VALIDATION_REPORT = {
+    "version": 0, "groups_version": -1, "checked": 0, "settings": None, "groups": np.zeros(0, dtype=np.int64),
+    "names": np.zeros(0, dtype=str), "issues": np.zeros(0, dtype=np.int64),
+    "ratio": np.zeros(0, dtype=np.float64), "deviation": np.zeros(0, dtype=np.float64),
+    "filter_key": None, "filter_result": ([], []),
+}
+# Viewport eye: the 3D view last navigated (view matrix key per region) and its eye / projection
+LOD_VIEWPORT_EYE = {"valid": False, "location": None, "focal_pixels": None, "ortho_pixels_per_unit": None,
+                    "view_projection": None, "pending": None, "rendering": False, "keys": {}, "scene": "", "last_update": 0.0}
+LOD_DRAW_HANDLE = None
+# Decoded baked schedule (scene ID property "lod_schedule") in LOD_GROUPS_CACHE order
+LOD_SCHEDULE_CACHE = {"scene": "", "valid": False, "schedule": None}
+# Multi-camera: key of the view whose result is applied, and whether only the active view changed
+LOD_VIEW_STATE = {"active": None, "switch_only": False}
+# Collection mode: parent of the managed LOD0, LOD1, ... collections
+LOD_COLLECTION_ROOT = "LOD Levels"
+# Collection mode: colors last written by the manual path, and whether object level flags are all visible
+LOD_COLLECTION_STATE = {"colors": None, "objects_clean": False}
+# Geometry Nodes instancers: node group / modifier name, and the scanned instancers of the scene
+GN_INSTANCER_NAME = "LOD Manager Instancer"
+LOD_GN_STATE = {"scene": "", "valid": False, "instancers": [], "bases": set()}
+# Keeps enum item strings alive while Blender uses them
+GN_GROUP_ITEMS = []
+# Group browser: per group arrays in LOD_GROUPS_CACHE order, refreshed by update_lod_selection,
+# and the last filter/sort result of the browser list
+GROUP_BROWSER = {
+    "groups_version": 0, "items_version": -1, "data_version": 0,
+    "names": np.zeros(0, dtype=str), "current": np.zeros(0, dtype=np.int64),
+    "tris": np.zeros(0, dtype=np.int64), "distance": np.zeros(0, dtype=np.float64),
+    "filter_key": None, "filter_result": ([], []),
+}
 
 # Translation dictionary (for UI localization)
 TRANSLATIONS = {
@@ -39,7 +138,7 @@ TRANSLATIONS = {
         "addon_name": "LOD Manager",
         "description_tab": "Описание",
         "description_label": "Инструкция по использованию LOD Manager:",
-        "desc_refresh": "• Обновить группы LOD — сканирует сцену и находит объекты с суффиксом '_LOD0', '_LOD1' и т.п.",
+        "desc_refresh": "• Обновить группы LOD — сканирует сцену и находит объекты с суффиксом '_LOD0', '_LOD1' и т.п. Дальше группы обновляются сами при добавлении, переименовании и удалении объектов.",
         "desc_select": "• Клик по имени LOD — выбирает одну группу (изоляция остальных LOD-объектов).",
         "desc_ctrl": "• Ctrl + Клик — добавляет/удаляет LOD из текущего выбора.",
         "desc_shift": "• Shift + Клик — выбирает диапазон LOD-групп.",
@@ -63,7 +162,8 @@ TRANSLATIONS = {
         "total_polycount": "Общий поликаунт: {0}",
         "visible_polycount": "Видимый поликаунт: {0}",
         "total_visible_polycount": "Общий видимый поликаунт: {0}",
-        "error_polycount": "Ошибка чтения данных",
+        "visible_tris_verts": "Видимые треугольники / вершины: {0} / {1}",
+        "visible_eval_tris": "Видимые треугольники с модификаторами: {0}",
         "language": "Язык",
         "language_ru": "Русский",
         "language_en": "English",
@@ -71,12 +171,67 @@ TRANSLATIONS = {
         "update_manually": "Обновить вручную",
         "base_distance": "Базовое расстояние",
         "auto_calculate_base": "Автоматически вычислить базовое расстояние",
+        "update_interval": "Интервал обновления",
+        "use_time_slicing": "Обновление по частям",
+        "frustum_culling": "Отсечение вне кадра",
+        "proxy_display": "Дальние группы",
+        "proxy_distance": "Дальше (%)",
+        "proxy_pixels": "Меньше (px)",
+        "frustum_margin": "Запас (%)",
+        "use_viewport_eye": "Следовать за вьюпортом",
+        "viewport_rate": "Частота (Гц)",
+        "slice_budget": "Бюджет (мс)",
+        "use_dynamic_base": "Динамическое базовое расстояние",
+        "hysteresis": "Гистерезис (%)",
+        "lod_metric": "Метрика",
+        "group_browser": "Группы LOD ({0})",
+        "generate_lods": "Сгенерировать LOD",
+        "generate_bad_targets": "Укажите значения уровней через запятую",
+        "generate_none": "Нет объектов _LOD0 для генерации",
+        "generate_done": "Создано LOD: {0} за {1:.1f} с",
+        "generate_started": "Генерация LOD для объектов: {0} (в фоне, Esc для отмены)",
+        "generate_cancelled": "Генерация LOD отменена",
+        "export_groups": "Экспорт групп LOD",
+        "validation": "Проверка цепочек LOD",
+        "validate_chains": "Проверить",
+        "validation_min_reduction": "Мин. сокращение (%)",
+        "validation_bounds_tolerance": "Допуск границ (%)",
+        "validation_summary": "Проблемных групп: {0} из {1}",
+        "validation_stale": "Группы изменились, запустите проверку снова",
+        "validation_done": "Проверка: проблемных групп {0} из {1} ({2:.2f} с)",
+        "validation_saved": "Отчёт сохранён: {0}",
+        "level_gap": "пропуск уровня",
+        "duplicate_level": "повтор уровня",
+        "no_reduction": "нет сокращения",
+        "bounds_mismatch": "границы",
+        "export_none": "Нет групп LOD для экспорта",
+        "export_started": "Экспорт групп: {0} (в фоне, Esc для отмены)",
+        "export_cancelled": "Экспорт отменён",
+        "export_failed": "Экспорт: ошибок {0} из {1}, см. manifest.json",
+        "export_done": "Экспортировано файлов: {0} за {1:.1f} с",
+        "add_gn_instancer": "Инстансер LOD (Geometry Nodes)",
+        "gn_instancers": "Инстансеров: {0}",
+        "gn_no_group": "Выберите группу LOD минимум с двумя уровнями",
+        "gn_added": "Инстансер группы {0} добавлен на {1}",
+        "use_lod_collections": "Коллекции уровней LOD",
+        "use_multi_camera": "Несколько камер",
+        "add_view_camera": "Добавить камеру",
+        "active_view": "Активный вид: {0} / слой {1}",
+        "bake_schedule": "Запечь расписание LOD",
+        "use_lod_schedule": "Использовать расписание",
+        "schedule_info": "Расписание: кадры {0}–{1}, групп: {2}",
+        "schedule_stale": "Расписание не совпадает с группами, перезапеките",
+        "triangle_budget": "Бюджет треугольников",
+        "budget_under": "Треугольников: {0} / {1} (запас {2})",
+        "budget_over": "Треугольников: {0} / {1} (превышение {2})",
+        "threshold_pixels": "Порог для LOD{0} (пикс.)",
+        "min_dwell_frames": "Мин. кадров до переключения",
     },
     "en": {
         "addon_name": "LOD Manager",
         "description_tab": "Description",
         "description_label": "Instructions for using LOD Manager:",
-        "desc_refresh": "• Refresh LOD Groups — scans the scene for objects with '_LOD0', '_LOD1', etc. suffixes.",
+        "desc_refresh": "• Refresh LOD Groups — scans the scene for objects with '_LOD0', '_LOD1', etc. suffixes. After that, groups update automatically when objects are added, renamed or deleted.",
         "desc_select": "• Click on LOD name — selects one group (isolates other LOD objects).",
         "desc_ctrl": "• Ctrl + Click — adds/removes LOD from current selection.",
         "desc_shift": "• Shift + Click — selects a range of LOD groups.",
@@ -100,7 +255,8 @@ TRANSLATIONS = {
         "total_polycount": "Total polycount: {0}",
         "visible_polycount": "Visible polycount: {0}",
         "total_visible_polycount": "Total visible polycount: {0}",
-        "error_polycount": "Error reading polycount data",
+        "visible_tris_verts": "Visible triangles / vertices: {0} / {1}",
+        "visible_eval_tris": "Visible triangles with modifiers: {0}",
         "language": "Language",
         "language_ru": "Русский",
         "language_en": "English",
@@ -108,6 +264,61 @@ TRANSLATIONS = {
         "update_manually": "Update Manually",
         "base_distance": "Base Distance",
         "auto_calculate_base": "Auto Calculate Base Distance",
+        "update_interval": "Update Interval",
+        "use_time_slicing": "Time-Sliced Updates",
+        "frustum_culling": "Frustum Culling",
+        "proxy_display": "Far Display",
+        "proxy_distance": "Beyond (%)",
+        "proxy_pixels": "Below (px)",
+        "frustum_margin": "Margin (%)",
+        "use_viewport_eye": "Follow Viewport",
+        "viewport_rate": "Rate (Hz)",
+        "slice_budget": "Budget (ms)",
+        "use_dynamic_base": "Dynamic Base Distance",
+        "hysteresis": "Hysteresis (%)",
+        "lod_metric": "Metric",
+        "group_browser": "LOD Groups ({0})",
+        "generate_lods": "Generate LODs",
+        "generate_bad_targets": "Enter comma separated level values",
+        "generate_none": "No _LOD0 objects to generate from",
+        "generate_done": "{0} LODs generated in {1:.1f} s",
+        "generate_started": "Generating LODs of {0} objects in the background (Esc to cancel)",
+        "generate_cancelled": "LOD generation cancelled",
+        "export_groups": "Export LOD Groups",
+        "validation": "LOD Chain Validation",
+        "validate_chains": "Validate",
+        "validation_min_reduction": "Min Reduction (%)",
+        "validation_bounds_tolerance": "Bounds Tolerance (%)",
+        "validation_summary": "{0} of {1} groups flagged",
+        "validation_stale": "Groups changed, validate again",
+        "validation_done": "Validation: {0} of {1} groups flagged ({2:.2f} s)",
+        "validation_saved": "Report saved: {0}",
+        "level_gap": "level gap",
+        "duplicate_level": "duplicate level",
+        "no_reduction": "no reduction",
+        "bounds_mismatch": "bounds",
+        "export_none": "No LOD groups to export",
+        "export_started": "Exporting {0} groups in the background (Esc to cancel)",
+        "export_cancelled": "Export cancelled",
+        "export_failed": "Export: {0} of {1} groups failed, see manifest.json",
+        "export_done": "{0} files exported in {1:.1f} s",
+        "add_gn_instancer": "LOD Instancer (Geometry Nodes)",
+        "gn_instancers": "{0} instancers",
+        "gn_no_group": "Choose a LOD group with at least two levels",
+        "gn_added": "Instancer for {0} added to {1}",
+        "use_lod_collections": "LOD Level Collections",
+        "use_multi_camera": "Multiple Cameras",
+        "add_view_camera": "Add Camera",
+        "active_view": "Active view: {0} / layer {1}",
+        "bake_schedule": "Bake LOD Schedule",
+        "use_lod_schedule": "Use Baked Schedule",
+        "schedule_info": "Schedule: frames {0}-{1}, {2} groups",
+        "schedule_stale": "Schedule does not match the LOD groups, re-bake it",
+        "triangle_budget": "Triangle Budget",
+        "budget_under": "Triangles: {0} / {1} ({2} under budget)",
+        "budget_over": "Triangles: {0} / {1} ({2} over budget)",
+        "threshold_pixels": "Threshold for LOD{0} (px)",
+        "min_dwell_frames": "Min Dwell Frames",
     }
 }
 
@@ -131,6 +342,9 @@ class LODManagerPreferences(bpy.types.AddonPreferences):
         col.separator()
         col.label(text=get_translation(context, "desc_warning"))
 
+class LODGroupItem(bpy.types.PropertyGroup):
+    name: StringProperty()
+
 class LODListItem(bpy.types.PropertyGroup):
     name: StringProperty()
     selected: BoolProperty(default=False)
@@ -144,6 +358,37 @@ class ThresholdItem(bpy.types.PropertyGroup):
         default=50.0,
         update=lambda self, ctx: update_lod_selection(ctx.scene)
     )
+    pixels: FloatProperty(
+        name="Pixels",
+        description="Screen size mode: switch to the next LOD once the group's projected size drops to this many pixels",
+        min=0.0,
+        max=8192.0,
+        default=100.0,
+        subtype='PIXEL',
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    hysteresis: FloatProperty(
+        name="Hysteresis",
+        description="Margin around this threshold (percentage of base distance, or of the pixel threshold in screen size mode). "
+                    "A group must move this far past the threshold before its LOD switches",
+        min=0.0,
+        max=50.0,
+        default=0.0,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+
+class LODViewItem(bpy.types.PropertyGroup):
+    camera: PointerProperty(
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'CAMERA',
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    view_layer: StringProperty(
+        name="View Layer",
+        description="Apply this camera's LODs whenever this view layer is active. "
+                    "Empty: whenever this camera is the scene camera",
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
 
 class LODColorItem(bpy.types.PropertyGroup):
     color: FloatVectorProperty(
@@ -183,159 +428,1633 @@ def generate_distinct_color(index, total):
     value = uniform(0.7, 1.0)
     return hsv_to_rgb(hue, saturation, value)
 
-def update_lod_selection(scene):
+def parse_lod_name(name):
+    """(base name, lod number) for a LOD object name, or None."""
+    match = LOD_PATTERN.match(name)
+    if not match:
+        return None
+    return name.rsplit('_LOD', 1)[0], int(match.group(1))
+
+def add_lod_object(obj):
+    """Add an object to the group index if its name matches LOD_PATTERN. Returns the group's base name or None."""
+    parsed = parse_lod_name(obj.name)
+    if parsed is None:
+        return None
+    base_name, lod_num = parsed
+    uid = obj.session_uid
+    group = LOD_GROUP_INDEX.setdefault(base_name, {"base_name": base_name, "lods": [], "max_index": -1})
+    group['lods'].append((lod_num, uid))
+    group['lods'].sort(key=lambda x: x[0])
+    group['max_index'] = len(group['lods']) - 1
+    LOD_OBJECT_BASES[obj.name] = (base_name, lod_num, uid)
+    LOD_OBJECT_MAP[uid] = obj
+    if DISPLAY_TYPE_KEY in obj:
+        # Saved while drawn as a proxy
+        LOD_PROXY_UIDS.add(uid)
+    return base_name
+
+def remove_lod_object(name):
+    """Remove a tracked object (deleted or renamed) from the group index. Returns the group's base name or None."""
+    tracked = LOD_OBJECT_BASES.pop(name, None)
+    if tracked is None:
+        return None
+    base_name, lod_num, uid = tracked
+    group = LOD_GROUP_INDEX.get(base_name)
+    if group is None:
+        return None
+    group['lods'] = [entry for entry in group['lods'] if entry[1] != uid]
+    if group['lods']:
+        group['max_index'] = len(group['lods']) - 1
+    else:
+        del LOD_GROUP_INDEX[base_name]
+    return base_name
+
+def resolve(uid):
+    """Object for a session_uid, or None if it is not in the scene."""
+    return LOD_OBJECT_MAP.get(uid)
+
+def refresh_object_map(scene):
+    """Re-resolve every handle in one pass and drop groups' objects that no longer exist.
+
+    Object references go stale after undo/redo, session_uids do not, so
+    this is all that is needed to make the group index valid again.
+    """
+    LOD_OBJECT_MAP.clear()
+    LOD_OBJECT_MAP.update((obj.session_uid, obj) for obj in scene.objects)
+    LOD_OBJECT_MAP_STATE.update(scene=scene.name, valid=True)
+    pruned = 0
+    touched = set()
+    for name, (base_name, lod_num, uid) in list(LOD_OBJECT_BASES.items()):
+        obj = LOD_OBJECT_MAP.get(uid)
+        if obj is None or obj.name != name:
+            # Removed, or renamed while the map was stale (reconcile re-adds it under its new name)
+            touched.add(remove_lod_object(name))
+            pruned += 1
+    if pruned:
+        print(f"LOD groups: dropped {pruned} objects no longer in the scene")
+        patch_group_index(touched)
+        sync_lod_levels(scene.lod_tool_props)
+    return pruned
+
+def ensure_object_map(scene):
+    if not LOD_OBJECT_MAP_STATE["valid"] or LOD_OBJECT_MAP_STATE["scene"] != scene.name:
+        refresh_object_map(scene)
+
+def invalidate_object_map():
+    LOD_OBJECT_MAP_STATE["valid"] = False
+
+def publish_group_index(store=True):
+    """Rebuild LOD_GROUPS_CACHE (and the engine) from the live group index.
+
+    The index is also stored in the tracked scene, unless it was just loaded from there.
+    Used by Refresh and file loads; incremental changes go through patch_group_index.
+    """
+    global LOD_GROUPS_CACHE
+    LOD_GROUPS_CACHE = [group for group in LOD_GROUP_INDEX.values() if group['lods']]
+    LOD_GROUP_ROWS.clear()
+    LOD_GROUP_ROWS.update((group['base_name'], row) for row, group in enumerate(LOD_GROUPS_CACHE))
+    rebuild_lod_engine()
+    GROUP_BROWSER["groups_version"] += 1
+    scene = bpy.data.scenes.get(LOD_SCAN_STATE["scene"]) if store else None
+    if scene is not None:
+        store_group_index(scene)
+
+def patch_group_index(base_names):
+    """Apply changes of the given groups only: their rows of LOD_GROUPS_CACHE, LOD_ENGINE and
+    STATS_TABLE and their entries of the stored index. Every other group keeps its state.
+
+    A removed group's row is taken by the last group, a new group is appended.
+    """
+    reordered = False
+    for base_name in base_names:
+        if base_name is None:
+            continue
+        group = LOD_GROUP_INDEX.get(base_name)
+        row = LOD_GROUP_ROWS.get(base_name)
+        if group is None or not group['lods']:
+            if row is not None:
+                remove_group_row(row)
+                reordered = True
+        elif row is None:
+            append_group_row(group)
+            reordered = True
+        else:
+            update_group_row(row, group)
+    if reordered:
+        # Pending group indices and the decoded schedule refer to the old order
+        cancel_lod_apply()
+        invalidate_lod_schedule()
+    GROUP_BROWSER["groups_version"] += 1
+    scene = bpy.data.scenes.get(LOD_SCAN_STATE["scene"])
+    if scene is None:
+        return
+    stored = scene.get(GROUP_INDEX_KEY)
+    stored_groups = stored.get("groups") if stored is not None else None
+    if stored_groups is None:
+        store_group_index(scene)
+        return
+    for base_name in base_names:
+        if base_name is not None:
+            store_group_entry(stored_groups, base_name)
+
+def append_group_row(group):
+    row = len(LOD_GROUPS_CACHE)
+    LOD_GROUPS_CACHE.append(group)
+    LOD_GROUP_ROWS[group['base_name']] = row
+    LOD_ENGINE.append_group(group['max_index'])
+    if LOD_APPLY_STATE["proxy"] is not None and len(LOD_APPLY_STATE["proxy"]) == row:
+        LOD_APPLY_STATE["proxy"] = np.append(LOD_APPLY_STATE["proxy"], False)
+    if STATS_TABLE["valid"] and len(STATS_TABLE["values"]) == row:
+        # Filled by patch_stats_row
+        for key in ("values", "levels", "uids"):
+            table = STATS_TABLE[key]
+            STATS_TABLE[key] = np.concatenate((table, np.zeros((1,) + table.shape[1:], dtype=table.dtype)))
+    update_group_row(row, group)
+
+def remove_group_row(row):
+    """Swap remove: the last group takes the removed group's row."""
+    last = len(LOD_GROUPS_CACHE) - 1
+    removed = LOD_GROUPS_CACHE[row]
+    moved = LOD_GROUPS_CACHE[last]
+    del LOD_GROUP_ROWS[removed['base_name']]
+    if LOD_BASE_INDEX.get(removed.get('base_uid')) == row:
+        del LOD_BASE_INDEX[removed['base_uid']]
+    LOD_GROUPS_CACHE[row] = moved
+    LOD_GROUPS_CACHE.pop()
+    LOD_ENGINE.remove_group(row)
+    proxy = LOD_APPLY_STATE["proxy"]
+    if proxy is not None and len(proxy) == last + 1:
+        proxy[row] = proxy[last]
+        LOD_APPLY_STATE["proxy"] = proxy[:last]
+    if STATS_TABLE["valid"] and len(STATS_TABLE["values"]) == last + 1:
+        for key in ("values", "levels", "uids"):
+            STATS_TABLE[key][row] = STATS_TABLE[key][last]
+            STATS_TABLE[key] = STATS_TABLE[key][:last]
+    dirty = LOD_DIRTY_POSITIONS["groups"]
+    dirty.discard(row)
+    if last in dirty:
+        dirty.discard(last)
+        dirty.add(row)
+    if row != last:
+        LOD_GROUP_ROWS[moved['base_name']] = row
+        LOD_BASE_INDEX[moved['base_uid']] = row
+
+def update_group_row(row, group):
+    """Re-read one group after LODs were added to or removed from it."""
+    previous = LOD_GROUPS_CACHE[row]
+    if LOD_BASE_INDEX.get(previous.get('base_uid')) == row:
+        del LOD_BASE_INDEX[previous['base_uid']]
+    # A group emptied and re-created in the same pass is a new dict
+    LOD_GROUPS_CACHE[row] = group
+    group['base_uid'] = group['lods'][0][1]
+    LOD_BASE_INDEX[group['base_uid']] = row
+    LOD_ENGINE.set_max_index(row, group['max_index'])
+    mark_positions_dirty(row)
+    patch_stats_row(row)
+
+def store_group_index(scene):
+    """Store the whole group index in the scene."""
+    groups = {}
+    for name, (base_name, lod_num, uid) in LOD_OBJECT_BASES.items():
+        entry = groups.setdefault(base_name, {"names": [], "levels": []})
+        entry["names"].append(name)
+        entry["levels"].append(lod_num)
+    scene[GROUP_INDEX_KEY] = {"groups": groups}
+
+def store_group_entry(stored_groups, base_name):
+    """Store one group of the index (or drop it if the group is gone)."""
+    group = LOD_GROUP_INDEX.get(base_name)
+    objects = [(resolve(uid), lod_num) for lod_num, uid in group['lods']] if group is not None else []
+    objects = [(obj.name, lod_num) for obj, lod_num in objects if obj is not None]
+    if objects:
+        stored_groups[base_name] = {"names": [name for name, _ in objects], "levels": [lvl for _, lvl in objects]}
+    elif base_name in stored_groups:
+        del stored_groups[base_name]
+
+def load_group_index(scene):
+    """Rebuild the group index from the copy stored in the scene, in one pass over its objects.
+
+    Stored objects that no longer exist are dropped; only names that are
+    not in the stored index are matched against LOD_PATTERN. Returns
+    False if the scene has no stored index.
+    """
+    stored = scene.get(GROUP_INDEX_KEY)
+    stored_groups = stored.get("groups") if stored is not None else None
+    if stored_groups is None:
+        return False
+    entries = [(base_name, list(entry.get("names", ())), list(entry.get("levels", ())))
+               for base_name, entry in stored_groups.items()]
+    if any(len(names) != len(levels) for _, names, levels in entries):
+        return False
+    LOD_GROUP_INDEX.clear()
+    LOD_OBJECT_BASES.clear()
+    reset_lod_shadow_state()
+    refresh_object_map(scene)
+    objects = scene.objects
+    stored_names = set()
+    for base_name, names, levels in entries:
+        stored_names.update(names)
+        for name, lod_num in zip(names, levels):
+            obj = objects.get(name)
+            if obj is None:
+                continue
+            uid = obj.session_uid
+            group = LOD_GROUP_INDEX.setdefault(base_name, {"base_name": base_name, "lods": [], "max_index": -1})
+            group['lods'].append((lod_num, uid))
+            LOD_OBJECT_BASES[name] = (base_name, lod_num, uid)
+            if DISPLAY_TYPE_KEY in obj:
+                LOD_PROXY_UIDS.add(uid)
+    for group in LOD_GROUP_INDEX.values():
+        group['lods'].sort(key=lambda x: x[0])
+        group['max_index'] = len(group['lods']) - 1
+    # Objects added while the add-on was not running
+    current = set(objects.keys())
+    added = 0
+    for name in current - stored_names:
+        if LOD_PATTERN.match(name) and add_lod_object(objects[name]) is not None:
+            added += 1
+    LOD_SCAN_STATE.update(scene=scene.name, names=current, data_count=len(bpy.data.objects))
+    invalidate_gn_instancers()
+    publish_group_index(store=added > 0 or len(LOD_OBJECT_BASES) != len(stored_names))
+    print(f"LOD groups loaded for '{scene.name}': {len(LOD_GROUPS_CACHE)} groups, {added} new LOD objects")
+    return True
+
+def ensure_group_index(scene):
+    """Switch the group index to this scene if it tracks another one (or none, after a file load)."""
+    if LOD_SCAN_STATE["scene"] != scene.name and load_group_index(scene):
+        sync_lod_levels(scene.lod_tool_props)
+
+def get_index_levels():
+    return sorted({lod_num for group in LOD_GROUP_INDEX.values() for lod_num, _ in group['lods']})
+
+def sync_lod_levels(props):
+    """Add/remove LOD level entries after incremental changes, keeping user colors, selection and thresholds."""
+    levels = get_index_levels()
+    props.has_lod_objects = bool(levels)
+    if [item.name for item in props.lod_list] == [f"LOD{lvl}" for lvl in levels]:
+        return False
+    selected = {item.name for item in props.lod_list if item.selected}
+    colors = {item.name: tuple(color.color) for item, color in zip(props.lod_list, props.lod_colors)}
+    old_thresholds = [(t.value, t.pixels, t.hysteresis) for t in props.thresholds]
+    props.lod_list.clear()
+    props.lod_colors.clear()
+    props.thresholds.clear()
+    for lvl in levels:
+        name = f"LOD{lvl}"
+        item = props.lod_list.add()
+        item.name = name
+        item.selected = name in selected
+        props.lod_colors.add().color = colors.get(name) or generate_distinct_color(lvl, len(levels))
+    if props.lod_list and not selected & {item.name for item in props.lod_list}:
+        props.lod_list[0].selected = True
+    props.lod_active_index = min(max(props.lod_active_index, 0), len(props.lod_list) - 1)
+    num_thresholds_needed = max(len(levels) - 1, 0)
+    for i in range(num_thresholds_needed):
+        item = props.thresholds.add()
+        if i < len(old_thresholds):
+            item.value, item.pixels, item.hysteresis = old_thresholds[i]
+        else:
+            item.value = (i + 1) * 100.0 / num_thresholds_needed
+            item.pixels = default_threshold_pixels(i)
+    return True
+
+def default_threshold_pixels(index):
+    # 256 px for LOD1, halved for each further level
+    return 256.0 / (2 ** index)
+
+def refresh_lod_groups(scene):
+    """Full rescan of the scene: rebuild the group index, LOD levels and default thresholds."""
+    props = scene.lod_tool_props
+    props.lod_list.clear()
+    props.lod_colors.clear()
+    props.thresholds.clear()
+    props.has_lod_objects = False
+    # Reset the cached groups
+    LOD_GROUP_INDEX.clear()
+    LOD_OBJECT_BASES.clear()
+    reset_lod_shadow_state()
+    refresh_object_map(scene)
+    # Identify all LOD objects and group by base object name
+    for obj in scene.objects:
+        add_lod_object(obj)
+    LOD_SCAN_STATE.update(scene=scene.name, names=set(scene.objects.keys()), data_count=len(bpy.data.objects))
+    invalidate_gn_instancers()
+    sorted_lod_levels = get_index_levels()
+    print(f"Found LOD levels: {sorted_lod_levels}")
+    if sorted_lod_levels:
+        props.has_lod_objects = True
+        for lod in sorted_lod_levels:
+            props.lod_list.add().name = f"LOD{lod}"
+            props.lod_colors.add().color = generate_distinct_color(lod, len(sorted_lod_levels))
+        if props.lod_list:
+            props.lod_list[0].selected = True
+            props.lod_active_index = 0
+        # Create default thresholds (evenly spaced percentages)
+        num_thresholds_needed = len(sorted_lod_levels) - 1
+        for i in range(num_thresholds_needed):
+            item = props.thresholds.add()
+            item.value = (i + 1) * 100.0 / num_thresholds_needed
+            item.pixels = default_threshold_pixels(i)
+        print(f"Initialized {len(props.thresholds)} thresholds.")
+    publish_group_index()
+    if props.has_lod_objects and props.use_lod_collections:
+        organize_lod_collections(scene)
+    if props.has_lod_objects:
+        # Immediately update LOD selection to apply current settings
+        update_lod_selection(scene)
+    else:
+        POLYCOUNT_STATS.update(mode="", levels=[], visible=None)
+
+def reconcile_lod_groups(scene):
+    """Apply object additions, removals and renames since the last scan to the group index.
+
+    Only names that appeared or disappeared are matched against LOD_PATTERN.
+    Returns True if any group changed.
+    """
+    names = set(scene.objects.keys())
+    known = LOD_SCAN_STATE["names"]
+    added = names - known
+    removed = known - names
+    LOD_SCAN_STATE.update(names=names, data_count=len(bpy.data.objects))
+    touched = set()
+    if removed:
+        # Deleted objects leave the handle map as well
+        invalidate_object_map()
+    for name in removed:
+        touched.add(remove_lod_object(name))
+    collections = get_lod_collections(scene) if scene.lod_tool_props.use_lod_collections else None
+    scene_collections = get_scene_collections(scene) if collections is not None and added else None
+    for name in added:
+        if LOD_PATTERN.match(name):
+            obj = bpy.data.objects.get(name)
+            base_name = add_lod_object(obj) if obj is not None else None
+            if base_name is not None:
+                touched.add(base_name)
+                if collections is not None:
+                    move_to_lod_collection(scene, obj, LOD_OBJECT_BASES[obj.name][1], collections, scene_collections)
+    if added or removed:
+        invalidate_gn_instancers()
+    touched.discard(None)
+    if touched:
+        print(f"LOD groups updated: +{len(added)} / -{len(removed)} objects")
+        patch_group_index(touched)
+        sync_lod_levels(scene.lod_tool_props)
+    return bool(touched)
+
+def on_object_renamed(*args):
+    # msgbus notification: some object was renamed
+    scene = bpy.context.scene
+    if scene and LOD_SCAN_STATE["scene"] == scene.name:
+        LOD_UPDATE_STATE["reconcile"] = True
+        schedule_lod_update(scene)
+
+def on_view_layer_changed(*args):
+    # msgbus notification: the window switched to another view layer
+    scene = bpy.context.scene
+    if scene is None:
+        return
+    props = scene.lod_tool_props
+    if props.auto_lod_enabled and props.camera and multi_camera_enabled(props):
+        request_view_switch(scene)
+
+def subscribe_notifications():
+    bpy.msgbus.clear_by_owner(LOD_MSGBUS_OWNER)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Object, "name"),
+        owner=LOD_MSGBUS_OWNER,
+        args=(),
+        notify=on_object_renamed,
+        options={'PERSISTENT'},
+    )
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Window, "view_layer"),
+        owner=LOD_MSGBUS_OWNER,
+        args=(),
+        notify=on_view_layer_changed,
+        options={'PERSISTENT'},
+    )
+
+def get_lod_root(scene, create=False):
+    """Managed parent collection of the LOD level collections, or None."""
+    for coll in scene.collection.children:
+        if coll.get("lod_manager_root"):
+            return coll
+    if not create:
+        return None
+    root = bpy.data.collections.new(LOD_COLLECTION_ROOT)
+    root["lod_manager_root"] = True
+    scene.collection.children.link(root)
+    return root
+
+def get_lod_collections(scene):
+    """LOD level -> managed collection."""
+    root = get_lod_root(scene)
+    if root is None:
+        return {}
+    return {coll["lod_level"]: coll for coll in root.children if "lod_level" in coll}
+
+def get_scene_collections(scene):
+    return {scene.collection, *scene.collection.children_recursive}
+
+def move_to_lod_collection(scene, obj, lod_num, collections, scene_collections):
+    """Move a LOD object into the collection of its level, remembering where it came from.
+
+    scene_collections is get_scene_collections(scene), computed once by the caller.
+    """
+    target = collections.get(lod_num)
+    if target is None:
+        target = collections[lod_num] = bpy.data.collections.new(f"LOD{lod_num}")
+        target["lod_level"] = lod_num
+        get_lod_root(scene, create=True).children.link(target)
+        scene_collections.add(target)
+    users = list(obj.users_collection)
+    if users == [target]:
+        return False
+    if "lod_original_collections" not in obj:
+        obj["lod_original_collections"] = ["" if coll == scene.collection else coll.name
+                                           for coll in users if coll in scene_collections]
+    for coll in users:
+        if coll != target and coll in scene_collections:
+            coll.objects.unlink(obj)
+    if target not in users:
+        target.objects.link(obj)
+    # Visibility is switched per collection from now on
+    write_object_state(obj, hide_render=False, hide_viewport=False)
+    return True
+
+def organize_lod_collections(scene):
+    """Move every LOD object into one managed collection per LOD level."""
+    get_lod_root(scene, create=True)
+    collections = get_lod_collections(scene)
+    scene_collections = get_scene_collections(scene)
+    moved = 0
+    for group in LOD_GROUPS_CACHE:
+        for lod_num, uid in group['lods']:
+            lod_obj = resolve(uid)
+            if lod_obj and move_to_lod_collection(scene, lod_obj, lod_num, collections, scene_collections):
+                moved += 1
+    LOD_COLLECTION_STATE["colors"] = None
+    print(f"LOD collections: {moved} objects moved into {len(collections)} level collections")
+    return moved
+
+def restore_lod_collections(scene):
+    """Move objects back to their original collections and remove the managed collections."""
+    root = get_lod_root(scene)
+    if root is None:
+        return
+    for coll in list(root.children):
+        for obj in list(coll.objects):
+            names = obj.get("lod_original_collections") or []
+            targets = [scene.collection if name == "" else bpy.data.collections.get(name) for name in names]
+            for target in [t for t in targets if t is not None] or [scene.collection]:
+                if target not in obj.users_collection:
+                    target.objects.link(obj)
+            coll.objects.unlink(obj)
+            if "lod_original_collections" in obj:
+                del obj["lod_original_collections"]
+        bpy.data.collections.remove(coll)
+    bpy.data.collections.remove(root)
+    invalidate_object_map()
+
+def set_lod_collections_visible(collections, visible_levels=None):
+    """Show/hide the level collections (None shows all). O(levels) writes instead of O(objects)."""
+    writes = 0
+    for lvl, coll in collections.items():
+        hidden = visible_levels is not None and lvl not in visible_levels
+        if coll.hide_render != hidden:
+            coll.hide_render = hidden
+            writes += 1
+        if coll.hide_viewport != hidden:
+            coll.hide_viewport = hidden
+            writes += 1
+    return writes
+
+def update_lod_collection_mode(props, context):
+    # Toggle of use_lod_collections
+    scene = context.scene
+    ensure_object_map(scene)
+    if props.use_lod_collections:
+        organize_lod_collections(scene)
+    else:
+        restore_lod_collections(scene)
+        # Objects are back in their collections: re-check every object
+        reset_lod_shadow_state()
+    LOD_COLLECTION_STATE["objects_clean"] = False
+    update_lod_selection(scene)
+
+def build_gn_lod_tree(levels):
+    """Geometry Nodes group instancing one of `levels` LOD objects per point by camera distance.
+
+    The LOD index is the number of Threshold inputs the point's distance
+    to the camera has passed, so switching runs inside the node tree.
+    """
+    name = f"{GN_INSTANCER_NAME} ({levels} LODs)"
+    tree = bpy.data.node_groups.get(name)
+    if tree is not None and tree.get("lod_manager_levels") == levels:
+        return tree
+    tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    tree["lod_manager_levels"] = levels
+    interface = tree.interface
+    interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket("Points", in_out='INPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket("Camera", in_out='INPUT', socket_type='NodeSocketObject')
+    for i in range(levels):
+        interface.new_socket(f"LOD{i}", in_out='INPUT', socket_type='NodeSocketObject')
+    for i in range(1, levels):
+        socket = interface.new_socket(f"Threshold {i}", in_out='INPUT', socket_type='NodeSocketFloat')
+        socket.subtype = 'DISTANCE'
+        socket.min_value = 0.0
+    nodes, links = tree.nodes, tree.links
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    # Camera location in the instancer's local space, like the point positions
+    camera_info = nodes.new('GeometryNodeObjectInfo')
+    camera_info.transform_space = 'RELATIVE'
+    links.new(group_in.outputs["Camera"], camera_info.inputs["Object"])
+    position = nodes.new('GeometryNodeInputPosition')
+    distance = nodes.new('ShaderNodeVectorMath')
+    distance.operation = 'DISTANCE'
+    links.new(position.outputs["Position"], distance.inputs[0])
+    links.new(camera_info.outputs["Location"], distance.inputs[1])
+    # LOD index = number of thresholds passed
+    index_socket = None
+    for i in range(1, levels):
+        compare = nodes.new('FunctionNodeCompare')
+        compare.data_type = 'FLOAT'
+        compare.operation = 'GREATER_EQUAL'
+        links.new(distance.outputs["Value"], compare.inputs[0])
+        links.new(group_in.outputs[f"Threshold {i}"], compare.inputs[1])
+        if index_socket is None:
+            index_socket = compare.outputs["Result"]
+        else:
+            add = nodes.new('ShaderNodeMath')
+            add.operation = 'ADD'
+            links.new(index_socket, add.inputs[0])
+            links.new(compare.outputs["Result"], add.inputs[1])
+            index_socket = add.outputs["Value"]
+    # One instance per LOD, joined in LOD order
+    join = nodes.new('GeometryNodeJoinGeometry')
+    for i in range(levels):
+        lod_info = nodes.new('GeometryNodeObjectInfo')
+        lod_info.transform_space = 'ORIGINAL'
+        lod_info.inputs["As Instance"].default_value = True
+        links.new(group_in.outputs[f"LOD{i}"], lod_info.inputs["Object"])
+        links.new(lod_info.outputs["Geometry"], join.inputs["Geometry"])
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    instance.inputs["Pick Instance"].default_value = True
+    links.new(group_in.outputs["Points"], instance.inputs["Points"])
+    links.new(join.outputs["Geometry"], instance.inputs["Instance"])
+    if index_socket is not None:
+        links.new(index_socket, instance.inputs["Instance Index"])
+    links.new(instance.outputs["Instances"], group_out.inputs["Geometry"])
+    return tree
+
+def gn_input_ids(tree):
+    """Input socket name -> modifier property identifier."""
+    return {item.name: item.identifier for item in tree.interface.items_tree
+            if item.item_type == 'SOCKET' and item.in_out == 'INPUT'}
+
+def get_gn_instancers(scene):
+    """(object, modifier) of every LOD instancer in the scene, scanned once until invalidated."""
+    if not (LOD_GN_STATE["valid"] and LOD_GN_STATE["scene"] == scene.name):
+        instancers = []
+        bases = set()
+        for obj in scene.objects:
+            for mod in obj.modifiers:
+                if mod.type == 'NODES' and mod.node_group and "lod_manager_levels" in mod.node_group:
+                    instancers.append((obj.session_uid, mod.name))
+                    # Instancers are not LOD objects, reconcile does not add them to the handle map
+                    LOD_OBJECT_MAP[obj.session_uid] = obj
+                    ids = gn_input_ids(mod.node_group)
+                    prototype = mod.get(ids.get("LOD0", ""))
+                    parsed = parse_lod_name(prototype.name) if isinstance(prototype, bpy.types.Object) else None
+                    if parsed:
+                        bases.add(parsed[0])
+        LOD_GN_STATE.update(scene=scene.name, valid=True, instancers=instancers, bases=bases)
+    result = []
+    for uid, mod_name in LOD_GN_STATE["instancers"]:
+        obj = resolve(uid)
+        mod = obj.modifiers.get(mod_name) if obj else None
+        if mod is not None and mod.node_group:
+            result.append((obj, mod))
+    return result
+
+def invalidate_gn_instancers():
+    LOD_GN_STATE["valid"] = False
+
+def sync_gn_instancers(scene):
+    """Push the camera and absolute distance thresholds to the instancers. Returns instancers updated."""
+    instancers = get_gn_instancers(scene)
+    props = scene.lod_tool_props
+    if not instancers or not props.camera:
+        return 0
+    if props.lod_metric == 'DISTANCE' and props.use_dynamic_base and LOD_ENGINE.base_distance > 0.0:
+        base_distance = LOD_ENGINE.base_distance
+    else:
+        base_distance = props.base_distance
+    values = {"Camera": props.camera}
+    for i, value in enumerate(sorted(t.value for t in props.thresholds)):
+        values[f"Threshold {i + 1}"] = value / 100.0 * base_distance
+    updated = 0
+    for obj, mod in instancers:
+        ids = gn_input_ids(mod.node_group)
+        changed = False
+        for name, value in values.items():
+            key = ids.get(name)
+            if key is not None and mod.get(key) != value:
+                mod[key] = value
+                changed = True
+        if changed:
+            obj.update_tag()
+            LOD_WRITTEN_UIDS.add(obj.session_uid)
+            updated += 1
+    return updated
+
+def rebuild_lod_engine():
+    """Reallocate LOD_ENGINE arrays and the base name index for LOD_GROUPS_CACHE."""
+    LOD_ENGINE.rebuild([group['max_index'] for group in LOD_GROUPS_CACHE])
+    # Pending group indices refer to the old order
+    cancel_lod_apply()
+    # Schedule is decoded in group order
+    invalidate_lod_schedule()
+    STATS_TABLE["valid"] = False
+    LOD_BASE_INDEX.clear()
+    for i, group in enumerate(LOD_GROUPS_CACHE):
+        group['base_uid'] = group['lods'][0][1]
+        LOD_BASE_INDEX[group['base_uid']] = i
+    # Positions and bounds were reset to zero
+    mark_positions_dirty()
+
+def mark_positions_dirty(group_index=None):
+    """Request re-reading one group's base position, or all of them."""
+    if group_index is None:
+        LOD_DIRTY_POSITIONS["all"] = True
+    else:
+        LOD_DIRTY_POSITIONS["groups"].add(group_index)
+
+def sync_lod_engine():
+    """Match LOD_ENGINE to LOD_GROUPS_CACHE and refresh dirty base positions."""
+    if len(LOD_ENGINE) != len(LOD_GROUPS_CACHE):
+        rebuild_lod_engine()
+        LOD_DIRTY_POSITIONS["all"] = True
+    if LOD_DIRTY_POSITIONS["all"]:
+        dirty = range(len(LOD_GROUPS_CACHE))
+    else:
+        dirty = [i for i in LOD_DIRTY_POSITIONS["groups"] if i < len(LOD_GROUPS_CACHE)]
+    if len(dirty) > BULK_POSITIONS_MIN:
+        # Every frame of playback without a schedule: one foreach_get per property, no per-group loop
+        rows = np.asarray(dirty, dtype=np.int64)
+        uids, matrices, bound_boxes = read_object_transforms()
+        found_rows, found = lookup_uids(uids, get_base_uids()[rows])
+        LOD_ENGINE.set_transforms(rows[found], matrices[found_rows[found]], bound_boxes[found_rows[found]])
+    else:
+        for i in dirty:
+            base_obj = resolve(LOD_GROUPS_CACHE[i]['lods'][0][1])
+            if base_obj:
+                LOD_ENGINE.set_position(i, base_obj.matrix_world.translation)
+                LOD_ENGINE.set_bounds(i, base_obj.matrix_world, base_obj.bound_box)
+    LOD_DIRTY_POSITIONS["all"] = False
+    LOD_DIRTY_POSITIONS["groups"].clear()
+
+def get_base_uids():
+    """Base object session_uids of LOD_GROUPS_CACHE as an array, rebuilt when the groups change."""
+    if LOD_BASE_UIDS["version"] != GROUP_BROWSER["groups_version"] or len(LOD_BASE_UIDS["uids"]) != len(LOD_GROUPS_CACHE):
+        uids = np.fromiter((group['lods'][0][1] for group in LOD_GROUPS_CACHE), dtype=np.int64,
+                           count=len(LOD_GROUPS_CACHE))
+        LOD_BASE_UIDS.update(version=GROUP_BROWSER["groups_version"], uids=uids)
+    return LOD_BASE_UIDS["uids"]
+
+def read_object_transforms():
+    """session_uids, world matrices ((n, 4, 4), row-major like mathutils) and local bound boxes
+    ((n, 8, 3)) of every object, read with one foreach_get each.
+    """
+    objects = bpy.data.objects
+    count = len(objects)
+    uids = np.empty(count, dtype=np.int32)
+    corners = np.empty(count * 24, dtype=np.float32)
+    matrices = np.empty(count * 16, dtype=np.float32)
+    objects.foreach_get("session_uid", uids)
+    objects.foreach_get("bound_box", corners)
+    objects.foreach_get("matrix_world", matrices)
+    # matrix_world is read column-major
+    return uids, matrices.reshape(count, 4, 4).transpose(0, 2, 1), corners.reshape(count, 8, 3)
+
+def lookup_uids(uids, wanted):
+    """(rows into uids, found mask) for an array of session_uids (-1 = no object)."""
+    count = len(uids)
+    if not count:
+        return np.zeros(wanted.shape, dtype=np.int64), np.zeros(wanted.shape, dtype=bool)
+    order = np.argsort(uids)
+    rows = order[np.clip(np.searchsorted(uids, wanted, sorter=order), 0, count - 1)]
+    return rows, (wanted >= 0) & (uids[rows] == wanted)
+
+def get_camera_projection(scene, camera_obj):
+    """(focal_pixels, ortho_pixels_per_unit) of a camera for the scene render resolution; one of them is None."""
+    cam = camera_obj.data
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    res_x = render.resolution_x * scale
+    res_y = render.resolution_y * scale
+    # Field of view / ortho scale spans the sensor fit dimension
+    if cam.sensor_fit == 'HORIZONTAL':
+        fit = res_x
+    elif cam.sensor_fit == 'VERTICAL':
+        fit = res_y
+    else:
+        fit = max(res_x, res_y)
+    if cam.type == 'ORTHO':
+        return None, fit / max(cam.ortho_scale, 1e-6)
+    return (fit / 2.0) / math.tan(cam.angle / 2.0), None
+
+def read_mesh_stats(mesh):
+    """Polygon, triangle and vertex count of a mesh, read in bulk."""
+    polys = len(mesh.polygons)
+    loop_totals = np.empty(polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    tris = int(loop_totals.sum()) - 2 * polys
+    return (polys, tris, len(mesh.vertices))
+
+def get_object_stats(obj, depsgraph=None):
+    """Base and evaluated (after modifiers) statistics of an object, from the caches when possible."""
+    if obj.type != 'MESH' or not obj.data:
+        return (0,) * len(STAT_FIELDS)
+    mesh = obj.data
+    base = MESH_STATS_CACHE.get(mesh.session_uid)
+    if base is None:
+        base = MESH_STATS_CACHE[mesh.session_uid] = read_mesh_stats(mesh)
+    if not obj.modifiers:
+        return base + base
+    evaluated = EVAL_STATS_CACHE.get(obj.session_uid)
+    if evaluated is None:
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        evaluated = EVAL_STATS_CACHE[obj.session_uid] = read_mesh_stats(obj.evaluated_get(depsgraph).data)
+    return base + evaluated
+
+def invalidate_geometry_stats(id_data):
+    """Drop cached statistics after a geometry update. Returns True if LOD statistics are affected."""
+    uid = id_data.session_uid
+    if isinstance(id_data, bpy.types.Mesh):
+        affected = MESH_STATS_CACHE.pop(uid, None) is not None
+    elif isinstance(id_data, bpy.types.Object):
+        affected = EVAL_STATS_CACHE.pop(uid, None) is not None or uid in STATS_TABLE["object_uids"]
+    else:
+        return False
+    if affected:
+        STATS_TABLE["valid"] = False
+    return affected
+
+def reset_geometry_stats():
+    MESH_STATS_CACHE.clear()
+    EVAL_STATS_CACHE.clear()
+    STATS_TABLE["valid"] = False
+
+def sync_stats_table(scene, depsgraph=None):
+    """Rebuild the per group / per LOD statistics table if it was invalidated."""
+    if STATS_TABLE["valid"] and len(STATS_TABLE["values"]) == len(LOD_GROUPS_CACHE):
+        return STATS_TABLE
+    slots = max((len(group['lods']) for group in LOD_GROUPS_CACHE), default=0)
+    values = np.zeros((len(LOD_GROUPS_CACHE), slots, len(STAT_FIELDS)), dtype=np.int64)
+    levels = np.full((len(LOD_GROUPS_CACHE), slots), -1, dtype=np.int64)
+    uids = np.full((len(LOD_GROUPS_CACHE), slots), -1, dtype=np.int64)
+    object_uids = set()
+    for g, group in enumerate(LOD_GROUPS_CACHE):
+        for i, (lod_num, uid) in enumerate(group['lods']):
+            levels[g, i] = lod_num
+            lod_obj = resolve(uid)
+            if lod_obj:
+                values[g, i] = get_object_stats(lod_obj, depsgraph)
+                uids[g, i] = uid
+                object_uids.add(uid)
+    STATS_TABLE.update(valid=True, values=values, levels=levels, uids=uids, object_uids=object_uids)
+    return STATS_TABLE
+
+def patch_stats_row(row, depsgraph=None):
+    """Re-read one group's row of a valid statistics table (drops the table if the group no longer fits)."""
+    if not STATS_TABLE["valid"] or len(STATS_TABLE["values"]) != len(LOD_GROUPS_CACHE):
+        STATS_TABLE["valid"] = False
+        return
+    group = LOD_GROUPS_CACHE[row]
+    values, levels, uids = STATS_TABLE["values"], STATS_TABLE["levels"], STATS_TABLE["uids"]
+    if len(group['lods']) > levels.shape[1]:
+        STATS_TABLE["valid"] = False
+        return
+    values[row] = 0
+    levels[row] = -1
+    uids[row] = -1
+    for i, (lod_num, uid) in enumerate(group['lods']):
+        levels[row, i] = lod_num
+        lod_obj = resolve(uid)
+        if lod_obj:
+            values[row, i] = get_object_stats(lod_obj, depsgraph)
+            uids[row, i] = uid
+            STATS_TABLE["object_uids"].add(uid)
+
+def budget_tris_table():
+    """(groups, slots) triangles after modifiers for the budget solver.
+
+    LODs whose object is not in the scene cost infinitely many triangles,
+    so they are never picked as the cheapest level.
+    """
+    tris = STATS_TABLE["values"][:, :, STAT_FIELDS.index("eval_tris")].astype(np.float64)
+    tris[(STATS_TABLE["levels"] >= 0) & (STATS_TABLE["uids"] < 0)] = np.inf
+    return tris
+
+def summarize_polycount(mode, visible_mask):
+    """Store per-LOD total/visible statistics for the panel from a (groups, slots) visibility mask."""
+    values = STATS_TABLE["values"]
+    levels = STATS_TABLE["levels"]
+    per_level = []
+    for lvl in np.unique(levels[levels >= 0]).tolist():
+        in_level = levels == lvl
+        per_level.append((
+            lvl,
+            tuple(values[in_level].sum(axis=0).tolist()),
+            tuple(values[in_level & visible_mask].sum(axis=0).tolist()),
+        ))
+    visible = values[visible_mask].sum(axis=0) if values.size else np.zeros(len(STAT_FIELDS), dtype=np.int64)
+    POLYCOUNT_STATS.update(mode=mode, levels=per_level, visible=tuple(visible.tolist()))
+
+def update_group_browser(scene, visible_mask):
+    """Refresh the browser's per group arrays (current level, its triangles, camera distance).
+
+    The group list items are only rebuilt when the groups changed.
+    """
+    props = scene.lod_tool_props
+    if GROUP_BROWSER["items_version"] != GROUP_BROWSER["groups_version"] or len(props.group_items) != len(LOD_GROUPS_CACHE):
+        props.group_items.clear()
+        for group in LOD_GROUPS_CACHE:
+            props.group_items.add().name = group['base_name']
+        GROUP_BROWSER["names"] = np.array([group['base_name'].lower() for group in LOD_GROUPS_CACHE], dtype=str)
+        GROUP_BROWSER["items_version"] = GROUP_BROWSER["groups_version"]
+    levels = STATS_TABLE["levels"]
+    rows = np.arange(len(levels))
+    # First visible slot of each group
+    slot = visible_mask.argmax(axis=1) if visible_mask.size else np.zeros(len(levels), dtype=np.int64)
+    shown = visible_mask.any(axis=1) if visible_mask.size else np.zeros(len(levels), dtype=bool)
+    GROUP_BROWSER["current"] = np.where(shown, levels[rows, slot], -1) if levels.size else np.full(len(levels), -1)
+    tris = STATS_TABLE["values"][:, :, STAT_FIELDS.index("eval_tris")]
+    GROUP_BROWSER["tris"] = np.where(shown, tris[rows, slot], 0) if tris.size else np.zeros(len(levels), dtype=np.int64)
+    if has_lod_eye(props) and len(LOD_ENGINE):
+        sync_lod_engine()
+        GROUP_BROWSER["distance"] = LOD_ENGINE.compute_distances(get_lod_eye(scene)[0])
+    else:
+        GROUP_BROWSER["distance"] = np.zeros(len(levels), dtype=np.float64)
+    GROUP_BROWSER["data_version"] += 1
+
+def read_world_bounds(slot_uids):
+    """World-space bounding boxes (min, max) of the objects in a (groups, slots) session_uid array.
+
+    Bounding boxes, matrices and session_uids of all objects are read with
+    one foreach_get each; slots without an object get an empty box at 0.
+    """
+    uids, matrices, corners = read_object_transforms()
+    matrices = matrices.astype(np.float64)
+    world = corners @ matrices[:, :3, :3].transpose(0, 2, 1) + matrices[:, None, :3, 3]
+    rows, found = lookup_uids(uids, slot_uids)
+    box_min = np.where(found[..., None], world.min(axis=1)[rows] if len(uids) else 0.0, 0.0)
+    box_max = np.where(found[..., None], world.max(axis=1)[rows] if len(uids) else 0.0, 0.0)
+    return box_min, box_max
+
+def validate_lod_chains(scene, depsgraph=None, groups=None):
+    """Check every group's LOD chain (or only the given group indices): level gaps or duplicates,
+    levels that save no triangles, bounds drift.
+
+    Levels, triangles (after modifiers) and object uids come from the
+    statistics table, which is maintained per group as the index changes;
+    bounds from read_world_bounds. Fills VALIDATION_REPORT and returns
+    the number of flagged groups.
+    """
+    props = scene.lod_tool_props
+    ensure_group_index(scene)
+    ensure_object_map(scene)
+    sync_stats_table(scene, depsgraph)
+    if groups is None:
+        groups = np.arange(len(LOD_GROUPS_CACHE))
+    groups = np.asarray(groups, dtype=np.int64)
+    box_min, box_max = read_world_bounds(STATS_TABLE["uids"][groups])
+    issues, ratio, deviation = validate_chains(
+        STATS_TABLE["levels"][groups],
+        STATS_TABLE["values"][groups, :, STAT_FIELDS.index("eval_tris")],
+        box_min,
+        box_max,
+        min_reduction=props.validation_min_reduction / 100.0,
+        bounds_tolerance=props.validation_bounds_tolerance / 100.0,
+    )
+    found = np.flatnonzero(issues)
+    flagged = groups[found]
+    VALIDATION_REPORT.update(
+        version=VALIDATION_REPORT["version"] + 1,
+        groups_version=GROUP_BROWSER["groups_version"],
+        checked=len(groups),
+        settings=(props.validation_min_reduction, props.validation_bounds_tolerance),
+        groups=flagged,
+        names=np.array([LOD_GROUPS_CACHE[g]['base_name'].lower() for g in flagged.tolist()], dtype=str),
+        issues=issues[found],
+        ratio=ratio[found],
+        deviation=deviation[found],
+    )
+    props.validation_items.clear()
+    for g in flagged.tolist():
+        props.validation_items.add().name = LOD_GROUPS_CACHE[g]['base_name']
+    print(f"LOD validation: {len(flagged)} of {len(groups)} groups flagged")
+    return len(flagged)
+
+def issue_names(flags):
+    return [name for flag, name in ISSUE_NAMES.items() if flags & flag]
+
+def validation_report_json():
+    """Last validation as a JSON-ready dict, with the levels and triangles of every flagged group."""
+    values = STATS_TABLE["values"]
+    tris_field = STAT_FIELDS.index("eval_tris")
+    stale = VALIDATION_REPORT["groups_version"] != GROUP_BROWSER["groups_version"]
+    groups = []
+    for row, g in enumerate(VALIDATION_REPORT["groups"].tolist()):
+        entry = {
+            "issues": issue_names(int(VALIDATION_REPORT["issues"][row])),
+            "worst_ratio": float(VALIDATION_REPORT["ratio"][row]),
+            "bounds_deviation": float(VALIDATION_REPORT["deviation"][row]),
+        }
+        if not stale and g < len(LOD_GROUPS_CACHE):
+            group = LOD_GROUPS_CACHE[g]
+            entry["group"] = group['base_name']
+            entry["levels"] = [lod_num for lod_num, _ in group['lods']]
+            entry["tris"] = values[g, :len(group['lods']), tris_field].tolist() if g < len(values) else []
+        groups.append(entry)
+    min_reduction, bounds_tolerance = VALIDATION_REPORT["settings"] or (None, None)
+    return {
+        "checked": VALIDATION_REPORT["checked"],
+        "flagged": len(groups),
+        "min_reduction_percent": min_reduction,
+        "bounds_tolerance_percent": bounds_tolerance,
+        "counts": {name: int(((VALIDATION_REPORT["issues"] & flag) > 0).sum()) for flag, name in ISSUE_NAMES.items()},
+        "groups": groups,
+    }
+
+def write_object_state(obj, hide_render=None, hide_viewport=None, color=None, display_type=None):
+    """Write visibility/color/display type only if it differs from the shadow state. Returns number of RNA writes."""
+    uid = obj.session_uid
+    state = LOD_SHADOW_STATE.get(uid)
+    if state is None:
+        state = LOD_SHADOW_STATE[uid] = [obj.hide_render, obj.hide_viewport, tuple(obj.color), obj.display_type]
+    writes = 0
+    if hide_render is not None and state[0] != hide_render:
+        obj.hide_render = state[0] = hide_render
+        writes += 1
+    if hide_viewport is not None and state[1] != hide_viewport:
+        obj.hide_viewport = state[1] = hide_viewport
+        writes += 1
+    if color is not None and state[2] != color:
+        obj.color = color
+        state[2] = color
+        writes += 1
+    if display_type is not None and state[3] != display_type:
+        obj.display_type = state[3] = display_type
+        writes += 1
+    if writes:
+        LOD_WRITTEN_UIDS.add(uid)
+    return writes
+
+def write_proxy_display(obj, proxy_type):
+    """Draw an object as a proxy (BOUNDS / WIRE) or, with proxy_type None, restore its own display type."""
+    uid = obj.session_uid
+    if proxy_type is None:
+        if uid not in LOD_PROXY_UIDS:
+            return 0
+        LOD_PROXY_UIDS.discard(uid)
+        original = obj.get(DISPLAY_TYPE_KEY)
+        if original is None:
+            return 0
+        del obj[DISPLAY_TYPE_KEY]
+        return write_object_state(obj, display_type=original)
+    if uid not in LOD_PROXY_UIDS:
+        if DISPLAY_TYPE_KEY not in obj:
+            obj[DISPLAY_TYPE_KEY] = obj.display_type
+        LOD_PROXY_UIDS.add(uid)
+    return write_object_state(obj, display_type=proxy_type)
+
+def restore_proxy_displays():
+    """Give every proxied object its own display type back."""
+    writes = 0
+    for uid in list(LOD_PROXY_UIDS):
+        obj = resolve(uid)
+        if obj:
+            writes += write_proxy_display(obj, None)
+        else:
+            LOD_PROXY_UIDS.discard(uid)
+    LOD_APPLY_STATE["proxy"] = None
+    return writes
+
+def get_proxy_groups(scene):
+    """Mask of groups past the proxy display threshold, measured like the LOD metric."""
+    props = scene.lod_tool_props
+    location, focal_pixels, ortho_pixels_per_unit = get_lod_eye(scene)
+    if props.lod_metric == 'DISTANCE':
+        # Percentage of the base distance, like the LOD thresholds
+        base_distance = LOD_ENGINE.base_distance if LOD_ENGINE.base_distance > 0 else props.base_distance
+        return LOD_ENGINE.compute_distances(location) > base_distance * props.proxy_distance / 100.0
+    return LOD_ENGINE.compute_coverage(location, focal_pixels, ortho_pixels_per_unit) < props.proxy_pixels
+
+def reset_lod_shadow_state():
+    """Forget last applied state so the next update re-checks every object."""
+    LOD_SHADOW_STATE.clear()
+    LOD_APPLY_STATE["signature"] = None
+    LOD_APPLY_STATE["object_count"] = -1
+    LOD_APPLY_STATE["proxy"] = None
+    LOD_ENGINE.invalidate_applied()
+
+def get_color_map(props):
+    """LOD level -> color tuple (empty when coloring is disabled)."""
+    color_map = {}
+    if props.enable_color:
+        for idx, item in enumerate(props.lod_list):
+            try:
+                lvl = int(item.name[3:])
+                color_map[lvl] = tuple(props.lod_colors[idx].color)
+            except:
+                continue
+    return color_map
+
+def get_lod_schedule(scene):
+    """Baked schedule of the scene in LOD_GROUPS_CACHE order, or None if missing or out of date."""
+    if LOD_SCHEDULE_CACHE["valid"] and LOD_SCHEDULE_CACHE["scene"] == scene.name:
+        return LOD_SCHEDULE_CACHE["schedule"]
+    schedule = None
+    data = scene.get("lod_schedule")
+    if data is not None:
+        groups = data["groups"]
+        runs = [groups.get(group['base_name']) for group in LOD_GROUPS_CACHE]
+        if all(run is not None for run in runs):
+            schedule = LODSchedule(data["frame_start"], data["frame_end"], [run.to_list() for run in runs])
+        else:
+            print("LOD schedule does not match the current LOD groups, evaluating live.")
+    LOD_SCHEDULE_CACHE.update(scene=scene.name, valid=True, schedule=schedule)
+    return schedule
+
+def invalidate_lod_schedule():
+    LOD_SCHEDULE_CACHE["valid"] = False
+    LOD_SCHEDULE_CACHE["schedule"] = None
+
+def active_lod_schedule(scene):
+    """Schedule to use for the current frame (auto LOD with a baked schedule covering it), or None."""
+    props = scene.lod_tool_props
+    if not props.use_lod_schedule or multi_camera_enabled(props) or viewport_eye_active(props):
+        # The schedule is baked for the main camera only
+        return None
+    schedule = get_lod_schedule(scene)
+    if schedule is None or not schedule.covers(scene.frame_current):
+        return None
+    return schedule
+
+def bake_lod_schedule(scene):
+    """Evaluate auto LOD on every frame of the scene range and store it run-length encoded in the scene.
+
+    Animation is only evaluated through frame_set, so frames are stepped
+    once here; each frame is one batched engine pass.
+    """
+    props = scene.lod_tool_props
+    ensure_object_map(scene)
+    frame_start, frame_end = scene.frame_start, scene.frame_end
+    frame_current = scene.frame_current
+    table = np.zeros((frame_end - frame_start + 1, len(LOD_GROUPS_CACHE)), dtype=np.int64)
+    # Hysteresis and dwell follow the camera path from the first frame
+    LOD_ENGINE.reset_state()
+    # Handlers stay idle while stepping frames
+    LOD_UPDATE_STATE["applying"] = True
+    try:
+        for row, frame in enumerate(range(frame_start, frame_end + 1)):
+            scene.frame_set(frame)
+            mark_positions_dirty()
+            # The schedule is for renders: always the camera, even with Follow Viewport
+            table[row] = evaluate_auto_lods(scene, use_camera=True)
+    finally:
+        scene.frame_set(frame_current)
+        LOD_UPDATE_STATE["applying"] = False
+    runs = encode_schedule(frame_start, table)
+    scene["lod_schedule"] = {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "groups": {group['base_name']: run for group, run in zip(LOD_GROUPS_CACHE, runs)},
+    }
+    invalidate_lod_schedule()
+    LOD_ENGINE.reset_state()
+    mark_positions_dirty()
+    print(f"LOD schedule baked: frames {frame_start}-{frame_end}, {len(runs)} groups, {sum(len(run) for run in runs) // 2} runs")
+    return len(runs)
+
+def multi_camera_enabled(props):
+    return props.use_multi_camera and any(item.camera for item in props.view_cameras)
+
+def get_lod_views(scene):
+    """(key, camera) of every auto LOD view: the main camera, then the extra cameras / view layers."""
+    props = scene.lod_tool_props
+    views = {("", props.camera.session_uid): props.camera}
+    for item in props.view_cameras:
+        if item.camera:
+            views.setdefault((item.view_layer, item.camera.session_uid), item.camera)
+    return list(views.items())
+
+def get_view_layer_name(depsgraph=None):
+    if depsgraph is not None:
+        return depsgraph.view_layer.name
+    view_layer = bpy.context.view_layer
+    return view_layer.name if view_layer else ""
+
+def active_view_key(scene, depsgraph=None):
+    """Key of the view matching the active view layer, else the scene camera, else the main camera."""
+    props = scene.lod_tool_props
+    view_layer = get_view_layer_name(depsgraph)
+    for item in props.view_cameras:
+        if item.camera and item.view_layer and item.view_layer == view_layer:
+            return (item.view_layer, item.camera.session_uid)
+    for item in props.view_cameras:
+        if item.camera and not item.view_layer and item.camera == scene.camera:
+            return ("", item.camera.session_uid)
+    return ("", props.camera.session_uid)
+
+def evaluate_view_lods(scene, depsgraph=None):
+    """Evaluate every view in one batch and return the LOD indices of the active view."""
+    props = scene.lod_tool_props
+    views = get_lod_views(scene)
+    keys = [key for key, _ in views]
+    camera_locs = [camera.matrix_world.translation for _, camera in views]
+    sync_lod_engine()
+    raw = None
+    if props.lod_metric == 'DISTANCE':
+        # All groups against all cameras as one matrix
+        metrics = LOD_ENGINE.view_distances(camera_locs)
+        percents = np.array([t.value for t in props.thresholds], dtype=np.float64)
+        order = np.argsort(percents, kind='stable')
+        if props.use_dynamic_base:
+            farthest = metrics.max(axis=1) if metrics.shape[1] else np.zeros(len(views))
+            base = np.where(farthest > 0.0, np.maximum(farthest, 1.0), props.base_distance)
+        else:
+            base = np.full(len(views), props.base_distance)
+        thresholds = percents[order][None, :] / 100.0 * base[:, None]
+        margins = np.array([t.hysteresis for t in props.thresholds])[order][None, :] / 100.0 * base[:, None]
+    else:
+        projections = [get_camera_projection(scene, camera) for _, camera in views]
+        ortho = [focal is None for focal, _ in projections]
+        scales = [ppu if focal is None else focal for focal, ppu in projections]
+        coverage = LOD_ENGINE.view_coverage(camera_locs, scales, ortho)
+        metrics = -coverage
+        if props.lod_metric == 'BUDGET':
+            sync_stats_table(scene, depsgraph)
+            tris = budget_tris_table()
+            raw = np.stack([solve_budget(row, tris, props.triangle_budget, LOD_ENGINE.max_index) for row in coverage])
+            thresholds = margins = np.zeros((len(views), 0))
+        else:
+            pixels = np.array([t.pixels for t in props.thresholds], dtype=np.float64)
+            order = np.argsort(-pixels, kind='stable')
+            thresholds = np.tile(-pixels[order], (len(views), 1))
+            margins = np.tile((np.array([t.hysteresis for t in props.thresholds]) / 100.0 * pixels)[order], (len(views), 1))
+    results = LOD_ENGINE.evaluate_views(keys, metrics, thresholds, margins, raw,
+                                        dwell_frames=props.min_dwell_frames, frame=scene.frame_current)
+    active = active_view_key(scene, depsgraph)
+    LOD_VIEW_STATE["active"] = active
+    lod_indices = LOD_ENGINE.use_lod_indices(results[active])
+    if props.lod_metric == 'BUDGET':
+        LOD_ENGINE.budget_tris, LOD_ENGINE.budget_error = budget_usage(coverage[keys.index(active)], tris, lod_indices)
+    print(f"Multi-camera LOD: {len(views)} views evaluated, applying {active}")
+    return lod_indices.tolist()
+
+def apply_view_lods(scene, depsgraph=None):
+    """LOD indices of the active view; a kept result is reused when only the active view changed."""
+    active = active_view_key(scene, depsgraph)
+    switch_only = LOD_VIEW_STATE["switch_only"]
+    LOD_VIEW_STATE["switch_only"] = False
+    if switch_only and active in LOD_ENGINE.view_results:
+        LOD_VIEW_STATE["active"] = active
+        print(f"Multi-camera LOD: switched to {active}")
+        return LOD_ENGINE.use_lod_indices(LOD_ENGINE.view_results[active]).tolist()
+    return evaluate_view_lods(scene, depsgraph)
+
+def request_view_switch(scene):
+    # Another camera or view layer became active: apply its kept result unless a full update is pending
+    if not bpy.app.timers.is_registered(deferred_lod_update):
+        LOD_VIEW_STATE["switch_only"] = True
+    schedule_lod_update(scene)
+
+def viewport_eye_active(props):
+    """Auto LOD follows the viewport eye (not while rendering, renders use the camera)."""
+    return (props.use_viewport_eye and LOD_VIEWPORT_EYE["valid"] and not bpy.app.background
+            and not LOD_VIEWPORT_EYE["rendering"] and not bpy.app.is_job_running('RENDER'))
+
+def has_lod_eye(props):
+    return props.camera is not None or viewport_eye_active(props)
+
+def get_lod_eye(scene, use_camera=False):
+    """(location, focal_pixels, ortho_pixels_per_unit) auto LOD is measured from: viewport eye or camera."""
+    props = scene.lod_tool_props
+    if not use_camera and viewport_eye_active(props):
+        eye = LOD_VIEWPORT_EYE
+        return eye["location"], eye["focal_pixels"], eye["ortho_pixels_per_unit"]
+    focal_pixels, ortho_pixels_per_unit = get_camera_projection(scene, props.camera)
+    return props.camera.matrix_world.translation, focal_pixels, ortho_pixels_per_unit
+
+def get_view_projection(scene, depsgraph=None):
+    """World to clip space matrix of the auto LOD eye, for the scene render resolution."""
+    props = scene.lod_tool_props
+    if viewport_eye_active(props):
+        return LOD_VIEWPORT_EYE["view_projection"]
+    camera = props.camera
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    projection = camera.calc_matrix_camera(
+        depsgraph or bpy.context.evaluated_depsgraph_get(),
+        x=max(1, int(render.resolution_x * scale)),
+        y=max(1, int(render.resolution_y * scale)),
+        scale_x=render.pixel_aspect_x,
+        scale_y=render.pixel_aspect_y,
+    )
+    return projection @ camera.matrix_world.inverted()
+
+def cull_auto_lods(scene, depsgraph=None):
+    """Hide (or drop to the lowest LOD) groups outside the eye's frustum, in one pass over all groups."""
+    props = scene.lod_tool_props
+    sync_lod_engine()
+    lod_indices = LOD_ENGINE.cull(
+        get_view_projection(scene, depsgraph),
+        margin=props.frustum_margin / 100.0,
+        hide=props.frustum_culling == 'HIDE',
+    ).tolist()
+    print(f"Frustum culling: {LOD_ENGINE.culled_count} of {len(lod_indices)} groups outside the view")
+    return lod_indices
+
+def viewport_eye_draw():
+    # Draw callback of every 3D view region: only compares view matrices, LOD updates run in a timer
+    context = bpy.context
+    scene = context.scene
+    region = context.region
+    region_3d = context.region_data
+    if scene is None or region is None or region_3d is None:
+        return
+    props = scene.lod_tool_props
+    if not props.use_viewport_eye or not props.auto_lod_enabled or not props.has_lod_objects:
+        return
+    window_matrix = region_3d.window_matrix
+    key = (tuple(v for row in region_3d.view_matrix for v in row), window_matrix[1][1], region.height,
+           region_3d.is_perspective)
+    region_key = region_3d.as_pointer()
+    previous = LOD_VIEWPORT_EYE["keys"].get(region_key)
+    LOD_VIEWPORT_EYE["keys"][region_key] = key
+    # Redraws of a view that did not move, and other views, are ignored
+    if previous == key or (previous is None and LOD_VIEWPORT_EYE["valid"]):
+        return
+    # Projection scale: NDC to pixels over the region height
+    pixels = window_matrix[1][1] * region.height / 2.0
+    LOD_VIEWPORT_EYE["pending"] = (
+        region_3d.view_matrix.inverted().translation.copy(),
+        pixels if region_3d.is_perspective else None,
+        None if region_3d.is_perspective else pixels,
+        region_3d.perspective_matrix.copy(),
+    )
+    LOD_VIEWPORT_EYE["scene"] = scene.name
+    if not bpy.app.timers.is_registered(viewport_eye_update):
+        elapsed = time.perf_counter() - LOD_VIEWPORT_EYE["last_update"]
+        delay = max(0.0, 1.0 / props.viewport_rate - elapsed)
+        bpy.app.timers.register(viewport_eye_update, first_interval=delay)
+
+def viewport_eye_update():
+    # Timer callback: at most viewport_rate LOD updates per second while the view moves
+    scene = bpy.data.scenes.get(LOD_VIEWPORT_EYE["scene"])
+    pending = LOD_VIEWPORT_EYE["pending"]
+    if scene is None or pending is None:
+        return None
+    LOD_VIEWPORT_EYE["pending"] = None
+    location, focal_pixels, ortho_pixels_per_unit, view_projection = pending
+    LOD_VIEWPORT_EYE.update(valid=True, location=location, focal_pixels=focal_pixels,
+                            ortho_pixels_per_unit=ortho_pixels_per_unit, view_projection=view_projection,
+                            last_update=time.perf_counter())
+    update_lod_selection(scene, sliced=True)
+    return None
+
+@persistent
+def render_init_handler(scene, *args):
+    # Follow Viewport only writes viewport visibility: apply the camera's result before rendering
+    LOD_VIEWPORT_EYE["rendering"] = True
+    props = scene.lod_tool_props
+    if props.use_viewport_eye and props.auto_lod_enabled and props.has_lod_objects and props.camera:
+        update_lod_selection(scene)
+
+@persistent
+def render_done_handler(scene, *args):
+    LOD_VIEWPORT_EYE["rendering"] = False
+    props = scene.lod_tool_props
+    if props.use_viewport_eye and props.auto_lod_enabled and LOD_VIEWPORT_EYE["valid"]:
+        # Back to the viewport eye once the render job has ended
+        LOD_UPDATE_STATE["scene_name"] = scene.name
+        if not bpy.app.timers.is_registered(deferred_lod_update):
+            bpy.app.timers.register(deferred_lod_update, first_interval=0.1)
+
+def reset_viewport_eye():
+    LOD_VIEWPORT_EYE.update(valid=False, location=None, pending=None, keys={})
+    if bpy.app.timers.is_registered(viewport_eye_update):
+        bpy.app.timers.unregister(viewport_eye_update)
+
+def update_viewport_eye_mode(self, context):
+    # Turning it off switches back to the camera at once
+    reset_viewport_eye()
+    update_lod_selection(context.scene)
+    if context.screen:
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def evaluate_auto_lods(scene, depsgraph=None, use_camera=False):
+    """LOD index of every group in LOD_GROUPS_CACHE for the auto LOD eye, or the camera (no scene writes)."""
+    props = scene.lod_tool_props
+    camera_loc, focal_pixels, ortho_pixels_per_unit = get_lod_eye(scene, use_camera)
+    sync_lod_engine()
+    if props.lod_metric == 'BUDGET':
+        # Greedy error-per-triangle solve over the per-LOD triangle counts (after modifiers)
+        sync_stats_table(scene, depsgraph)
+        lod_indices = LOD_ENGINE.evaluate_budget(
+            camera_loc,
+            budget_tris_table(),
+            props.triangle_budget,
+            focal_pixels=focal_pixels,
+            ortho_pixels_per_unit=ortho_pixels_per_unit,
+            dwell_frames=props.min_dwell_frames,
+            frame=scene.frame_current,
+        ).tolist()
+        print(f"Triangle budget: {LOD_ENGINE.budget_tris} / {props.triangle_budget}, error {LOD_ENGINE.budget_error:.2f} px")
+    elif props.lod_metric == 'SCREEN_SIZE':
+        # Projected bounding sphere size in pixels for all groups in one pass
+        lod_indices = LOD_ENGINE.evaluate_screen_size(
+            camera_loc,
+            [t.pixels for t in props.thresholds],
+            margin_percents=[t.hysteresis for t in props.thresholds],
+            focal_pixels=focal_pixels,
+            ortho_pixels_per_unit=ortho_pixels_per_unit,
+            dwell_frames=props.min_dwell_frames,
+            frame=scene.frame_current,
+        ).tolist()
+        print(f"Screen size thresholds (px): {(-LOD_ENGINE.thresholds).tolist()}")
+    else:
+        # Distances, dynamic base_distance and LOD indices in one batched pass
+        lod_indices = LOD_ENGINE.evaluate(
+            camera_loc,
+            [t.value for t in props.thresholds],
+            props.base_distance,
+            props.use_dynamic_base,
+            margin_percents=[t.hysteresis for t in props.thresholds],
+            dwell_frames=props.min_dwell_frames,
+            frame=scene.frame_current,
+        ).tolist()
+        print(f"Base distance: {LOD_ENGINE.base_distance} units ({'dynamic' if props.use_dynamic_base else 'fixed'})")
+        print(f"Threshold values (absolute): {LOD_ENGINE.thresholds.tolist()}")
+        print(f"LOD pass: {LOD_ENGINE.last_pass}, {LOD_ENGINE.candidate_count} groups evaluated")
+    return lod_indices
+
+def apply_group_lods(groups, settings):
+    """Write visibility and color of the given groups' LOD objects. Returns the number of property writes."""
+    lod_indices, color_map, enable_color, coloring_last, set_render, set_viewport, gn_bases, proxy, proxy_type = settings
+    writes = 0
+    restore = bool(LOD_PROXY_UIDS)
+    for g in groups:
+        group_entry = LOD_GROUPS_CACHE[g]
+        if group_entry['base_name'] in gn_bases:
+            # Switched per instance by the Geometry Nodes instancer
+            continue
+        lod_index = lod_indices[g]
+        for i, (lod_num, uid) in enumerate(group_entry['lods']):
+            lod_obj = resolve(uid)
+            if lod_obj:
+                is_visible = (i == lod_index)
+                # Assign color if enabled
+                if enable_color:
+                    color = color_map.get(lod_num, WHITE)
+                elif coloring_last:
+                    color = WHITE
+                else:
+                    color = None
+                writes += write_object_state(
+                    lod_obj,
+                    hide_render=(not is_visible) if set_render else None,
+                    hide_viewport=(not is_visible) if set_viewport else None,
+                    color=color,
+                )
+                # Far groups: the visible LOD is drawn as a proxy in the viewport only
+                if proxy is not None and is_visible and proxy[g]:
+                    writes += write_proxy_display(lod_obj, proxy_type)
+                elif restore:
+                    writes += write_proxy_display(lod_obj, None)
+        if proxy is not None:
+            LOD_APPLY_STATE["proxy"][g] = proxy[g]
+    return writes
+
+def apply_group_slice(groups, settings, budget_ms):
+    """Apply groups in order until the time budget is used up. Returns (groups done, property writes)."""
+    start = time.perf_counter()
+    done = writes = 0
+    while done < len(groups):
+        chunk = groups[done:done + APPLY_CHUNK]
+        writes += apply_group_lods(chunk, settings)
+        LOD_ENGINE.mark_applied(chunk)
+        done += len(chunk)
+        if (time.perf_counter() - start) * 1000.0 >= budget_ms:
+            break
+    return done, writes
+
+def continue_lod_apply():
+    # Timer callback: next slice of a time-sliced auto pass
+    scene = bpy.data.scenes.get(LOD_APPLY_JOB["scene"])
+    if scene is None or not LOD_APPLY_JOB["groups"] or LOD_SCAN_STATE["scene"] != scene.name:
+        cancel_lod_apply()
+        return None
+    if LOD_UPDATE_STATE["applying"]:
+        return 0.01
+    LOD_UPDATE_STATE["applying"] = True
+    try:
+        ensure_object_map(scene)
+        groups = LOD_APPLY_JOB["groups"]
+        done, writes = apply_group_slice(groups, LOD_APPLY_JOB["settings"], scene.lod_tool_props.slice_budget)
+        LOD_APPLY_JOB["groups"] = groups[done:]
+    finally:
+        LOD_UPDATE_STATE["applying"] = False
+    if LOD_APPLY_JOB["groups"]:
+        return 0.0
+    print("Auto LOD: time-sliced pass complete")
+    LOD_APPLY_JOB.update(scene="", settings=None)
+    return None
+
+def cancel_lod_apply():
+    """Drop the rest of a time-sliced pass; its groups stay unapplied for the next pass."""
+    LOD_APPLY_JOB.update(scene="", groups=[], settings=None)
+    if bpy.app.timers.is_registered(continue_lod_apply):
+        bpy.app.timers.unregister(continue_lod_apply)
+
+def update_lod_selection(scene, depsgraph=None, sliced=False):
+    """Apply LOD visibility for the scene (guarded against re-entrant calls).
+
+    With sliced=True (interactive updates) and time slicing enabled, a
+    large auto pass is applied nearest groups first over several timer
+    ticks; any later pass supersedes the remaining work.
+    """
+    if LOD_UPDATE_STATE["applying"]:
+        return
+    LOD_UPDATE_STATE["applying"] = True
+    try:
+        ensure_group_index(scene)
+        if LOD_UPDATE_STATE["reconcile"] and LOD_SCAN_STATE["scene"] == scene.name:
+            # Pending additions/removals first, so no handle of a deleted object is used
+            LOD_UPDATE_STATE["reconcile"] = False
+            reconcile_lod_groups(scene)
+        apply_lod_selection(scene, depsgraph, sliced)
+    finally:
+        LOD_UPDATE_STATE["applying"] = False
+        LOD_UPDATE_STATE["last_run"] = time.perf_counter()
+
+def apply_lod_selection(scene, depsgraph=None, sliced=False):
     props = scene.lod_tool_props
-    global COLORING_ENABLED_LAST, LOD_GROUPS_CACHE
+    # Whether the last pass in this scene left LOD colors on the objects
+    coloring_last = props.coloring_applied
     print("=== Updating LOD selection ===")
     if not props.has_lod_objects:
         print("No LOD objects detected.")
         return
+    # One bulk resolve of object handles (only after undo/redo/load or object removal)
+    ensure_object_map(scene)
 
     # Automatic LOD mode
     if props.auto_lod_enabled:
-        if not props.camera:
+        if not has_lod_eye(props):
             print("Auto LOD enabled but no camera selected.")
             return
-        camera_loc = props.camera.matrix_world.translation
-        # Rebuild valid groups to avoid ReferenceError
-        valid_groups = []
-        for group in LOD_GROUPS_CACHE:
-            if not group['lods']:
-                continue
-            base_obj = group['lods'][0][1]
-            if base_obj and base_obj.name in scene.objects:
-                valid_groups.append(group)
-            else:
-                print(f"Object {base_obj.name if base_obj else 'None'} removed, skipping group.")
-        LOD_GROUPS_CACHE = valid_groups
         if not LOD_GROUPS_CACHE:
             return
 
-        # Dynamically calculate base_distance as max distance to LOD objects
-        max_distance = 0.0
-        for group in LOD_GROUPS_CACHE:
-            base_obj = group['lods'][0][1]
-            distance = (base_obj.matrix_world.translation - camera_loc).length
-            max_distance = max(max_distance, distance)
-        base_distance = max(max_distance, 1.0) if max_distance > 0.0 else props.base_distance
-        print(f"Dynamic base_distance: {base_distance} units")
-
-        # Prepare sorted threshold distances (as percentages of base_distance)
-        thr_values = sorted([t.value / 100.0 * base_distance for t in props.thresholds])
-        print(f"Threshold values (absolute): {thr_values}")
-
-        # Initialize polycount
-        visible_polycount = 0  # Сбрасываем перед подсчётом
+        # Baked schedule: a lookup instead of an evaluation
+        schedule = active_lod_schedule(scene)
+        if schedule is not None:
+            lod_indices = LOD_ENGINE.use_lod_indices(schedule.lookup(scene.frame_current)).tolist()
+            print(f"LOD schedule lookup for frame {scene.frame_current}")
+        elif multi_camera_enabled(props) and not viewport_eye_active(props):
+            lod_indices = apply_view_lods(scene, depsgraph)
+        else:
+            lod_indices = evaluate_auto_lods(scene, depsgraph)
+        if props.frustum_culling != 'NONE' and (viewport_eye_active(props) or not multi_camera_enabled(props)):
+            lod_indices = cull_auto_lods(scene, depsgraph)
 
         # Optional: prepare color map for levels
-        color_map = {}
-        if props.enable_color:
-            for idx, item in enumerate(props.lod_list):
-                try:
-                    lvl = int(item.name[3:])
-                    color_map[lvl] = props.lod_colors[idx].color
-                except:
-                    continue
+        color_map = get_color_map(props)
 
-        # Apply LOD visibility and colors per group individually
-        for group_entry in LOD_GROUPS_CACHE:
-            if not group_entry['lods']:
-                continue
-            base_obj = group_entry['lods'][0][1]
-            if not base_obj or base_obj.name not in scene.objects:
-                continue
-            distance = (base_obj.matrix_world.translation - camera_loc).length
-            print(f"Group {group_entry['base_name']}, Distance: {distance}")
-
-            # Determine LOD index for this group
-            lod_index = 0
-            for i, thr in enumerate(thr_values):
-                if distance >= thr:
-                    lod_index = i + 1
-                else:
-                    break
-            lod_index = min(lod_index, group_entry['max_index'])
-            print(f"Group {group_entry['base_name']}, LOD index: {lod_index}")
-
-            is_camera_active = (scene.camera == props.camera)
-            for i, (lod_num, lod_obj) in enumerate(group_entry['lods']):
-                if lod_obj and lod_obj.name in scene.objects:
-                    is_visible = (i == lod_index)
-                    lod_obj.hide_render = not is_visible
-                    if not (is_camera_active and props.restrict_to_camera):
-                        lod_obj.hide_viewport = not is_visible
-                    # Assign color if enabled
-                    if props.enable_color:
-                        lod_obj.color = color_map.get(lod_num, (1.0, 1.0, 1.0, 1.0))
-                    elif COLORING_ENABLED_LAST:
-                        lod_obj.color = (1.0, 1.0, 1.0, 1.0)
-                    # Count polygons only for visible LOD objects
-                    if is_visible and lod_obj.type == 'MESH' and lod_obj.data:
-                        visible_polycount += len(lod_obj.data.polygons)
-                else:
-                    print(f"Object {lod_obj.name if lod_obj else 'None'} removed, skipping.")
+        if props.use_lod_collections:
+            # Per group LODs are object level: level collections stay visible
+            set_lod_collections_visible(get_lod_collections(scene))
+            LOD_COLLECTION_STATE["objects_clean"] = False
 
-        # Save polycount to cache
-        props.polycount_cache = json.dumps({"mode": "auto", "visible_polycount": int(visible_polycount)})
-        print(f"Visible polycount in auto mode: {visible_polycount}")
-
-        # Hide all non-LOD objects (in auto LOD mode)
-        lod_objs_set = {lod_obj for group in LOD_GROUPS_CACHE for (_, lod_obj) in group['lods'] if lod_obj and lod_obj.name in scene.objects}
+        # Apply only groups whose LOD index changed, unless display settings changed
         is_camera_active = (scene.camera == props.camera)
-        for obj in scene.objects:
-            if obj.type == 'MESH' and obj not in lod_objs_set:
-                obj.hide_render = True
-                if not (is_camera_active and props.restrict_to_camera):
-                    obj.hide_viewport = True
+        # The viewport eye always drives viewport visibility
+        set_viewport = viewport_eye_active(props) or not (is_camera_active and props.restrict_to_camera)
+        # Render visibility always comes from the camera (re-applied by render_init_handler)
+        set_render = not viewport_eye_active(props)
+        proxy_type = None if props.proxy_display == 'NONE' else props.proxy_display
+        signature = (props.enable_color, coloring_last, set_render, set_viewport, tuple(sorted(color_map.items())), proxy_type)
+        settings_changed = signature != LOD_APPLY_STATE["signature"]
+        # Groups left over by a time-sliced pass are still unapplied in LOD_ENGINE
+        cancel_lod_apply()
+        changed = range(len(LOD_GROUPS_CACHE)) if settings_changed else LOD_ENGINE.changed_groups().tolist()
+        proxy = None
+        if proxy_type:
+            # Groups crossing the proxy threshold are re-applied as well
+            proxy = get_proxy_groups(scene)
+            applied_proxy = LOD_APPLY_STATE["proxy"]
+            if applied_proxy is None or len(applied_proxy) != len(proxy):
+                LOD_APPLY_STATE["proxy"] = np.zeros(len(proxy), dtype=bool)
+                changed = range(len(LOD_GROUPS_CACHE))
+            elif not settings_changed:
+                changed = np.union1d(changed, np.flatnonzero(proxy != applied_proxy)).tolist()
+        gn_bases = LOD_GN_STATE["bases"] if get_gn_instancers(scene) else set()
+        settings = (lod_indices, color_map, props.enable_color, coloring_last, set_render, set_viewport, gn_bases,
+                    proxy, proxy_type)
+        if sliced and props.use_time_slicing and len(changed) > APPLY_CHUNK:
+            # Nearest groups first, the rest in later timer ticks
+            if settings_changed:
+                LOD_ENGINE.invalidate_applied()
+            pending = LOD_ENGINE.priority_order(changed).tolist()
+            done, writes = apply_group_slice(pending, settings, props.slice_budget)
+            if done < len(pending):
+                LOD_APPLY_JOB.update(scene=scene.name, groups=pending[done:], settings=settings)
+                bpy.app.timers.register(continue_lod_apply, first_interval=0.0)
+            print(f"Auto LOD: {done} of {len(pending)} groups applied in this slice")
+        else:
+            writes = apply_group_lods(changed, settings)
+            LOD_ENGINE.mark_applied()
+
+        # Polycount of visible LOD objects from the statistics table
+        sync_stats_table(scene, depsgraph)
+        slots = STATS_TABLE["levels"].shape[1]
+        visible_mask = np.arange(slots)[None, :] == LOD_ENGINE.lod_indices[:, None]
+        summarize_polycount("auto", visible_mask)
+        print(f"Visible polycount in auto mode: {POLYCOUNT_STATS['visible'][0]}")
+
+        # Hide all non-LOD objects (in auto LOD mode), only when settings or the object set changed
+        if settings_changed or LOD_APPLY_STATE["object_count"] != len(scene.objects):
+            lod_uids = {uid for group in LOD_GROUPS_CACHE for (_, uid) in group['lods']}
+            get_gn_instancers(scene)
+            lod_uids.update(uid for uid, _ in LOD_GN_STATE["instancers"])
+            for obj in scene.objects:
+                if obj.type == 'MESH' and obj.session_uid not in lod_uids:
+                    writes += write_object_state(obj, hide_render=True, hide_viewport=True if set_viewport else None)
+            LOD_APPLY_STATE["object_count"] = len(scene.objects)
+        LOD_APPLY_STATE["signature"] = signature
+        print(f"Auto LOD: {len(changed)} groups re-applied, {writes} property writes")
 
     else:
         # Manual LOD mode (оставляем без изменений, так как проблема только в авто-режиме)
         selected_levels = [int(item.name[3:]) for item in props.lod_list if item.selected]
         print(f"Manual mode selected LOD levels: {selected_levels}")
         show_all = (len(selected_levels) == 0)
-        poly_data = {}
-        color_map = {}
-        if props.enable_color:
-            for idx, item in enumerate(props.lod_list):
-                try:
-                    lvl = int(item.name[3:])
-                    color_map[lvl] = props.lod_colors[idx].color
-                except:
+        color_map = get_color_map(props)
+        collections = get_lod_collections(scene) if props.use_lod_collections else {}
+        use_collections = bool(collections) and set(get_index_levels()) <= set(collections)
+        refresh_objects = True
+        if use_collections:
+            # Collection mode: one write per level collection, whatever the scene size
+            writes = set_lod_collections_visible(collections, None if show_all else set(selected_levels))
+            print(f"Manual mode: {writes} collection writes")
+            # Objects only after color settings changed or an auto pass wrote object flags
+            colors = (props.enable_color, coloring_last, tuple(sorted(color_map.items())))
+            refresh_objects = colors != LOD_COLLECTION_STATE["colors"] or not LOD_COLLECTION_STATE["objects_clean"]
+            LOD_COLLECTION_STATE.update(colors=colors, objects_clean=True)
+        gn_bases = LOD_GN_STATE["bases"] if get_gn_instancers(scene) else set()
+        if refresh_objects:
+            for group_entry in LOD_GROUPS_CACHE:
+                if group_entry['base_name'] in gn_bases:
                     continue
-        visible_polycount_total = 0
-        for group_entry in LOD_GROUPS_CACHE:
-            for lod_num, lod_obj in group_entry['lods']:
-                if lod_obj and lod_obj.name in scene.objects:
-                    # Determine visibility based on selection
-                    if show_all or lod_num in selected_levels:
-                        lod_obj.hide_render = False
-                        lod_obj.hide_viewport = False
-                        visible = True
-                    else:
-                        lod_obj.hide_render = True
-                        lod_obj.hide_viewport = True
-                        visible = False
-                    if props.enable_color:
-                        lod_obj.color = color_map.get(lod_num, (1.0, 1.0, 1.0, 1.0))
-                    elif COLORING_ENABLED_LAST:
-                        lod_obj.color = (1.0, 1.0, 1.0, 1.0)
-                    # Count polygons for polycount stats
-                    if lod_obj.type == 'MESH' and lod_obj.data:
-                        polycount = len(lod_obj.data.polygons)
-                    else:
-                        polycount = 0
-                    key = str(lod_num)
-                    if key not in poly_data:
-                        poly_data[key] = {"total": 0, "visible": 0}
-                    poly_data[key]["total"] += polycount
-                    if visible:
-                        poly_data[key]["visible"] += polycount
-                        visible_polycount_total += polycount
-                else:
-                    print(f"Object {lod_obj.name if lod_obj else 'None'} removed, skipping.")
-        props.polycount_cache = json.dumps({"mode": "manual", "data": poly_data})
+                for lod_num, uid in group_entry['lods']:
+                    lod_obj = resolve(uid)
+                    if lod_obj:
+                        # Determine visibility based on selection
+                        visible = use_collections or show_all or lod_num in selected_levels
+                        if props.enable_color:
+                            color = color_map.get(lod_num, WHITE)
+                        elif coloring_last:
+                            color = WHITE
+                        else:
+                            color = None
+                        write_object_state(lod_obj, hide_render=not visible, hide_viewport=not visible, color=color)
+        # Polycount statistics per LOD level
+        sync_stats_table(scene, depsgraph)
+        levels = STATS_TABLE["levels"]
+        visible_mask = (levels >= 0) if show_all else np.isin(levels, selected_levels)
+        summarize_polycount("manual", visible_mask)
+        # Manual writes bypass the auto diff, next auto pass must re-apply everything
+        cancel_lod_apply()
+        restore_proxy_displays()
+        LOD_APPLY_STATE["signature"] = None
+        LOD_ENGINE.invalidate_applied()
 
-    COLORING_ENABLED_LAST = props.enable_color
+    if props.show_group_browser:
+        update_group_browser(scene, visible_mask)
+    # Instancers switch in the node tree: only thresholds and camera are pushed
+    if sync_gn_instancers(scene):
+        print("Geometry Nodes instancers updated")
+    if props.coloring_applied != props.enable_color:
+        props.coloring_applied = props.enable_color
     print("=== Update complete ===")
 
 class LOD_UL_items(bpy.types.UIList):
@@ -346,6 +2065,124 @@ class LOD_UL_items(bpy.types.UIList):
                           icon='LAYER_USED' if item.selected else 'LAYER_ACTIVE')
         op.index = index
 
+class LOD_UL_groups(bpy.types.UIList):
+    # Filters on top of the built-in name filter
+    filter_level: IntProperty(name="Current LOD", description="Only groups showing this LOD (-1 = any)", default=-1, min=-1)
+    filter_min_tris: IntProperty(name="Min Triangles", description="Only groups whose visible LOD has at least this many triangles", default=0, min=0)
+    sort_by: EnumProperty(
+        name="Sort By",
+        items=[
+            ("NONE", "Group Order", ""),
+            ("NAME", "Name", ""),
+            ("DISTANCE", "Distance", "Distance to the auto LOD camera"),
+            ("TRIS", "Triangles", "Triangles of the visible LOD"),
+        ],
+        default="NONE"
+    )
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        # Only called for visible rows: O(1) lookups into the browser arrays
+        row = layout.row(align=True)
+        row.operator("lod.select_group", text=item.name, emboss=False, icon='OBJECT_DATA').index = index
+        current = GROUP_BROWSER["current"]
+        if index < len(current):
+            level = int(current[index])
+            row.label(text=f"LOD{level}" if level >= 0 else "-")
+            row.label(text=f"{int(GROUP_BROWSER['tris'][index]):,}")
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "filter_level")
+        row.prop(self, "filter_min_tris")
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+    def filter_items(self, context, data, propname):
+        # Recomputed only when the filter settings, groups or LOD results changed
+        key = (GROUP_BROWSER["items_version"], GROUP_BROWSER["data_version"], len(getattr(data, propname)),
+               self.filter_name.lower(), self.filter_level, self.filter_min_tris, self.sort_by)
+        if GROUP_BROWSER["filter_key"] == key:
+            return GROUP_BROWSER["filter_result"]
+        names = GROUP_BROWSER["names"]
+        count = len(getattr(data, propname))
+        if len(names) != count:
+            return [], []
+        keep = np.ones(count, dtype=bool)
+        if self.filter_name:
+            keep &= np.char.find(names, self.filter_name.lower()) >= 0
+        if self.filter_level >= 0:
+            keep &= GROUP_BROWSER["current"] == self.filter_level
+        if self.filter_min_tris:
+            keep &= GROUP_BROWSER["tris"] >= self.filter_min_tris
+        flags = np.where(keep, self.bitflag_filter_item, 0).tolist()
+        order = []
+        if self.sort_by != "NONE":
+            sort_values = {"NAME": names, "DISTANCE": GROUP_BROWSER["distance"], "TRIS": GROUP_BROWSER["tris"]}[self.sort_by]
+            ranking = np.argsort(sort_values, kind='stable')
+            # New position of every item
+            positions = np.empty(count, dtype=np.int64)
+            positions[ranking] = np.arange(count)
+            order = positions.tolist()
+        GROUP_BROWSER["filter_key"] = key
+        GROUP_BROWSER["filter_result"] = (flags, order)
+        return flags, order
+
+class LOD_UL_validation(bpy.types.UIList):
+    sort_by: EnumProperty(
+        name="Sort By",
+        items=[
+            ("NONE", "Group Order", ""),
+            ("NAME", "Name", ""),
+            ("ISSUES", "Issues", "Number of different problems"),
+            ("RATIO", "Triangle Ratio", "Worst triangles of a level relative to the previous one"),
+            ("BOUNDS", "Bounds Deviation", "Worst bounds offset relative to LOD0"),
+        ],
+        default="NONE"
+    )
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        groups = VALIDATION_REPORT["groups"]
+        if index >= len(groups):
+            layout.label(text=item.name)
+            return
+        row = layout.row(align=True)
+        row.operator("lod.select_group", text=item.name, emboss=False, icon='ERROR').index = int(groups[index])
+        row.label(text=", ".join(get_translation(context, name) for name in issue_names(int(VALIDATION_REPORT["issues"][index]))))
+        row.label(text=f"{VALIDATION_REPORT['ratio'][index]:.2f} / {100.0 * VALIDATION_REPORT['deviation'][index]:.1f}%")
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+    def filter_items(self, context, data, propname):
+        # Recomputed only when a new validation ran or the filter settings changed
+        count = len(getattr(data, propname))
+        key = (VALIDATION_REPORT["version"], count, self.filter_name.lower(), self.sort_by)
+        if VALIDATION_REPORT["filter_key"] == key:
+            return VALIDATION_REPORT["filter_result"]
+        names = VALIDATION_REPORT["names"]
+        if len(names) != count:
+            return [], []
+        keep = np.ones(count, dtype=bool)
+        if self.filter_name:
+            keep &= np.char.find(names, self.filter_name.lower()) >= 0
+        flags = np.where(keep, self.bitflag_filter_item, 0).tolist()
+        order = []
+        if self.sort_by != "NONE":
+            issue_counts = sum(((VALIDATION_REPORT["issues"] & flag) > 0).astype(np.int64) for flag in ISSUE_NAMES)
+            sort_values = {"NAME": names, "ISSUES": issue_counts, "RATIO": VALIDATION_REPORT["ratio"],
+                           "BOUNDS": VALIDATION_REPORT["deviation"]}[self.sort_by]
+            ranking = np.argsort(sort_values, kind='stable')
+            # New position of every item
+            positions = np.empty(count, dtype=np.int64)
+            positions[ranking] = np.arange(count)
+            order = positions.tolist()
+        VALIDATION_REPORT["filter_key"] = key
+        VALIDATION_REPORT["filter_result"] = (flags, order)
+        return flags, order
+
 class LOD_PT_description(bpy.types.Panel):
     bl_label = "Description"
     bl_idname = "LOD_PT_description"
@@ -375,53 +2212,177 @@ class LOD_PT_panel(bpy.types.Panel):
         props = context.scene.lod_tool_props
         layout.prop(props, "language")  # Язык
         layout.operator("lod.refresh_groups", text=get_translation(context, "refresh_groups"), icon='FILE_REFRESH')  # Обновление групп
+        layout.operator("lod.generate_lods", text=get_translation(context, "generate_lods"), icon='MOD_DECIM')  # Генерация LOD
+        layout.operator("lod.export_groups", text=get_translation(context, "export_groups"), icon='EXPORT')  # Экспорт групп
         if not props.has_lod_objects:
             layout.label(text=get_translation(context, "no_lod_objects"), icon='INFO')
             return
         layout.template_list("LOD_UL_items", "", props, "lod_list", props, "lod_active_index",
                              rows=max(1, min(len(props.lod_list), 8)))  # Список LOD
+        layout.prop(props, "use_lod_collections", text=get_translation(context, "use_lod_collections"), icon='OUTLINER_COLLECTION')  # Коллекции уровней
         layout.separator()
         layout.prop(props, "enable_color", text=get_translation(context, "enable_color"), icon='COLOR')  # Цвета
         if props.enable_color:
             for i, color_item in enumerate(props.lod_colors):
                 layout.prop(color_item, "color", text=get_translation(context, "lod_color", i))
         layout.separator()
+        row = layout.row()
+        row.operator("lod.add_gn_instancer", text=get_translation(context, "add_gn_instancer"), icon='GEOMETRY_NODES')  # Инстансер GN
+        if LOD_GN_STATE["valid"] and LOD_GN_STATE["instancers"]:
+            row.label(text=get_translation(context, "gn_instancers", len(LOD_GN_STATE["instancers"])))
+        layout.separator()
         layout.prop(props, "auto_lod_enabled", text=get_translation(context, "auto_lod_enabled"), icon='AUTO')  # Авто-режим
         if props.auto_lod_enabled:
             layout.prop(props, "restrict_to_camera", text=get_translation(context, "restrict_to_camera"), icon='RENDER_STILL')  # Ограничение камерой
             layout.prop(props, "camera", text=get_translation(context, "camera"), icon='CAMERA_DATA')  # Выбор камеры
-            layout.prop(props, "base_distance", text=get_translation(context, "base_distance"), icon='EMPTY_AXIS')  # Базовое расстояние
-            layout.operator("lod.auto_calculate_base", text=get_translation(context, "auto_calculate_base"), icon='ZOOM_SELECTED')  # Авто-расчёт
-            for i, threshold in enumerate(props.thresholds):
-                label = get_translation(context, "threshold", i + 1)
-                layout.prop(threshold, "value", text=label, slider=True)  # Пороги
+            layout.prop(props, "use_multi_camera", text=get_translation(context, "use_multi_camera"), icon='OUTLINER_OB_CAMERA')  # Несколько камер
+            if props.use_multi_camera:
+                box = layout.box()
+                for i, item in enumerate(props.view_cameras):
+                    row = box.row(align=True)
+                    row.prop(item, "camera", text="")
+                    row.prop_search(item, "view_layer", context.scene, "view_layers", text="", icon='RENDERLAYERS')
+                    row.operator("lod.remove_view_camera", text="", icon='X').index = i
+                box.operator("lod.add_view_camera", text=get_translation(context, "add_view_camera"), icon='ADD')
+                if props.camera and multi_camera_enabled(props):
+                    view_layer, uid = active_view_key(context.scene)
+                    camera = resolve(uid) or props.camera
+                    box.label(text=get_translation(context, "active_view", camera.name, view_layer or "-"))
+            layout.prop(props, "lod_metric", text=get_translation(context, "lod_metric"))  # Метрика
+            screen_size = props.lod_metric == 'SCREEN_SIZE'
+            if props.lod_metric == 'BUDGET':
+                layout.prop(props, "triangle_budget", text=get_translation(context, "triangle_budget"))  # Бюджет треугольников
+                used = LOD_ENGINE.budget_tris
+                if used is not None:
+                    diff = props.triangle_budget - used
+                    key = "budget_under" if diff >= 0 else "budget_over"
+                    layout.label(text=get_translation(context, key, used, props.triangle_budget, abs(diff)),
+                                 icon='CHECKMARK' if diff >= 0 else 'ERROR')
+            elif not screen_size:
+                layout.prop(props, "use_dynamic_base", text=get_translation(context, "use_dynamic_base"))  # Динамическая база
+                layout.prop(props, "base_distance", text=get_translation(context, "base_distance"), icon='EMPTY_AXIS')  # Базовое расстояние
+                layout.operator("lod.auto_calculate_base", text=get_translation(context, "auto_calculate_base"), icon='ZOOM_SELECTED')  # Авто-расчёт
+            if props.lod_metric != 'BUDGET':
+                for i, threshold in enumerate(props.thresholds):
+                    row = layout.row(align=True)
+                    if screen_size:
+                        row.prop(threshold, "pixels", text=get_translation(context, "threshold_pixels", i + 1))  # Пороги в пикселях
+                    else:
+                        row.prop(threshold, "value", text=get_translation(context, "threshold", i + 1), slider=True)  # Пороги
+                    row.prop(threshold, "hysteresis", text=get_translation(context, "hysteresis"))  # Гистерезис
+            layout.prop(props, "min_dwell_frames", text=get_translation(context, "min_dwell_frames"))  # Мин. кадров на уровне
+            row = layout.row(align=True)
+            row.prop(props, "proxy_display", text=get_translation(context, "proxy_display"))  # Отображение дальних групп
+            sub = row.row(align=True)
+            sub.active = props.proxy_display != 'NONE'
+            if props.lod_metric == 'DISTANCE':
+                sub.prop(props, "proxy_distance", text=get_translation(context, "proxy_distance"))
+            else:
+                sub.prop(props, "proxy_pixels", text=get_translation(context, "proxy_pixels"))
+            row = layout.row(align=True)
+            row.prop(props, "frustum_culling", text=get_translation(context, "frustum_culling"))  # Отсечение по пирамиде видимости
+            sub = row.row(align=True)
+            sub.active = props.frustum_culling != 'NONE'
+            sub.prop(props, "frustum_margin", text=get_translation(context, "frustum_margin"))
+            layout.prop(props, "update_interval", text=get_translation(context, "update_interval"))  # Интервал обновления
+            row = layout.row(align=True)
+            row.prop(props, "use_viewport_eye", text=get_translation(context, "use_viewport_eye"), icon='VIEW3D')  # Следовать за вьюпортом
+            sub = row.row(align=True)
+            sub.active = props.use_viewport_eye
+            sub.prop(props, "viewport_rate", text=get_translation(context, "viewport_rate"))
+            row = layout.row(align=True)
+            row.prop(props, "use_time_slicing", text=get_translation(context, "use_time_slicing"))  # Обновление по частям
+            sub = row.row(align=True)
+            sub.active = props.use_time_slicing
+            sub.prop(props, "slice_budget", text=get_translation(context, "slice_budget"))
             layout.operator("lod.update_manually", text=get_translation(context, "update_manually"), icon='FILE_REFRESH')  # Ручное обновление
+            box = layout.box()  # Запечённое расписание
+            row = box.row(align=True)
+            row.operator("lod.bake_schedule", text=get_translation(context, "bake_schedule"), icon='REC')
+            row.operator("lod.clear_schedule", text="", icon='X')
+            box.prop(props, "use_lod_schedule", text=get_translation(context, "use_lod_schedule"))
+            if "lod_schedule" in context.scene:
+                schedule = get_lod_schedule(context.scene)
+                if schedule is not None:
+                    box.label(text=get_translation(context, "schedule_info", schedule.frame_start, schedule.frame_end, len(schedule)))
+                else:
+                    box.label(text=get_translation(context, "schedule_stale"), icon='ERROR')
+        layout.separator()
+        row = layout.row()
+        row.prop(props, "show_group_browser", text=get_translation(context, "group_browser", len(LOD_GROUPS_CACHE)),
+                 icon="TRIA_DOWN" if props.show_group_browser else "TRIA_RIGHT", emboss=False)  # Браузер групп
+        if props.show_group_browser:
+            layout.template_list("LOD_UL_groups", "", props, "group_items", props, "group_active_index", rows=8)
+        layout.separator()
+        row = layout.row()
+        row.prop(props, "show_validation", text=get_translation(context, "validation"),
+                 icon="TRIA_DOWN" if props.show_validation else "TRIA_RIGHT", emboss=False)  # Проверка цепочек LOD
+        if props.show_validation:
+            box = layout.box()
+            row = box.row(align=True)
+            row.prop(props, "validation_min_reduction", text=get_translation(context, "validation_min_reduction"))
+            row.prop(props, "validation_bounds_tolerance", text=get_translation(context, "validation_bounds_tolerance"))
+            row = box.row(align=True)
+            row.operator("lod.validate_chains", text=get_translation(context, "validate_chains"), icon='CHECKMARK')
+            row.operator("lod.save_validation", text="", icon='FILE_TICK')
+            if VALIDATION_REPORT["settings"] is not None:
+                if VALIDATION_REPORT["groups_version"] != GROUP_BROWSER["groups_version"]:
+                    box.label(text=get_translation(context, "validation_stale"), icon='INFO')
+                box.label(text=get_translation(context, "validation_summary", len(props.validation_items), VALIDATION_REPORT["checked"]))
+                if props.validation_items:
+                    box.template_list("LOD_UL_validation", "", props, "validation_items", props, "validation_active_index", rows=6)
         layout.separator()
         row = layout.row()
         row.prop(props, "show_polycount", text=get_translation(context, "show_polycount"),
                  icon="TRIA_DOWN" if props.show_polycount else "TRIA_RIGHT", emboss=False)  # Поликаунт
-        if props.show_polycount and props.polycount_cache:
-            try:
-                cache = json.loads(props.polycount_cache)
-                if cache.get("mode") == "manual":
-                    layout.label(text=get_translation(context, "total_polycount"))
-                    for lod_key in sorted(cache["data"].keys(), key=int):
-                        data = cache["data"][lod_key]
-                        box = layout.box()
-                        box.label(text=f"LOD{lod_key}:")
-                        box.label(text=get_translation(context, "total_polycount", data['total']))
-                        box.label(text=get_translation(context, "visible_polycount", data['visible']))
-                elif cache.get("mode") == "auto":
-                    layout.label(text=get_translation(context, "total_visible_polycount", cache['visible_polycount']))
-            except Exception as e:
-                print(f"Error parsing polycount cache: {e}")
-                layout.label(text=get_translation(context, "error_polycount"))
+        stats = POLYCOUNT_STATS
+        if props.show_polycount and stats["mode"]:
+            # Totals are precomputed by update_lod_selection
+            if stats["mode"] == "manual":
+                for lvl, total, visible in stats["levels"]:
+                    box = layout.box()
+                    box.label(text=f"LOD{lvl}:")
+                    box.label(text=get_translation(context, "total_polycount", total[0]))
+                    box.label(text=get_translation(context, "visible_polycount", visible[0]))
+                    box.label(text=get_translation(context, "visible_tris_verts", visible[1], visible[2]))
+                    box.label(text=get_translation(context, "visible_eval_tris", visible[4]))
+            elif stats["mode"] == "auto":
+                visible = stats["visible"]
+                layout.label(text=get_translation(context, "total_visible_polycount", visible[0]))
+                layout.label(text=get_translation(context, "visible_tris_verts", visible[1], visible[2]))
+                layout.label(text=get_translation(context, "visible_eval_tris", visible[4]))
 
 class LOD_Tool_Props(bpy.types.PropertyGroup):
     lod_list: CollectionProperty(type=LODListItem)
+    group_items: CollectionProperty(type=LODGroupItem)
+    group_active_index: IntProperty(default=-1)
+    show_group_browser: BoolProperty(default=False, update=lambda self, ctx: update_lod_selection(ctx.scene))
+    show_validation: BoolProperty(default=False)
+    validation_items: CollectionProperty(type=LODGroupItem)
+    validation_active_index: IntProperty(default=-1)
+    validation_min_reduction: FloatProperty(
+        name="Min Reduction (%)",
+        description="Each LOD must have at least this much fewer triangles than the previous one",
+        default=10.0,
+        min=0.0,
+        max=99.0
+    )
+    validation_bounds_tolerance: FloatProperty(
+        name="Bounds Tolerance (%)",
+        description="Largest allowed offset of a LOD's bounding box from LOD0's, relative to its diagonal",
+        default=5.0,
+        min=0.0,
+        max=1000.0
+    )
     lod_active_index: IntProperty(default=-1)
-    polycount_cache: StringProperty(default="")
     show_polycount: BoolProperty(default=False)
+    use_lod_collections: BoolProperty(
+        name="Level Collections",
+        description="Move LOD objects into one managed collection per LOD level and switch levels "
+                    "by hiding collections instead of objects. Disabling moves objects back",
+        default=False,
+        update=update_lod_collection_mode
+    )
     enable_color: BoolProperty(default=False, update=lambda self, ctx: update_lod_selection(ctx.scene))
     auto_lod_enabled: BoolProperty(default=False, update=lambda self, ctx: update_lod_selection(ctx.scene))
     restrict_to_camera: BoolProperty(
@@ -434,21 +2395,148 @@ class LOD_Tool_Props(bpy.types.PropertyGroup):
         poll=lambda self, obj: obj.type == 'CAMERA',
         update=lambda self, ctx: update_lod_selection(ctx.scene)
     )
+    use_multi_camera: BoolProperty(
+        name="Multiple Cameras",
+        description="Evaluate extra cameras / view layers together with the main camera and apply "
+                    "the result of the active one when the scene camera or view layer changes",
+        default=False,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    view_cameras: CollectionProperty(type=LODViewItem)
     base_distance: FloatProperty(
         name="Base Distance",
         description="Reference distance for percentage-based thresholds (manual override)",
         default=100.0,
         min=0.0,
         subtype='DISTANCE',
-        unit='LENGTH'
+        unit='LENGTH',
+        update=lambda self, ctx: update_lod_selection(ctx.scene) if not self.use_dynamic_base else None
+    )
+    lod_metric: EnumProperty(
+        name="LOD Metric",
+        items=[
+            ("DISTANCE", "Distance", "Switch by distance to the camera as a percentage of the base distance"),
+            ("SCREEN_SIZE", "Screen Size", "Switch by projected bounding sphere size in pixels (camera lens and render resolution)"),
+            ("BUDGET", "Triangle Budget", "Pick the LOD of every group with the least screen-space error that fits a scene-wide triangle budget"),
+        ],
+        default="DISTANCE",
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    triangle_budget: IntProperty(
+        name="Triangle Budget",
+        description="Maximum number of visible LOD triangles (after modifiers) for the selected camera",
+        default=1000000,
+        min=0,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    use_dynamic_base: BoolProperty(
+        name="Dynamic Base Distance",
+        description="Use the distance to the farthest LOD group as base distance. "
+                    "Disable to use the fixed Base Distance, which lets camera moves re-evaluate only groups near threshold bands",
+        default=True,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
     )
     thresholds: CollectionProperty(type=ThresholdItem)
+    use_lod_schedule: BoolProperty(
+        name="Use Baked Schedule",
+        description="Look up LODs from the baked schedule inside its frame range instead of evaluating them",
+        default=True,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    min_dwell_frames: IntProperty(
+        name="Min Dwell Frames",
+        description="Minimum number of frames a group keeps its LOD after switching (0 = off)",
+        default=0,
+        min=0,
+        max=240
+    )
     lod_colors: CollectionProperty(type=LODColorItem)
     language: EnumProperty(
         items=[("ru", "Русский", ""), ("en", "English", "")],
         default="en"
     )
     has_lod_objects: BoolProperty(default=False)
+    coloring_applied: BoolProperty(default=False, options={'HIDDEN'})
+    proxy_display: EnumProperty(
+        name="Far Display",
+        description="Viewport display of far groups (renders are not affected)",
+        items=[
+            ("NONE", "Off", "Far groups are drawn normally"),
+            ("BOUNDS", "Bounds", "Draw far groups as bounding boxes"),
+            ("WIRE", "Wire", "Draw far groups as wireframes"),
+        ],
+        default="NONE",
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    proxy_distance: FloatProperty(
+        name="Far Display Distance (%)",
+        description="Distance past which groups use the far display, in percent of the base distance",
+        default=150.0,
+        min=0.0,
+        max=10000.0,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    proxy_pixels: FloatProperty(
+        name="Far Display Size (px)",
+        description="Screen size below which groups use the far display",
+        default=8.0,
+        min=0.0,
+        max=4096.0,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    frustum_culling: EnumProperty(
+        name="Frustum Culling",
+        description="What happens to groups outside the camera view",
+        items=[
+            ("NONE", "Off", "Groups outside the view keep their LOD"),
+            ("HIDE", "Hide", "Hide every LOD of groups outside the view"),
+            ("LOWEST", "Lowest LOD", "Show the lowest LOD of groups outside the view (keeps shadows and reflections)"),
+        ],
+        default="NONE",
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    frustum_margin: FloatProperty(
+        name="Frustum Margin (%)",
+        description="Widen the view by this much before culling, so objects entering the frame are ready",
+        default=10.0,
+        min=0.0,
+        max=200.0,
+        update=lambda self, ctx: update_lod_selection(ctx.scene)
+    )
+    use_viewport_eye: BoolProperty(
+        name="Follow Viewport",
+        description="Measure auto LOD from the 3D view being navigated instead of the camera (renders still use the camera)",
+        default=False,
+        update=update_viewport_eye_mode
+    )
+    viewport_rate: FloatProperty(
+        name="Viewport Rate",
+        description="Maximum LOD updates per second while the viewport moves",
+        default=10.0,
+        min=0.5,
+        max=60.0
+    )
+    use_time_slicing: BoolProperty(
+        name="Time-Sliced Updates",
+        description="Apply large automatic updates over several timer ticks, nearest groups first, to keep the viewport responsive",
+        default=False
+    )
+    slice_budget: FloatProperty(
+        name="Slice Budget (ms)",
+        description="Time spent writing LOD visibility per timer tick",
+        default=8.0,
+        min=1.0,
+        max=100.0
+    )
+    update_interval: FloatProperty(
+        name="Update Interval",
+        description="Minimum time between automatic LOD updates caused by camera or object movement",
+        default=0.05,
+        min=0.0,
+        max=2.0,
+        subtype='TIME',
+        unit='TIME'
+    )
 
 class LOD_OT_select_item(bpy.types.Operator):
     bl_idname = "lod.select_item"
@@ -524,56 +2612,39 @@ class LOD_OT_set_active_lod(bpy.types.Operator):
         update_lod_selection(context.scene)
         return {'FINISHED'}
 
+class LOD_OT_select_group(bpy.types.Operator):
+    bl_idname = "lod.select_group"
+    bl_label = "Select LOD Group Objects"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+    index: IntProperty()
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+    def execute(self, context):
+        if not 0 <= self.index < len(LOD_GROUPS_CACHE):
+            return {'CANCELLED'}
+        ensure_object_map(context.scene)
+        props = context.scene.lod_tool_props
+        props.group_active_index = self.index
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        group = LOD_GROUPS_CACHE[self.index]
+        current = GROUP_BROWSER["current"]
+        level = int(current[self.index]) if self.index < len(current) else -1
+        for lod_num, uid in group['lods']:
+            lod_obj = resolve(uid)
+            if lod_obj and lod_obj.visible_get():
+                lod_obj.select_set(True)
+                if lod_num == level or context.view_layer.objects.active is None:
+                    context.view_layer.objects.active = lod_obj
+        return {'FINISHED'}
+
 class LOD_OT_refresh_groups(bpy.types.Operator):
     bl_idname = "lod.refresh_groups"
     bl_label = "Refresh LOD Groups"
     def execute(self, context):
-        props = context.scene.lod_tool_props
-        props.lod_list.clear()
-        props.lod_colors.clear()
-        props.thresholds.clear()
-        props.has_lod_objects = False
-        # Reset the cached groups
-        global LOD_GROUPS_CACHE
-        LOD_GROUPS_CACHE = []
-        # Identify all LOD objects and group by base object name
-        lod_names = set()
-        lod_groups_temp = {}
-        for obj in context.scene.objects:
-            match = LOD_PATTERN.match(obj.name)
-            if match:
-                lod_num = match.group(1)
-                base_name = obj.name.rsplit('_LOD', 1)[0]
-                lod_names.add(lod_num)
-                lod_groups_temp.setdefault(base_name, []).append((int(lod_num), obj))
-        print(f"Found LOD levels: {lod_names}")
-        if lod_groups_temp:
-            props.has_lod_objects = True
-            sorted_lod_levels = sorted({int(x) for x in lod_names})
-            for lod in sorted_lod_levels:
-                props.lod_list.add().name = f"LOD{lod}"
-                props.lod_colors.add().color = generate_distinct_color(int(lod), len(sorted_lod_levels))
-            if props.lod_list:
-                props.lod_list[0].selected = True
-                props.lod_active_index = 0
-            # Create default thresholds (evenly spaced percentages)
-            num_thresholds_needed = len(sorted_lod_levels) - 1
-            for i in range(num_thresholds_needed):
-                item = props.thresholds.add()
-                item.value = (i + 1) * 100.0 / num_thresholds_needed
-            print(f"Initialized {len(props.thresholds)} thresholds.")
-            # Build the cached LOD groups list
-            for base_name, lod_list in lod_groups_temp.items():
-                lod_list.sort(key=lambda x: x[0])
-                max_index = len(lod_list) - 1
-                LOD_GROUPS_CACHE.append({
-                    "base_name": base_name,
-                    "lods": lod_list,
-                    "max_index": max_index
-                })
-            # Immediately update LOD selection to apply current settings
-            update_lod_selection(context.scene)
-        props.polycount_cache = ""
+        # Full rescan; groups are otherwise kept up to date incrementally
+        refresh_lod_groups(context.scene)
         return {'FINISHED'}
 
 class LOD_OT_auto_calculate_base(bpy.types.Operator):
@@ -586,49 +2657,545 @@ class LOD_OT_auto_calculate_base(bpy.types.Operator):
             return {'CANCELLED'}
         camera_loc = props.camera.matrix_world.translation
         max_distance = 0.0
-        for group in LOD_GROUPS_CACHE:
-            if not group['lods']:
-                continue
-            base_obj = group['lods'][0][1]
-            if base_obj and base_obj.name in context.scene.objects:
-                distance = (base_obj.matrix_world.translation - camera_loc).length
-                max_distance = max(max_distance, distance)
+        ensure_object_map(context.scene)
+        if LOD_GROUPS_CACHE:
+            sync_lod_engine()
+            max_distance = float(LOD_ENGINE.compute_distances(camera_loc).max())
         props.base_distance = max(max_distance, 1.0) if max_distance > 0.0 else 100.0
         update_lod_selection(context.scene)
         return {'FINISHED'}
 
+class LOD_OT_generate_lods(bpy.types.Operator):
+    bl_idname = "lod.generate_lods"
+    bl_label = "Generate LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ("RATIO", "Ratio", "Decimation ratio of LOD0 per generated level"),
+            ("TRIANGLES", "Triangles", "Target triangle count per generated level"),
+        ],
+        default="RATIO"
+    )
+    targets: StringProperty(
+        name="Levels",
+        description="One value per generated level LOD1, LOD2, ... (comma separated)",
+        default="0.5, 0.25, 0.1"
+    )
+    replace_existing: BoolProperty(name="Replace Existing", default=False)
+    workers: IntProperty(
+        name="Workers",
+        description="Background Blender processes for large batches (0 = one per CPU core)",
+        default=0,
+        min=0,
+        max=256
+    )
+    _run = None
+    _timer = None
+    _scene = ""
+    _tracked = False
+    _replacing = None
+    _start = 0.0
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    def execute(self, context):
+        scene = context.scene
+        try:
+            targets = lod_workers.parse_targets(self.targets)
+        except ValueError:
+            targets = []
+        if not targets:
+            self.report({'ERROR'}, get_translation(context, "generate_bad_targets"))
+            return {'CANCELLED'}
+        tracked = LOD_SCAN_STATE["scene"] == scene.name
+        if tracked:
+            # Pending additions/removals first, generated objects are added to the index directly
+            reconcile_lod_groups(scene)
+            ensure_object_map(scene)
+        # Selected LOD0 objects, or every LOD0 object of the scene
+        sources = [obj for obj in context.selected_objects if (parse_lod_name(obj.name) or (None, -1))[1] == 0]
+        if not sources:
+            sources = [obj for obj in scene.objects if (parse_lod_name(obj.name) or (None, -1))[1] == 0]
+        jobs = []
+        # Existing LODs stay until their replacements exist: name -> session_uid
+        replacing = {}
+        for obj in sources:
+            if obj.type != 'MESH':
+                continue
+            base_name = parse_lod_name(obj.name)[0]
+            levels = []
+            for level, target in enumerate(targets, start=1):
+                name = lod_workers.lod_name(base_name, level)
+                if tracked:
+                    entry = LOD_OBJECT_BASES.get(name)
+                    existing = resolve(entry[2]) if entry is not None else None
+                else:
+                    existing = scene.objects.get(name)
+                if existing is not None:
+                    if not self.replace_existing:
+                        continue
+                    replacing[name] = existing.session_uid
+                levels.append([level, target])
+            if levels:
+                jobs.append({"object": obj.name, "base": base_name, "levels": levels})
+        if not jobs:
+            self.report({'INFO'}, get_translation(context, "generate_none"))
+            return {'CANCELLED'}
+        self._scene = scene.name
+        self._tracked = tracked
+        self._replacing = replacing
+        self._start = time.perf_counter()
+        workers = self.workers or os.cpu_count() or 1
+        if workers > 1 and len(jobs) >= lod_workers.POOL_MIN_OBJECTS:
+            # Workers run in the background, modal() collects their results
+            self._run = lod_workers.start_pool(jobs, self.mode, workers)
+            wm = context.window_manager
+            self._timer = wm.event_timer_add(0.25, window=context.window)
+            wm.progress_begin(0, 100)
+            wm.modal_handler_add(self)
+            self.report({'INFO'}, get_translation(context, "generate_started", len(jobs)))
+            return {'RUNNING_MODAL'}
+        created = lod_workers.generate_lods(scene, jobs, self.mode, bpy.data.objects)
+        self.add_created(context, created)
+        return {'FINISHED'}
+    def modal(self, context, event):
+        wm = context.window_manager
+        if event.type == 'ESC':
+            lod_workers.cancel_pool(self._run)
+            self.finish(context)
+            self.report({'WARNING'}, get_translation(context, "generate_cancelled"))
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            # The session stays usable while the workers run
+            return {'PASS_THROUGH'}
+        done, total = lod_workers.poll_pool(self._run)
+        wm.progress_update(100 * done // total)
+        if done < total:
+            return {'PASS_THROUGH'}
+        run = self._run
+        self.finish(context)
+        try:
+            created = lod_workers.finish_pool(run)
+        except RuntimeError as e:
+            # Nothing was replaced, the existing LODs are untouched
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self.add_created(context, created)
+        return {'FINISHED'}
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._run = None
+    def add_created(self, context, created):
+        """Swap generated objects in for the LODs they replace and add them to the group index."""
+        # The active scene may have changed while the workers ran
+        scene = bpy.data.scenes.get(self._scene) or context.scene
+        replaced = set()
+        # Next to the source object, in its collections, under the LOD_PATTERN name
+        for obj in created:
+            source = bpy.data.objects.get(obj["lod_source"])
+            for coll in list(obj.users_collection):
+                coll.objects.unlink(obj)
+            for coll in (source.users_collection if source else [scene.collection]):
+                coll.objects.link(obj)
+            if source:
+                obj.matrix_world = source.matrix_world.copy()
+                name = lod_workers.lod_name(parse_lod_name(source.name)[0], obj["lod_level"])
+                old = scene.objects.get(name)
+                # Only the object picked in execute, not one renamed to its name meanwhile
+                if old is not None and self._replacing.get(name) == old.session_uid:
+                    replaced.add(remove_lod_object(name))
+                    bpy.data.objects.remove(old)
+                obj.name = obj.data.name = name
+            del obj["lod_source"]
+        if self._tracked and LOD_SCAN_STATE["scene"] == scene.name:
+            touched = {add_lod_object(obj) for obj in created} | replaced
+            LOD_SCAN_STATE.update(names=set(scene.objects.keys()), data_count=len(bpy.data.objects))
+            invalidate_object_map()
+            invalidate_gn_instancers()
+            patch_group_index(touched)
+            sync_lod_levels(scene.lod_tool_props)
+            update_lod_selection(scene)
+        else:
+            refresh_lod_groups(scene)
+        if created:
+            self.report({'INFO'}, get_translation(context, "generate_done", len(created), time.perf_counter() - self._start))
+
+class LOD_OT_validate_chains(bpy.types.Operator):
+    bl_idname = "lod.validate_chains"
+    bl_label = "Validate LOD Chains"
+    bl_description = "Check every LOD group for level gaps, levels that save no triangles and bounds drifting from LOD0"
+    @classmethod
+    def poll(cls, context):
+        return context.scene.lod_tool_props.has_lod_objects
+    def execute(self, context):
+        start = time.perf_counter()
+        flagged = validate_lod_chains(context.scene)
+        context.scene.lod_tool_props.show_validation = True
+        self.report({'WARNING'} if flagged else {'INFO'},
+                    get_translation(context, "validation_done", flagged, VALIDATION_REPORT["checked"], time.perf_counter() - start))
+        return {'FINISHED'}
+
+class LOD_OT_save_validation(bpy.types.Operator):
+    bl_idname = "lod.save_validation"
+    bl_label = "Save Validation Report"
+    bl_description = "Write the last LOD chain validation as JSON"
+    filepath: StringProperty(subtype='FILE_PATH', default="lod_validation.json")
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+    @classmethod
+    def poll(cls, context):
+        return VALIDATION_REPORT["settings"] is not None
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    def execute(self, context):
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+        with open(path, "w") as f:
+            json.dump(validation_report_json(), f, indent=2)
+        self.report({'INFO'}, get_translation(context, "validation_saved", path))
+        return {'FINISHED'}
+
+class LOD_OT_export_groups(bpy.types.Operator):
+    bl_idname = "lod.export_groups"
+    bl_label = "Export LOD Groups"
+    bl_description = "Export every LOD group (or the groups of the selected objects) to its own file, in background workers"
+    directory: StringProperty(subtype='DIR_PATH')
+    export_format: EnumProperty(
+        name="Format",
+        items=[
+            ("FBX", "FBX", ""),
+            ("GLTF", "glTF Binary", ""),
+        ],
+        default="FBX"
+    )
+    selected_only: BoolProperty(name="Selected Groups Only", default=False)
+    name_prefix: StringProperty(name="Name Prefix", description="Prefix of exported object names, e.g. SM_", default="")
+    center: BoolProperty(name="Center on LOD0", description="Export around the LOD0 origin instead of world positions",
+                         default=True)
+    workers: IntProperty(
+        name="Workers",
+        description="Background Blender processes (0 = one per CPU core)",
+        default=0,
+        min=0,
+        max=256
+    )
+    _run = None
+    _timer = None
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and context.scene.lod_tool_props.has_lod_objects
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    def execute(self, context):
+        scene = context.scene
+        ensure_group_index(scene)
+        ensure_object_map(scene)
+        groups = LOD_GROUPS_CACHE
+        if self.selected_only:
+            bases = {LOD_OBJECT_BASES[obj.name][0] for obj in context.selected_objects if obj.name in LOD_OBJECT_BASES}
+            groups = [group for group in groups if group['base_name'] in bases]
+        jobs = lod_export.group_jobs(groups, resolve)
+        if not jobs or not self.directory:
+            self.report({'INFO'}, get_translation(context, "export_none"))
+            return {'CANCELLED'}
+        options = {"directory": bpy.path.abspath(self.directory), "format": self.export_format,
+                   "prefix": self.name_prefix, "center": self.center}
+        self._run = lod_export.start_export(jobs, options, self.workers or os.cpu_count() or 1)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, get_translation(context, "export_started", len(jobs)))
+        return {'RUNNING_MODAL'}
+    def modal(self, context, event):
+        wm = context.window_manager
+        if event.type == 'ESC':
+            lod_export.cancel_export(self._run)
+            self.finish(context)
+            self.report({'WARNING'}, get_translation(context, "export_cancelled"))
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            # The session stays usable while the workers run
+            return {'PASS_THROUGH'}
+        done, total = lod_export.poll_export(self._run)
+        wm.progress_update(100 * done // total)
+        if done < total:
+            return {'PASS_THROUGH'}
+        manifest = lod_export.finish_export(self._run)
+        self.finish(context)
+        files = len(manifest["files"])
+        if manifest["failed"]:
+            self.report({'WARNING'}, get_translation(context, "export_failed", manifest["failed"], files))
+        else:
+            self.report({'INFO'}, get_translation(context, "export_done", files, manifest["seconds"]))
+        return {'FINISHED'}
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._run = None
+
+def get_gn_group_items(self, context):
+    GN_GROUP_ITEMS[:] = [(group['base_name'], group['base_name'], "") for group in LOD_GROUPS_CACHE
+                         if len(group['lods']) > 1]
+    return GN_GROUP_ITEMS
+
+class LOD_OT_add_gn_instancer(bpy.types.Operator):
+    bl_idname = "lod.add_gn_instancer"
+    bl_label = "Add LOD Instancer"
+    bl_options = {'REGISTER', 'UNDO'}
+    group: EnumProperty(name="LOD Group", items=get_gn_group_items)
+    hide_prototypes: BoolProperty(name="Hide LOD Objects", default=True)
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return (context.scene.lod_tool_props.has_lod_objects and context.mode == 'OBJECT'
+                and obj is not None and obj.type == 'MESH' and parse_lod_name(obj.name) is None)
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    def execute(self, context):
+        scene = context.scene
+        ensure_object_map(scene)
+        group = LOD_GROUP_INDEX.get(self.group)
+        if not group or len(group['lods']) < 2:
+            self.report({'ERROR'}, get_translation(context, "gn_no_group"))
+            return {'CANCELLED'}
+        # Points of the active object become instances of the group's LODs
+        points_obj = context.active_object
+        tree = build_gn_lod_tree(len(group['lods']))
+        mod = points_obj.modifiers.get(GN_INSTANCER_NAME) or points_obj.modifiers.new(GN_INSTANCER_NAME, 'NODES')
+        mod.node_group = tree
+        ids = gn_input_ids(tree)
+        for i, (lod_num, uid) in enumerate(group['lods']):
+            lod_obj = resolve(uid)
+            if lod_obj:
+                mod[ids[f"LOD{i}"]] = lod_obj
+                if self.hide_prototypes:
+                    # Render flag and eye only: hidden objects are still evaluated for the instancer
+                    write_object_state(lod_obj, hide_render=True)
+                    lod_obj.hide_set(True)
+        invalidate_gn_instancers()
+        # The points object may be new to the scene and not in the handle map yet
+        invalidate_object_map()
+        update_lod_selection(scene)
+        self.report({'INFO'}, get_translation(context, "gn_added", self.group, points_obj.name))
+        return {'FINISHED'}
+
+class LOD_OT_add_view_camera(bpy.types.Operator):
+    bl_idname = "lod.add_view_camera"
+    bl_label = "Add LOD Camera"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+    def execute(self, context):
+        item = context.scene.lod_tool_props.view_cameras.add()
+        if context.scene.camera:
+            item.camera = context.scene.camera
+        return {'FINISHED'}
+
+class LOD_OT_remove_view_camera(bpy.types.Operator):
+    bl_idname = "lod.remove_view_camera"
+    bl_label = "Remove LOD Camera"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+    index: IntProperty()
+    def execute(self, context):
+        props = context.scene.lod_tool_props
+        if not 0 <= self.index < len(props.view_cameras):
+            return {'CANCELLED'}
+        props.view_cameras.remove(self.index)
+        update_lod_selection(context.scene)
+        return {'FINISHED'}
+
+class LOD_OT_bake_schedule(bpy.types.Operator):
+    bl_idname = "lod.bake_schedule"
+    bl_label = "Bake LOD Schedule"
+    bl_options = {'REGISTER', 'UNDO'}
+    @classmethod
+    def poll(cls, context):
+        props = context.scene.lod_tool_props
+        return props.has_lod_objects and props.auto_lod_enabled and props.camera is not None
+    def execute(self, context):
+        scene = context.scene
+        groups = bake_lod_schedule(scene)
+        self.report({'INFO'}, get_translation(context, "schedule_info", scene.frame_start, scene.frame_end, groups))
+        update_lod_selection(scene)
+        return {'FINISHED'}
+
+class LOD_OT_clear_schedule(bpy.types.Operator):
+    bl_idname = "lod.clear_schedule"
+    bl_label = "Clear LOD Schedule"
+    bl_options = {'REGISTER', 'UNDO'}
+    @classmethod
+    def poll(cls, context):
+        return "lod_schedule" in context.scene
+    def execute(self, context):
+        del context.scene["lod_schedule"]
+        invalidate_lod_schedule()
+        mark_positions_dirty()
+        update_lod_selection(context.scene)
+        return {'FINISHED'}
+
 class LOD_OT_update_manually(bpy.types.Operator):
     bl_idname = "lod.update_manually"
     bl_label = "Update Manually"
     bl_options = {'REGISTER', 'UNDO'}
     def execute(self, context):
+        # Re-check every object, including ones changed outside the add-on
+        reset_lod_shadow_state()
+        mark_positions_dirty()
         update_lod_selection(context.scene)
         return {'FINISHED'}
 
+@persistent
+def load_post_handler(*args):
+    # Scanned names belong to the previous file; msgbus subscriptions are cleared on load
+    LOD_SCAN_STATE.update(scene="", names=set(), data_count=-1)
+    # session_uids of the previous file never resolve again
+    LOD_GROUP_INDEX.clear()
+    LOD_OBJECT_BASES.clear()
+    publish_group_index(store=False)
+    reset_viewport_eye()
+    # Index stored in the file: auto LOD works without a rescan
+    scene = bpy.context.scene
+    if scene is not None:
+        ensure_group_index(scene)
+    subscribe_notifications()
+
+@persistent
+def shadow_reset_handler(*args):
+    # File load, undo and redo change object state behind the shadow table.
+    # Object references go stale, session_uids stay: only re-resolve handles
+    reset_lod_shadow_state()
+    reset_geometry_stats()
+    invalidate_object_map()
+    invalidate_lod_schedule()
+    invalidate_gn_instancers()
+    # Restored objects may differ from what the pending slices assume
+    cancel_lod_apply()
+    LOD_ENGINE.invalidate_applied()
+    LOD_COLLECTION_STATE["objects_clean"] = False
+    mark_positions_dirty()
+    # Undo may have restored or removed objects
+    LOD_UPDATE_STATE["reconcile"] = True
+
+def deferred_lod_update():
+    # Timer callback: one evaluation for a burst of depsgraph updates
+    scene = bpy.data.scenes.get(LOD_UPDATE_STATE["scene_name"])
+    if scene is not None:
+        # Pending group reconciliation runs inside update_lod_selection
+        update_lod_selection(scene, sliced=not bpy.app.background)
+    return None
+
+def schedule_lod_update(scene):
+    """Coalesce update requests into one timer call, at most once per update_interval."""
+    LOD_UPDATE_STATE["scene_name"] = scene.name
+    if bpy.app.timers.is_registered(deferred_lod_update):
+        return
+    elapsed = time.perf_counter() - LOD_UPDATE_STATE["last_run"]
+    delay = max(0.0, scene.lod_tool_props.update_interval - elapsed)
+    bpy.app.timers.register(deferred_lod_update, first_interval=delay)
+
+@persistent
 def lod_handler(scene, depsgraph):
-    # Called on any dependency graph update (e.g. object moved)
+    # Called on any dependency graph update: react only to geometry edits of LOD objects
+    # and to camera / LOD base transforms
     props = scene.lod_tool_props
-    if props.has_lod_objects and bpy.context.mode == 'OBJECT' and not bpy.context.active_operator:
-        update_lod_selection(scene)
+    # Skip echoes of our own visibility/color writes
+    ignored = set(LOD_WRITTEN_UIDS)
+    LOD_WRITTEN_UIDS.clear()
+    if LOD_UPDATE_STATE["applying"]:
+        return
+    # Object added, removed or linked: diff names once the burst of updates is over
+    tracked_scene = LOD_SCAN_STATE["scene"] == scene.name
+    if tracked_scene and len(bpy.data.objects) != LOD_SCAN_STATE["data_count"]:
+        LOD_UPDATE_STATE["reconcile"] = True
+    if not props.has_lod_objects and not LOD_UPDATE_STATE["reconcile"]:
+        return
+    object_mode = bpy.context.mode == 'OBJECT'
+    # Camera and base moves are covered by the baked schedule while it applies
+    # (culling still follows the camera)
+    track_transforms = (object_mode and props.auto_lod_enabled and has_lod_eye(props)
+                        and (active_lod_schedule(scene) is None or props.frustum_culling != 'NONE'))
+    if track_transforms and multi_camera_enabled(props) and not viewport_eye_active(props):
+        views = get_lod_views(scene)
+        camera_uids = {uid for (_, uid), _ in views}
+        camera_datas = {camera.data for _, camera in views}
+    else:
+        camera_uids = {props.camera.session_uid} if props.camera else set()
+        camera_datas = {props.camera.data} if props.camera else set()
+    relevant = False
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if isinstance(id_data, bpy.types.Object):
+            if id_data.session_uid in ignored:
+                continue
+            if tracked_scene and id_data.name not in LOD_SCAN_STATE["names"]:
+                LOD_UPDATE_STATE["reconcile"] = True
+        if update.is_updated_geometry and invalidate_geometry_stats(id_data):
+            # Refresh polycount totals (and the budget solve) once back in object mode
+            relevant = relevant or (object_mode and (props.show_polycount or
+                                                     (props.auto_lod_enabled and props.lod_metric == 'BUDGET')))
+            if isinstance(id_data, bpy.types.Object) and id_data.session_uid in LOD_BASE_INDEX:
+                # Bounding sphere of the group changed
+                mark_positions_dirty(LOD_BASE_INDEX[id_data.session_uid])
+        if track_transforms and (props.lod_metric != 'DISTANCE' or props.frustum_culling != 'NONE') and id_data in camera_datas:
+            # Lens / sensor change
+            relevant = True
+        if not track_transforms or not update.is_updated_transform or not isinstance(id_data, bpy.types.Object):
+            continue
+        if id_data.session_uid in camera_uids:
+            relevant = True
+        elif id_data.session_uid in LOD_BASE_INDEX:
+            # Moved base object: only its position is re-read
+            mark_positions_dirty(LOD_BASE_INDEX[id_data.session_uid])
+            relevant = True
+    if relevant or LOD_UPDATE_STATE["reconcile"]:
+        LOD_VIEW_STATE["switch_only"] = False
+        schedule_lod_update(scene)
+    elif track_transforms and multi_camera_enabled(props) and not viewport_eye_active(props) and active_view_key(scene, depsgraph) != LOD_VIEW_STATE["active"]:
+        # Scene camera or view layer changed
+        request_view_switch(scene)
 
+@persistent
 def frame_handler(scene, depsgraph):
     # Called on frame change (for animations)
     props = scene.lod_tool_props
-    if props.has_lod_objects and props.auto_lod_enabled and props.camera:
-        update_lod_selection(scene)
+    if props.has_lod_objects and props.auto_lod_enabled and has_lod_eye(props):
+        if active_lod_schedule(scene) is None:
+            # Base objects may be animated
+            mark_positions_dirty()
+        # With a baked schedule this is a lookup and a diff against the last frame
+        update_lod_selection(scene, depsgraph)
 
 classes = (
+    LODGroupItem,
     LODListItem,
     ThresholdItem,
+    LODViewItem,
     LODColorItem,
     LOD_Tool_Props,
     LOD_UL_items,
+    LOD_UL_groups,
+    LOD_UL_validation,
     LOD_OT_select_item,
     LOD_OT_scroll_lod_group,
     LOD_OT_set_active_lod,
+    LOD_OT_select_group,
     LOD_OT_refresh_groups,
     LOD_OT_auto_calculate_base,
     LOD_OT_update_manually,
+    LOD_OT_bake_schedule,
+    LOD_OT_clear_schedule,
+    LOD_OT_add_view_camera,
+    LOD_OT_remove_view_camera,
+    LOD_OT_add_gn_instancer,
+    LOD_OT_generate_lods,
+    LOD_OT_validate_chains,
+    LOD_OT_save_validation,
+    LOD_OT_export_groups,
     LOD_PT_description,
     LOD_PT_panel,
     LODManagerPreferences,
@@ -647,14 +3214,43 @@ def register():
             kmi.properties.direction = direction
     bpy.app.handlers.depsgraph_update_post.append(lod_handler)
     bpy.app.handlers.frame_change_post.append(frame_handler)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(shadow_reset_handler)
+    bpy.app.handlers.load_post.append(load_post_handler)
+    bpy.app.handlers.render_init.append(render_init_handler)
+    for handlers in (bpy.app.handlers.render_complete, bpy.app.handlers.render_cancel):
+        handlers.append(render_done_handler)
+    global LOD_DRAW_HANDLE
+    if not bpy.app.background:
+        LOD_DRAW_HANDLE = bpy.types.SpaceView3D.draw_handler_add(viewport_eye_draw, (), 'WINDOW', 'POST_PIXEL')
+    subscribe_notifications()
     print("LOD Manager registered.")
 
 def unregister():
+    if bpy.app.timers.is_registered(deferred_lod_update):
+        bpy.app.timers.unregister(deferred_lod_update)
+    cancel_lod_apply()
+    reset_viewport_eye()
+    global LOD_DRAW_HANDLE
+    if LOD_DRAW_HANDLE is not None:
+        bpy.types.SpaceView3D.draw_handler_remove(LOD_DRAW_HANDLE, 'WINDOW')
+        LOD_DRAW_HANDLE = None
     try:
         bpy.app.handlers.depsgraph_update_post.remove(lod_handler)
         bpy.app.handlers.frame_change_post.remove(frame_handler)
     except Exception:
         pass
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if shadow_reset_handler in handlers:
+            handlers.remove(shadow_reset_handler)
+    if load_post_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post_handler)
+    if render_init_handler in bpy.app.handlers.render_init:
+        bpy.app.handlers.render_init.remove(render_init_handler)
+    for handlers in (bpy.app.handlers.render_complete, bpy.app.handlers.render_cancel):
+        if render_done_handler in handlers:
+            handlers.remove(render_done_handler)
+    bpy.msgbus.clear_by_owner(LOD_MSGBUS_OWNER)
     wm = bpy.context.window_manager
     if kc := wm.keyconfigs.addon:
         if km := kc.keymaps.get('3D View'):
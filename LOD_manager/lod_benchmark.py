@@ -0,0 +1,252 @@
+"""Benchmarks of LOD Manager hot paths on generated scenes.
+
+    blender -b --factory-startup --python-expr "from LOD_manager import lod_benchmark; lod_benchmark.main()" -- \\
+        --groups 2000 --levels 4 --extras 1000 --baseline lod_baseline.json
+
+A scene with N groups x M LOD levels and K non-LOD meshes is generated
+(same seed, same scene), then refresh_lod_groups, update_lod_selection
+in manual and auto mode, lod_handler per depsgraph update and
+frame_handler per frame are timed. Results are JSON with percentiles
+and throughput. With --baseline, results are compared against the
+stored run for the same parameters and regressions fail the run;
+--update-baseline stores the current run instead.
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+import bpy
+import numpy as np
+
+from . import LOD_manager as manager
+
+# A case regresses when its median is this much slower than the baseline
+DEFAULT_TOLERANCE = 0.25
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="lod_benchmark", description="Benchmark LOD Manager hot paths.")
+    parser.add_argument("--groups", type=int, default=1000, help="LOD groups (N)")
+    parser.add_argument("--levels", type=int, default=4, help="LOD levels per group (M)")
+    parser.add_argument("--extras", type=int, default=500, help="Non-LOD meshes (K)")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quiet", action="store_true", help="Discard the add-on's print output while timing")
+    parser.add_argument("--output", help="Write the JSON results here (default: stdout)")
+    parser.add_argument("--baseline", help="Baseline JSON file to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run in the baseline file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def make_grid_mesh(name, resolution):
+    """Flat grid with resolution x resolution quads."""
+    steps = np.linspace(-1.0, 1.0, resolution + 1)
+    xs, ys = np.meshgrid(steps, steps)
+    verts = np.column_stack((xs.ravel(), ys.ravel(), np.zeros(xs.size))).tolist()
+    row = resolution + 1
+    faces = [(y * row + x, y * row + x + 1, (y + 1) * row + x + 1, (y + 1) * row + x)
+             for y in range(resolution) for x in range(resolution)]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    return mesh
+
+
+def build_scene(groups, levels, extras, seed):
+    """New scene with groups x levels LOD objects, extra meshes and an animated camera."""
+    rng = np.random.default_rng(seed)
+    scene = bpy.data.scenes.new(f"LOD Benchmark {groups}x{levels}+{extras}")
+    meshes = [make_grid_mesh(f"bench_LOD{lvl}", max(1, 32 >> lvl)) for lvl in range(levels)]
+    extra_mesh = make_grid_mesh("bench_extra", 4)
+    extent = max(10.0, np.sqrt(groups) * 5.0)
+    link = scene.collection.objects.link
+    for g, location in enumerate(rng.uniform(-extent, extent, (groups, 3)).tolist()):
+        for lvl, mesh in enumerate(meshes):
+            obj = bpy.data.objects.new(f"Bench{g:06d}_LOD{lvl}", mesh)
+            obj.location = location
+            link(obj)
+    for k, location in enumerate(rng.uniform(-extent, extent, (extras, 3)).tolist()):
+        obj = bpy.data.objects.new(f"Extra{k:06d}", extra_mesh)
+        obj.location = location
+        link(obj)
+    camera = bpy.data.objects.new("BenchCamera", bpy.data.cameras.new("BenchCamera"))
+    link(camera)
+    scene.camera = camera
+    scene.frame_start, scene.frame_end = 1, 100
+    camera.location = (-2.0 * extent, 0.0, 0.0)
+    camera.keyframe_insert("location", frame=1)
+    camera.location = (2.0 * extent, 0.0, 0.0)
+    camera.keyframe_insert("location", frame=100)
+    scene.frame_set(1)
+    return scene, camera, extent
+
+
+def summarize(samples):
+    """Percentiles (ms) and throughput of a list of durations in seconds."""
+    values = np.asarray(samples, dtype=np.float64) * 1000.0
+    if not len(values):
+        return {"count": 0}
+    return {
+        "count": int(len(values)),
+        "mean_ms": float(values.mean()),
+        "min_ms": float(values.min()),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p90_ms": float(np.percentile(values, 90)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+        "per_second": float(1000.0 / values.mean()) if values.mean() > 0 else None,
+    }
+
+
+def timed(fn, repeat, warmup=1, setup=None):
+    """Durations of repeat calls of fn; setup (untimed) runs before every call."""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+    samples = []
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+@contextlib.contextmanager
+def wrapped_handler(handlers, handler, samples):
+    """Replace a registered handler with a timing wrapper for the duration of the block."""
+    def timing_wrapper(*args):
+        start = time.perf_counter()
+        handler(*args)
+        samples.append(time.perf_counter() - start)
+    registered = handler in handlers
+    if registered:
+        handlers.remove(handler)
+    handlers.append(timing_wrapper)
+    try:
+        yield
+    finally:
+        handlers.remove(timing_wrapper)
+        if registered:
+            handlers.append(handler)
+
+
+def run_cases(scene, camera, extent, repeat):
+    props = scene.lod_tool_props
+    results = {}
+    results["refresh_lod_groups"] = timed(lambda: manager.refresh_lod_groups(scene), repeat)
+
+    # Manual mode: cycle the selected level like Ctrl+wheel does
+    props.auto_lod_enabled = False
+    state = {"level": 0}
+    def select_next_level():
+        state["level"] = (state["level"] + 1) % len(props.lod_list)
+        for i, item in enumerate(props.lod_list):
+            item.selected = (i == state["level"])
+        manager.update_lod_selection(scene)
+    manager.LOD_UPDATE_STATE["applying"] = True
+    try:
+        props.camera = camera
+    finally:
+        manager.LOD_UPDATE_STATE["applying"] = False
+    results["update_manual"] = timed(select_next_level, repeat)
+
+    # Auto mode: camera moves along x between updates. The location keyframes would
+    # override the moves, so the action is detached until the frame_handler case
+    props.auto_lod_enabled = True
+    view_layer = scene.view_layers[0]
+    action = camera.animation_data.action
+    camera.animation_data.action = None
+    steps = iter(np.linspace(-2.0 * extent, 2.0 * extent, repeat + 1).tolist() * 2)
+    def move_camera():
+        camera.location.x = next(steps)
+        # matrix_world is only updated by a depsgraph evaluation
+        view_layer.update()
+    results["update_auto"] = timed(lambda: manager.update_lod_selection(scene), repeat, setup=move_camera)
+    # Same pass with nothing changed (diff only)
+    results["update_auto_unchanged"] = timed(lambda: manager.update_lod_selection(scene), repeat)
+
+    # lod_handler per depsgraph update caused by a moving non-LOD object
+    samples = []
+    extra = next((obj for obj in scene.objects if obj.name.startswith("Extra")), camera)
+    with wrapped_handler(bpy.app.handlers.depsgraph_update_post, manager.lod_handler, samples):
+        for i in range(repeat):
+            extra.location.z += 0.01
+            view_layer.update()
+    results["lod_handler_extra_move"] = samples
+    samples = []
+    with wrapped_handler(bpy.app.handlers.depsgraph_update_post, manager.lod_handler, samples):
+        for i in range(repeat):
+            camera.location.y += 0.01
+            view_layer.update()
+    results["lod_handler_camera_move"] = samples
+
+    # frame_handler per frame of the camera animation
+    camera.animation_data.action = action
+    samples = []
+    with wrapped_handler(bpy.app.handlers.frame_change_post, manager.frame_handler, samples):
+        for frame in range(scene.frame_start, scene.frame_start + repeat):
+            scene.frame_set(frame)
+    results["frame_handler"] = samples
+    return {name: summarize(values) for name, values in results.items()}
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Cases whose median got slower than baseline * (1 + tolerance)."""
+    regressions = {}
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or "p50_ms" not in previous or "p50_ms" not in current:
+            continue
+        if current["p50_ms"] > previous["p50_ms"] * (1.0 + tolerance):
+            regressions[name] = {"baseline_p50_ms": previous["p50_ms"], "p50_ms": current["p50_ms"]}
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not hasattr(bpy.types.Scene, "lod_tool_props"):
+        manager.register()
+    scene, camera, extent = build_scene(args.groups, args.levels, args.extras, args.seed)
+    output = io.StringIO() if args.quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        results = run_cases(scene, camera, extent, args.repeat)
+    key = f"{args.groups}x{args.levels}+{args.extras}{' quiet' if args.quiet else ''}"
+    report = {
+        "blender": bpy.app.version_string,
+        "params": {"groups": args.groups, "levels": args.levels, "extras": args.extras,
+                   "repeat": args.repeat, "seed": args.seed, "quiet": args.quiet},
+        "key": key,
+        "results": results,
+    }
+    failed = False
+    if args.baseline:
+        try:
+            with open(args.baseline) as f:
+                baselines = json.load(f)
+        except FileNotFoundError:
+            baselines = {}
+        if args.update_baseline:
+            baselines[key] = results
+            with open(args.baseline, "w") as f:
+                json.dump(baselines, f, indent=2)
+        elif key in baselines:
+            report["regressions"] = compare_to_baseline(results, baselines[key], args.tolerance)
+            failed = bool(report["regressions"])
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    if bpy.app.background:
+        sys.exit(1 if failed else 0)
+    return report
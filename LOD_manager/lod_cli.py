@@ -0,0 +1,202 @@
+"""Headless LOD refresh / apply / report for LOD Manager.
+
+One file (runs inside the Blender process that opened it):
+
+    blender -b scene.blend --python-expr "from LOD_manager import lod_cli; lod_cli.main()" -- --camera Camera
+
+Many files (one background Blender per worker process):
+
+    blender -b --python-expr "from LOD_manager import lod_cli; lod_cli.main()" -- \\
+        --files a.blend b.blend --jobs 8 --level 1 --report report.json
+
+The report is JSON: per file and scene, the LOD groups with per-LOD
+statistics, the visible LOD of every group and the polycount summary.
+Nothing here uses UI context (areas, panels, operators).
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from . import LOD_manager as manager
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="lod_cli", description="Refresh, apply and report LOD groups headless.")
+    parser.add_argument("--files", nargs="*", default=[], help=".blend files to process in worker processes")
+    parser.add_argument("--file-list", help="Text file with one .blend path per line")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--blender", default=bpy.app.binary_path, help="Blender executable for the workers")
+    parser.add_argument("--scene", help="Only this scene (default: all scenes)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--camera", help="Auto LOD for this camera object")
+    mode.add_argument("--level", type=int, action="append", help="Manual mode: show this LOD level (repeatable)")
+    parser.add_argument("--save", action="store_true", help="Save the applied visibility back to the file")
+    parser.add_argument("--report", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def ensure_registered():
+    # The add-on may be importable without being enabled in this Blender
+    if not hasattr(bpy.types.Scene, "lod_tool_props"):
+        manager.register()
+
+
+def apply_scene(scene, args):
+    """Refresh groups and apply auto (camera) or manual (levels) LOD to a scene, without UI context."""
+    props = scene.lod_tool_props
+    manager.refresh_lod_groups(scene)
+    if not props.has_lod_objects:
+        return
+    # Property update callbacks would re-apply on every assignment
+    manager.LOD_UPDATE_STATE["applying"] = True
+    try:
+        if args.camera:
+            camera = scene.objects.get(args.camera)
+            if camera is None or camera.type != 'CAMERA':
+                raise ValueError(f"camera '{args.camera}' not found in scene '{scene.name}'")
+            props.camera = camera
+            props.auto_lod_enabled = True
+        elif args.level:
+            props.auto_lod_enabled = False
+            for item in props.lod_list:
+                item.selected = int(item.name[3:]) in args.level
+    finally:
+        manager.LOD_UPDATE_STATE["applying"] = False
+    manager.update_lod_selection(scene)
+
+
+def scene_report(scene):
+    props = scene.lod_tool_props
+    stats = manager.STATS_TABLE
+    groups = []
+    if props.has_lod_objects:
+        values = stats["values"]
+        visible_lods = manager.LOD_ENGINE.lod_indices if props.auto_lod_enabled else None
+        for g, group in enumerate(manager.LOD_GROUPS_CACHE):
+            lods = []
+            for i, (lod_num, uid) in enumerate(group['lods']):
+                lod_obj = manager.resolve(uid)
+                entry = {"level": lod_num, "object": lod_obj.name if lod_obj else None}
+                entry.update(zip(manager.STAT_FIELDS, values[g, i].tolist()))
+                lods.append(entry)
+            report = {"base_name": group['base_name'], "lods": lods}
+            if visible_lods is not None and g < len(visible_lods):
+                # -1: culled, no LOD visible
+                lod_index = int(visible_lods[g])
+                report["visible_level"] = group['lods'][lod_index][0] if lod_index >= 0 else None
+            groups.append(report)
+    polycount = manager.POLYCOUNT_STATS
+    return {
+        "scene": scene.name,
+        "mode": "auto" if props.auto_lod_enabled else "manual",
+        "camera": props.camera.name if props.camera else None,
+        "levels": [item.name for item in props.lod_list],
+        "group_count": len(groups),
+        "groups": groups,
+        "polycount": {
+            "levels": [
+                {"level": lvl, "total": dict(zip(manager.STAT_FIELDS, total)), "visible": dict(zip(manager.STAT_FIELDS, visible))}
+                for lvl, total, visible in polycount["levels"]
+            ],
+            "visible": dict(zip(manager.STAT_FIELDS, polycount["visible"])) if polycount["visible"] else None,
+        },
+    }
+
+
+def process_current_file(args):
+    """Refresh, apply and report every (or the chosen) scene of the open file."""
+    ensure_registered()
+    start = time.perf_counter()
+    scenes = [bpy.data.scenes[args.scene]] if args.scene else list(bpy.data.scenes)
+    reports = []
+    for scene in scenes:
+        apply_scene(scene, args)
+        reports.append(scene_report(scene))
+    if args.save:
+        bpy.ops.wm.save_mainfile()
+    return {"file": bpy.data.filepath, "ok": True, "scenes": reports, "seconds": time.perf_counter() - start}
+
+
+def worker_command(args, path, report_path):
+    command = [args.blender, "-b", path, "-noaudio",
+               "--python-expr", f"from {__package__} import lod_cli; lod_cli.main()",
+               "--", "--worker", "--report", report_path]
+    if args.scene:
+        command += ["--scene", args.scene]
+    if args.camera:
+        command += ["--camera", args.camera]
+    for level in args.level or ():
+        command += ["--level", str(level)]
+    if args.save:
+        command.append("--save")
+    return command
+
+
+def run_worker(args, path, tmp_dir, index):
+    report_path = os.path.join(tmp_dir, f"report_{index}.json")
+    log_path = os.path.join(tmp_dir, f"worker_{index}.log")
+    with open(log_path, "w") as log:
+        returncode = subprocess.call(worker_command(args, path, report_path), stdout=log, stderr=subprocess.STDOUT)
+    if os.path.exists(report_path):
+        # Also written by a worker that failed on the file itself
+        with open(report_path) as f:
+            return json.load(f)
+    with open(log_path) as log:
+        tail = log.read()[-2000:]
+    return {"file": path, "ok": False, "returncode": returncode, "log": tail}
+
+
+def process_files(args, paths):
+    """One background Blender per file, at most args.jobs at a time."""
+    jobs = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="lod_cli_") as tmp_dir:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(lambda item: run_worker(args, item[1], tmp_dir, item[0]), enumerate(paths)))
+    return {
+        "files": results,
+        "failed": sum(1 for result in results if not result["ok"]),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def write_report(report, path):
+    text = json.dumps(report, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = list(args.files)
+    if args.file_list:
+        with open(args.file_list) as f:
+            paths += [line.strip() for line in f if line.strip()]
+    if paths and not args.worker:
+        report = process_files(args, paths)
+        failed = report["failed"]
+    else:
+        try:
+            report = process_current_file(args)
+            failed = 0
+        except Exception as e:
+            report = {"file": bpy.data.filepath, "ok": False, "error": f"{type(e).__name__}: {e}"}
+            failed = 1
+    write_report(report, args.report)
+    if bpy.app.background:
+        sys.exit(1 if failed else 0)
+    return report
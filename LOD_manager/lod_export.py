@@ -0,0 +1,271 @@
+"""LOD group export for LOD Manager: one FBX / glTF file per group, in background Blender workers.
+
+This module is imported by the add-on and is also the script run by the
+workers (blender -b --python lod_export.py -- ...), like lod_workers.
+
+A job is a dict {"base": base name, "lods": [[object name, level], ...],
+"matrices": [16 floats per object, world space]}. Every group is
+written as an empty named <prefix><base> with its LODs as children
+named <prefix><base>_LOD0.._LODn (contiguous, in level order), the
+naming Unity and Unreal pick up as a LOD chain.
+
+Headless, for the open file:
+
+    blender -b scene.blend --python-expr "from LOD_manager import lod_export; lod_export.main()" -- \\
+        --output export/ --format GLTF --jobs 8 --validate
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+import bpy
+from mathutils import Matrix
+
+try:
+    from . import lod_workers
+except ImportError:
+    # Run as a worker script
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import lod_workers
+
+FORMAT_EXTENSIONS = {"FBX": ".fbx", "GLTF": ".glb"}
+
+
+def export_name(prefix, base_name, index=None):
+    name = f"{prefix}{base_name}"
+    return name if index is None else f"{name}_LOD{index}"
+
+
+def export_path(directory, prefix, base_name, file_format):
+    # Base names may contain characters that are not valid in file names
+    safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in export_name(prefix, base_name))
+    return os.path.join(directory, safe + FORMAT_EXTENSIONS[file_format])
+
+
+def group_jobs(groups, resolve):
+    """Export jobs for LOD groups ({"base_name", "lods": [(lod_num, uid)]}) of the current file."""
+    jobs = []
+    for group in groups:
+        lods = []
+        matrices = []
+        for lod_num, uid in group['lods']:
+            obj = resolve(uid)
+            if obj is not None and obj.type == 'MESH':
+                lods.append([obj.name, lod_num])
+                matrices.append([v for row in obj.matrix_world for v in row])
+        if lods:
+            jobs.append({"base": group['base_name'], "lods": lods, "matrices": matrices})
+    return jobs
+
+
+def export_group(scene, job, objects, options):
+    """Write one group to its file. Returns its manifest entry.
+
+    The group's objects are the only ones linked to the scene while the
+    exporter runs, and are removed afterwards.
+    """
+    prefix = options["prefix"]
+    path = export_path(options["directory"], prefix, job["base"], options["format"])
+    entry = {"group": job["base"], "file": path, "ok": False, "lods": []}
+    lods = [(objects[name], level, matrix) for (name, level), matrix in zip(job["lods"], job["matrices"])
+            if name in objects]
+    if not lods:
+        entry["error"] = "no objects"
+        return entry
+    root_name = export_name(prefix, job["base"])
+    existing = bpy.data.objects.get(root_name)
+    if existing is not None:
+        # Original parent loaded along with the LODs: the exported root takes its name
+        existing.name = f"{root_name}_source"
+    root = bpy.data.objects.new(root_name, None)
+    scene.collection.objects.link(root)
+    # Assets are exported around the LOD0 origin unless asked otherwise
+    origin = Matrix([lods[0][2][i:i + 4] for i in range(0, 16, 4)])
+    offset = Matrix.Translation(-origin.translation) if options["center"] else Matrix.Identity(4)
+    linked = []
+    for index, (obj, level, matrix) in enumerate(sorted(lods, key=lambda item: item[1])):
+        obj.parent = None
+        obj.matrix_world = offset @ Matrix([matrix[i:i + 4] for i in range(0, 16, 4)])
+        obj.name = export_name(prefix, job["base"], index)
+        if obj.data.users == 1:
+            obj.data.name = obj.name
+        scene.collection.objects.link(obj)
+        obj.parent = root
+        linked.append((obj, level, index))
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj, level, index in linked:
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        entry["lods"].append({"name": obj.name, "level": index, "source_level": level,
+                              "tris": lod_workers.count_tris(mesh), "verts": len(mesh.vertices)})
+        evaluated.to_mesh_clear()
+    try:
+        if options["format"] == 'FBX':
+            bpy.ops.export_scene.fbx(filepath=path, use_selection=False, object_types={'EMPTY', 'MESH'},
+                                     use_mesh_modifiers=True, bake_anim=False)
+        else:
+            bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', use_selection=False, export_apply=True)
+        entry["ok"] = True
+    except RuntimeError as e:
+        entry["error"] = str(e)
+    for obj, _, _ in linked:
+        bpy.data.objects.remove(obj)
+    bpy.data.objects.remove(root)
+    return entry
+
+
+def start_export(jobs, options, workers):
+    """Start background Blender workers, one shard of jobs each. Does not wait for them.
+
+    Returns the run state for poll_export / finish_export / cancel_export.
+    """
+    os.makedirs(options["directory"], exist_ok=True)
+    workers = max(1, min(workers, len(jobs)))
+    shards = [jobs[i::workers] for i in range(workers)]
+    tmp_dir = tempfile.mkdtemp(prefix="lod_export_")
+    processes = []
+    for i, shard in enumerate(shards):
+        source_path = os.path.join(tmp_dir, f"shard_{i}_source.blend")
+        jobs_path = os.path.join(tmp_dir, f"shard_{i}_jobs.json")
+        manifest_path = os.path.join(tmp_dir, f"shard_{i}_manifest.json")
+        log_path = os.path.join(tmp_dir, f"shard_{i}.log")
+        objects = {bpy.data.objects[name] for job in shard for name, _ in job["lods"]}
+        bpy.data.libraries.write(source_path, objects, fake_user=True)
+        with open(jobs_path, "w") as f:
+            json.dump({"options": options, "jobs": shard}, f)
+        with open(log_path, "w") as log:
+            process = subprocess.Popen(
+                [bpy.app.binary_path, "-b", "--factory-startup", "-noaudio", "--python", __file__,
+                 "--", source_path, jobs_path, manifest_path],
+                stdout=log, stderr=subprocess.STDOUT,
+            )
+        processes.append((process, shard, manifest_path, log_path))
+    return {"tmp_dir": tmp_dir, "processes": processes, "options": options, "start": time.perf_counter()}
+
+
+def poll_export(run):
+    """(finished workers, all workers)."""
+    finished = sum(1 for process, _, _, _ in run["processes"] if process.poll() is not None)
+    return finished, len(run["processes"])
+
+
+def finish_export(run):
+    """Merge the shard manifests, write manifest.json next to the files and clean up. Returns the manifest."""
+    files = []
+    try:
+        for process, shard, manifest_path, log_path in run["processes"]:
+            process.wait()
+            if os.path.exists(manifest_path):
+                with open(manifest_path) as f:
+                    files.extend(json.load(f))
+                continue
+            with open(log_path) as log:
+                tail = log.read()[-2000:]
+            files.extend({"group": job["base"], "ok": False, "returncode": process.returncode, "log": tail}
+                         for job in shard)
+    finally:
+        shutil.rmtree(run["tmp_dir"], ignore_errors=True)
+    manifest = {
+        "format": run["options"]["format"],
+        "directory": run["options"]["directory"],
+        "files": files,
+        "failed": sum(1 for entry in files if not entry["ok"]),
+        "seconds": time.perf_counter() - run["start"],
+    }
+    with open(os.path.join(run["options"]["directory"], "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def cancel_export(run):
+    for process, _, _, _ in run["processes"]:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    shutil.rmtree(run["tmp_dir"], ignore_errors=True)
+
+
+def run_export(jobs, options, workers):
+    """start_export and wait for all workers."""
+    run = start_export(jobs, options, workers)
+    while poll_export(run)[0] < len(run["processes"]):
+        time.sleep(0.1)
+    return finish_export(run)
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="lod_export", description="Export every LOD group to its own file.")
+    parser.add_argument("--output", required=True, help="Output directory")
+    parser.add_argument("--format", choices=sorted(FORMAT_EXTENSIONS), default="FBX")
+    parser.add_argument("--scene", help="Scene to export (default: the active scene)")
+    parser.add_argument("--groups", nargs="*", help="Only these base names (default: all groups)")
+    parser.add_argument("--prefix", default="", help="Prefix of exported names, e.g. SM_")
+    parser.add_argument("--no-center", action="store_true", help="Keep world positions instead of the LOD0 origin")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate the LOD chains first; write validation.json and export nothing if a group is flagged")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from . import LOD_manager as manager
+    args = parse_args(argv)
+    if not hasattr(bpy.types.Scene, "lod_tool_props"):
+        manager.register()
+    scene = bpy.data.scenes[args.scene] if args.scene else bpy.context.scene
+    manager.refresh_lod_groups(scene)
+    groups = manager.LOD_GROUPS_CACHE
+    rows = None
+    if args.groups:
+        wanted = set(args.groups)
+        rows = [row for row, group in enumerate(groups) if group['base_name'] in wanted]
+        groups = [groups[row] for row in rows]
+    # Only the groups being exported are validated and reported
+    if args.validate and manager.validate_lod_chains(scene, groups=rows):
+        os.makedirs(args.output, exist_ok=True)
+        report = manager.validation_report_json()
+        with open(os.path.join(args.output, "validation.json"), "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"LOD validation failed: {report['flagged']} of {report['checked']} groups flagged, nothing exported")
+        if bpy.app.background:
+            sys.exit(1)
+        return report
+    jobs = group_jobs(groups, manager.resolve)
+    options = {"directory": os.path.abspath(args.output), "format": args.format,
+               "prefix": args.prefix, "center": not args.no_center}
+    manifest = run_export(jobs, options, args.jobs or os.cpu_count() or 1) if jobs else {"files": [], "failed": 0}
+    print(json.dumps({key: value for key, value in manifest.items() if key != "files"}, indent=2))
+    if bpy.app.background:
+        sys.exit(1 if manifest["failed"] else 0)
+    return manifest
+
+
+def worker_main(argv):
+    # blender -b --factory-startup --python lod_export.py -- <source.blend> <jobs.json> <manifest.json>
+    source_path, jobs_path, manifest_path = argv[argv.index("--") + 1:][:3]
+    with open(jobs_path) as f:
+        params = json.load(f)
+    with bpy.data.libraries.load(source_path, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    # Library names are the original names, loaded objects may have been renamed
+    objects = {name: obj for name, obj in zip(data_from.objects, data_to.objects) if obj is not None}
+    scene = bpy.context.scene
+    # Factory startup objects (cube, camera, light) must not end up in the files
+    for obj in list(scene.objects):
+        bpy.data.objects.remove(obj)
+    entries = [export_group(scene, job, objects, params["options"]) for job in params["jobs"]]
+    with open(manifest_path, "w") as f:
+        json.dump(entries, f)
+    print(f"LOD export worker: {sum(1 for entry in entries if entry['ok'])} of {len(entries)} groups written")
+
+
+if __name__ == "__main__":
+    worker_main(sys.argv)
@@ -0,0 +1,640 @@
+"""Vectorized LOD evaluation for LOD Manager.
+
+This module has no bpy dependency: LOD_manager.py fills the arrays from
+Blender objects and applies the results back to the scene.
+"""
+
+import numpy as np
+
+# Re-evaluating more than this share of groups incrementally is no cheaper than a full pass
+INCREMENTAL_MAX_FRACTION = 0.25
+# Applied LOD index of a group that must be written on the next pass (-1 is a valid result: culled)
+UNAPPLIED = -2
+# Switch frame of a group that never switched: its first switch is never held by dwell time
+NEVER_SWITCHED = np.iinfo(np.int64).min // 2
+
+
+class RadialIndex:
+    """Spatial index of group base positions around a reference camera.
+
+    Groups are sorted by their distance to the reference point, so every
+    group within a spherical shell (r - w <= d <= r + w) is a contiguous
+    slice found with two binary searches.
+    """
+
+    def __init__(self, center, distances):
+        self.center = np.asarray(center, dtype=np.float64).reshape(3)
+        self.order = np.argsort(distances, kind='stable')
+        self.sorted_distances = distances[self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def query_shells(self, radii, half_width):
+        """Indices of groups whose reference distance is within half_width of any radius."""
+        radii = np.asarray(radii, dtype=np.float64)
+        lo = np.searchsorted(self.sorted_distances, radii - half_width, side='left')
+        hi = np.searchsorted(self.sorted_distances, radii + half_width, side='right')
+        slices = [self.order[a:b] for a, b in zip(lo.tolist(), hi.tolist()) if b > a]
+        if not slices:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(slices))
+
+    def query_beyond(self, radius):
+        """Indices of groups whose reference distance is >= radius."""
+        start = np.searchsorted(self.sorted_distances, radius, side='left')
+        return self.order[start:]
+
+
+class LODEngine:
+    """Contiguous per-group arrays and batched auto-LOD evaluation."""
+
+    # Arrays with one row per group, patched by append_group / remove_group
+    GROUP_ARRAYS = ("positions", "max_index", "distances", "centers", "radii", "coverage", "lod_indices",
+                    "raw_indices", "state_indices", "switch_frames", "applied_indices")
+
+    def __init__(self):
+        self.rebuild([])
+
+    def __len__(self):
+        return len(self.max_index)
+
+    def rebuild(self, max_indices):
+        """Reallocate arrays for a new list of groups (order = LOD_GROUPS_CACHE order)."""
+        count = len(max_indices)
+        # float32 like mathutils.Vector, so distances match the per-group loop exactly
+        self.positions = np.zeros((count, 3), dtype=np.float32)
+        self.max_index = np.asarray(max_indices, dtype=np.int64).reshape(count)
+        self.distances = np.zeros(count, dtype=np.float64)
+        # World-space bounding spheres of the base objects (screen size metric)
+        self.centers = np.zeros((count, 3), dtype=np.float64)
+        self.radii = np.zeros(count, dtype=np.float64)
+        self.coverage = np.zeros(count, dtype=np.float64)
+        self.lod_indices = np.zeros(count, dtype=np.int64)
+        self.base_distance = 0.0
+        self.thresholds = np.zeros(0, dtype=np.float64)
+        self.margins = np.zeros(0, dtype=np.float64)
+        self.raw_indices = self.lod_indices
+        # Per-group hysteresis state, persists between evaluations
+        self.state_indices = None
+        self.switch_frames = np.full(count, NEVER_SWITCHED, dtype=np.int64)
+        self.applied_indices = None
+        self.culled_count = 0
+        # Per view (camera / view layer) hysteresis state and results
+        self.view_states = {}
+        self.view_results = {}
+        # Result of the last triangle budget solve
+        self.budget_tris = None
+        self.budget_error = 0.0
+        self.invalidate_reference()
+
+    def set_position(self, index, location):
+        location = np.asarray(location, dtype=np.float32)
+        if not np.array_equal(self.positions[index], location):
+            self.positions[index] = location
+            self.invalidate_reference()
+
+    def set_bounds(self, index, matrix_world, bound_box):
+        """Bounding sphere of a group from its base object's local bound box corners."""
+        matrix = np.asarray(matrix_world, dtype=np.float64).reshape(4, 4)
+        corners = np.asarray(bound_box, dtype=np.float64).reshape(8, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        center = corners.mean(axis=0)
+        self.centers[index] = center
+        self.radii[index] = np.sqrt(((corners - center) ** 2).sum(axis=1).max())
+
+    def set_transforms(self, rows, matrices, bound_boxes):
+        """Positions and bounding spheres of many groups at once (set_position and set_bounds, vectorized).
+
+        matrices are the base objects' (n, 4, 4) world matrices, bound_boxes
+        their (n, 8, 3) local bound box corners.
+        """
+        matrices = np.asarray(matrices)
+        positions = matrices[:, :3, 3].astype(np.float32)
+        if not np.array_equal(self.positions[rows], positions):
+            self.positions[rows] = positions
+            self.invalidate_reference()
+        matrices = matrices.astype(np.float64)
+        corners = (np.asarray(bound_boxes, dtype=np.float64) @ matrices[:, :3, :3].transpose(0, 2, 1)
+                   + matrices[:, None, :3, 3])
+        centers = corners.mean(axis=1)
+        self.centers[rows] = centers
+        self.radii[rows] = np.sqrt(((corners - centers[:, None, :]) ** 2).sum(axis=2).max(axis=1))
+
+    def invalidate_reference(self):
+        """Drop the spatial index, the next evaluation is a full pass."""
+        self.index = None
+        self.reference_lods = None
+        self.reference_distances = None
+        self.reference_key = None
+        self.last_pass = "full"
+        self.candidate_count = len(self.max_index)
+
+    def compute_distances(self, camera_loc):
+        """Distances from camera to every base object.
+
+        Subtraction is done in float32 and the length in float64, which is
+        what (Vector - Vector).length does, so results are bit-identical.
+        """
+        camera = np.asarray(camera_loc, dtype=np.float32).reshape(3)
+        delta = (self.positions - camera).astype(np.float64)
+        return np.sqrt(np.einsum('ij,ij->i', delta, delta))
+
+    def compute_distances_for(self, camera_loc, indices):
+        """Same as compute_distances for a subset of groups."""
+        camera = np.asarray(camera_loc, dtype=np.float32).reshape(3)
+        delta = (self.positions[indices] - camera).astype(np.float64)
+        return np.sqrt(np.einsum('ij,ij->i', delta, delta))
+
+    def evaluate(self, camera_loc, threshold_percents, fallback_base, dynamic_base=True,
+                 margin_percents=None, dwell_frames=0, frame=0):
+        """Compute distances, base distance and LOD index of every group.
+
+        Uses the spatial index when possible and falls back to a full pass
+        when positions, thresholds or the base distance changed. The raw
+        result is then stabilized with hysteresis margins and dwell time.
+        """
+        percents = np.asarray(threshold_percents, dtype=np.float64)
+        if margin_percents is None:
+            margins = np.zeros(len(percents), dtype=np.float64)
+        else:
+            margins = np.asarray(margin_percents, dtype=np.float64)
+        key = (tuple(percents.tolist()), tuple(margins.tolist()), fallback_base, dynamic_base)
+        raw = None
+        if self.index is not None and len(self.index) and self.reference_key == key:
+            raw = self._evaluate_incremental(camera_loc, dynamic_base, fallback_base)
+        if raw is None:
+            raw = self._evaluate_full(camera_loc, percents, margins, fallback_base, dynamic_base)
+            self.reference_key = key
+        self.raw_indices = raw
+        self.lod_indices = self._stabilize(raw, dwell_frames, frame)
+        return self.lod_indices
+
+    def _base_distance(self, max_distance, fallback_base, dynamic_base):
+        if not dynamic_base:
+            return fallback_base
+        return max(max_distance, 1.0) if max_distance > 0.0 else fallback_base
+
+    def _raw_lods(self, distances, max_index):
+        # Number of thresholds passed == LOD index (same as "distance >= thr" loop)
+        return np.minimum(np.searchsorted(self.thresholds, distances, side='right'), max_index)
+
+    def _evaluate_full(self, camera_loc, percents, margins, fallback_base, dynamic_base):
+        distances = self.compute_distances(camera_loc)
+        max_distance = float(distances.max()) if len(distances) else 0.0
+        base_distance = self._base_distance(max_distance, fallback_base, dynamic_base)
+        order = np.argsort(percents, kind='stable')
+        self.thresholds = np.sort(percents / 100.0 * base_distance)
+        self.margins = (margins / 100.0 * base_distance)[order]
+        self.base_distance = base_distance
+        self.distances = distances
+        lod_indices = self._raw_lods(distances, self.max_index)
+        # The evaluated camera becomes the reference of the spatial index
+        self.index = RadialIndex(np.asarray(camera_loc, dtype=np.float32), distances)
+        self.reference_lods = lod_indices
+        self.reference_distances = distances
+        self.last_pass = "full"
+        self.candidate_count = len(lod_indices)
+        return lod_indices
+
+    def _evaluate_incremental(self, camera_loc, dynamic_base, fallback_base):
+        """Re-evaluate only groups that may have crossed a threshold since the reference pass.
+
+        A group's distance changes by at most the camera offset from the
+        reference, so only groups in shells of that width around each
+        threshold radius (and each hysteresis edge) can change LOD.
+        Returns None if a full pass is needed.
+        """
+        camera = np.asarray(camera_loc, dtype=np.float32).reshape(3)
+        offset = float(np.linalg.norm(camera.astype(np.float64) - self.index.center))
+        # Slack for float32 rounding in the distance computation
+        scale = float(np.abs(self.positions).max(initial=0.0)) + float(np.abs(camera).max())
+        width = offset + 1e-6 * scale + 1e-9
+        if dynamic_base:
+            # The farthest group can only be among groups within 2 * offset of the old maximum
+            far = self.index.query_beyond(self.index.sorted_distances[-1] - 2.0 * width)
+            max_distance = float(self.compute_distances_for(camera, far).max()) if len(far) else 0.0
+            if self._base_distance(max_distance, fallback_base, dynamic_base) != self.base_distance:
+                # Dynamic base distance rescales every band
+                return None
+        radii = np.concatenate((self.thresholds, self.thresholds - self.margins, self.thresholds + self.margins))
+        candidates = self.index.query_shells(np.unique(radii), width)
+        if len(candidates) > INCREMENTAL_MAX_FRACTION * len(self.max_index):
+            return None
+        distances = self.reference_distances.copy()
+        lod_indices = self.reference_lods.copy()
+        if len(candidates):
+            exact = self.compute_distances_for(camera, candidates)
+            distances[candidates] = exact
+            lod_indices[candidates] = self._raw_lods(exact, self.max_index[candidates])
+        self.distances = distances
+        self.last_pass = "incremental"
+        self.candidate_count = len(candidates)
+        return lod_indices
+
+    def compute_coverage(self, camera_loc, focal_pixels=None, ortho_pixels_per_unit=None):
+        """Projected bounding sphere diameter of every group in pixels.
+
+        Perspective: 2 * r * focal / d with focal = (fit resolution / 2) / tan(fov / 2).
+        Orthographic: 2 * r * (fit resolution / ortho_scale).
+        """
+        if ortho_pixels_per_unit is not None:
+            return 2.0 * self.radii * ortho_pixels_per_unit
+        delta = self.centers - np.asarray(camera_loc, dtype=np.float64).reshape(3)
+        distances = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+        # Camera inside the sphere: treat as full coverage at distance r
+        distances = np.maximum(distances, np.maximum(self.radii, 1e-6))
+        return 2.0 * self.radii * focal_pixels / distances
+
+    def evaluate_screen_size(self, camera_loc, threshold_pixels, margin_percents=None,
+                             focal_pixels=None, ortho_pixels_per_unit=None, dwell_frames=0, frame=0):
+        """LOD index of every group from its pixel coverage (one full vectorized pass).
+
+        LOD i + 1 is used once coverage drops to threshold_pixels[i] or below.
+        Internally the metric is -coverage so thresholds, hysteresis and
+        dwell work exactly as for distances. Margins are a percentage of
+        each pixel threshold.
+        """
+        pixels = np.asarray(threshold_pixels, dtype=np.float64)
+        if margin_percents is None:
+            margins = np.zeros(len(pixels), dtype=np.float64)
+        else:
+            margins = np.asarray(margin_percents, dtype=np.float64) / 100.0 * pixels
+        coverage = self.compute_coverage(camera_loc, focal_pixels, ortho_pixels_per_unit)
+        order = np.argsort(-pixels, kind='stable')
+        self.thresholds = -pixels[order]
+        self.margins = margins[order]
+        self.distances = -coverage
+        self.coverage = coverage
+        raw = self._raw_lods(self.distances, self.max_index)
+        # The radial index only applies to the distance metric
+        self.invalidate_reference()
+        self.raw_indices = raw
+        self.lod_indices = self._stabilize(raw, dwell_frames, frame)
+        return self.lod_indices
+
+    def evaluate_budget(self, camera_loc, tris, budget, focal_pixels=None, ortho_pixels_per_unit=None,
+                        dwell_frames=0, frame=0):
+        """LOD index of every group keeping the total triangle count within budget (see solve_budget).
+
+        tris is a (groups, slots) array of triangle counts per LOD slot,
+        inf for LODs whose object is missing.
+        """
+        coverage = self.compute_coverage(camera_loc, focal_pixels, ortho_pixels_per_unit)
+        tris = np.asarray(tris, dtype=np.float64)
+        raw = solve_budget(coverage, tris, budget, self.max_index)
+        # No thresholds: dwell time still applies, hysteresis does not
+        self.thresholds = np.zeros(0, dtype=np.float64)
+        self.margins = np.zeros(0, dtype=np.float64)
+        self.distances = -coverage
+        self.coverage = coverage
+        self.invalidate_reference()
+        self.raw_indices = raw
+        self.lod_indices = self._stabilize(raw, dwell_frames, frame)
+        self.budget_tris, self.budget_error = budget_usage(coverage, tris, self.lod_indices)
+        return self.lod_indices
+
+    def view_distances(self, camera_locs):
+        """(views, groups) distances from every camera to every base object in one broadcast."""
+        cameras = np.asarray(camera_locs, dtype=np.float32).reshape(-1, 3)
+        delta = (self.positions[None, :, :] - cameras[:, None, :]).astype(np.float64)
+        return np.sqrt(np.einsum('vij,vij->vi', delta, delta))
+
+    def view_coverage(self, camera_locs, pixel_scales, ortho):
+        """(views, groups) projected bounding sphere diameters in pixels.
+
+        pixel_scales holds focal pixels for perspective views and pixels
+        per unit for orthographic views (ortho is a per view bool).
+        """
+        cameras = np.asarray(camera_locs, dtype=np.float64).reshape(-1, 3)
+        delta = self.centers[None, :, :] - cameras[:, None, :]
+        distances = np.sqrt(np.einsum('vij,vij->vi', delta, delta))
+        distances = np.maximum(distances, np.maximum(self.radii, 1e-6)[None, :])
+        diameters = 2.0 * self.radii[None, :] * np.asarray(pixel_scales, dtype=np.float64)[:, None]
+        return np.where(np.asarray(ortho, dtype=bool)[:, None], diameters, diameters / distances)
+
+    def evaluate_views(self, keys, metrics, thresholds, margins, raw=None, dwell_frames=0, frame=0):
+        """LOD indices of several views from one (views, groups) metric matrix.
+
+        metrics holds distances (or -coverage for screen size), thresholds
+        and margins are (views, thresholds) arrays in ascending order; raw
+        replaces the threshold count (triangle budget). Hysteresis and
+        dwell state is kept per view key. Returns key -> LOD indices.
+        """
+        metrics = np.asarray(metrics, dtype=np.float64)
+        if raw is None:
+            # Thresholds passed per view and group (same as searchsorted(side='right'))
+            raw = np.minimum((metrics[:, :, None] >= thresholds[:, None, :]).sum(axis=2), self.max_index[None, :])
+        results = {}
+        for v, key in enumerate(keys):
+            state, switch_frames = self.view_states.get(key, (None, None))
+            if state is None or len(state) != len(self.max_index):
+                switch_frames = np.full(len(self.max_index), NEVER_SWITCHED, dtype=np.int64)
+            state = stabilize_lods(raw[v], state, switch_frames, metrics[v], thresholds[v], margins[v],
+                                   self.max_index, dwell_frames, frame)
+            self.view_states[key] = (state, switch_frames)
+            results[key] = state.copy()
+        self.view_results = results
+        return results
+
+    def _stabilize(self, raw, dwell_frames, frame):
+        if self.state_indices is None or len(self.state_indices) != len(raw):
+            self.switch_frames = np.full(len(raw), NEVER_SWITCHED, dtype=np.int64)
+        stable = stabilize_lods(raw, self.state_indices, self.switch_frames, self.distances,
+                                self.thresholds, self.margins, self.max_index, dwell_frames, frame)
+        self.state_indices = stable
+        return stable.copy()
+
+    def cull(self, view_projection, margin=0.0, hide=True):
+        """Frustum culling of the current result.
+
+        Groups whose bounding sphere lies outside the frustum of
+        view_projection (world to clip space) get LOD index -1 (no LOD
+        visible) or, with hide=False, their lowest LOD. Hysteresis state
+        is not touched, groups coming back into view resume from it.
+        """
+        outside = spheres_outside(self.centers, self.radii, frustum_planes(view_projection, margin))
+        self.culled_count = int(outside.sum())
+        self.lod_indices = np.where(outside, -1 if hide else self.max_index, self.lod_indices)
+        return self.lod_indices
+
+    def use_lod_indices(self, lod_indices):
+        """Take LOD indices computed elsewhere (a baked schedule) as the current result."""
+        self.lod_indices = np.minimum(np.asarray(lod_indices, dtype=np.int64), self.max_index)
+        self.raw_indices = self.lod_indices
+        self.state_indices = self.lod_indices.copy()
+        return self.lod_indices
+
+    def reset_state(self):
+        """Forget hysteresis and dwell state, the next evaluation starts fresh."""
+        self.state_indices = None
+
+    def changed_groups(self):
+        """Indices of groups whose LOD differs from the last applied result."""
+        if self.applied_indices is None or len(self.applied_indices) != len(self.lod_indices):
+            return np.arange(len(self.lod_indices))
+        return np.flatnonzero(self.lod_indices != self.applied_indices)
+
+    def mark_applied(self, groups=None):
+        """Record the current result as applied, for all groups or only the given ones."""
+        if groups is None:
+            self.applied_indices = self.lod_indices.copy()
+            return
+        if self.applied_indices is None or len(self.applied_indices) != len(self.lod_indices):
+            self.applied_indices = np.full(len(self.lod_indices), UNAPPLIED, dtype=np.int64)
+        self.applied_indices[groups] = self.lod_indices[groups]
+
+    def invalidate_applied(self, groups=None):
+        """Forget what was applied, for all groups or only the given ones."""
+        if groups is None or self.applied_indices is None:
+            self.applied_indices = None
+            return
+        self.applied_indices[groups] = UNAPPLIED
+
+    def append_group(self, max_index):
+        """Add a group at the end, keeping the arrays and state of every other group."""
+        count = len(self.max_index)
+        for name in self.GROUP_ARRAYS:
+            array = getattr(self, name)
+            if array is not None and len(array) == count:
+                setattr(self, name, np.concatenate((array, np.zeros((1,) + array.shape[1:], dtype=array.dtype))))
+        self.max_index[count] = max_index
+        # Never held by dwell time, never taken as applied
+        self.switch_frames[count] = NEVER_SWITCHED
+        if self.applied_indices is not None:
+            self.applied_indices[count] = UNAPPLIED
+        self._groups_changed()
+
+    def remove_group(self, index):
+        """Remove a group; the last group moves into its place (swap remove)."""
+        last = len(self.max_index) - 1
+        for name in self.GROUP_ARRAYS:
+            array = getattr(self, name)
+            if array is not None and len(array) == last + 1:
+                array[index] = array[last]
+                setattr(self, name, array[:last])
+        self._groups_changed()
+
+    def set_max_index(self, index, max_index):
+        """Change the LOD count of one group (LODs added to or removed from it)."""
+        self.max_index[index] = max_index
+        if self.state_indices is not None and len(self.state_indices) == len(self.max_index):
+            self.state_indices[index] = min(self.state_indices[index], max_index)
+        self.invalidate_applied([index])
+        self.invalidate_reference()
+
+    def _groups_changed(self):
+        # Results per view and the spatial index are in group order
+        self.view_results = {}
+        self.budget_tris = None
+        self.invalidate_reference()
+
+    def priority_order(self, groups):
+        """Groups sorted nearest first (largest coverage first for the screen-size metrics)."""
+        groups = np.asarray(groups, dtype=np.int64)
+        if len(self.distances) != len(self.lod_indices):
+            return groups
+        return groups[np.argsort(self.distances[groups], kind='stable')]
+
+
+def frustum_planes(view_projection, margin=0.0):
+    """Normalized planes (a, b, c, d) of a world to clip space matrix, inside where ax + by + cz + d >= 0.
+
+    The side planes are widened by margin, a fraction of the frustum
+    width in clip space; near and far are kept.
+    """
+    m = np.asarray(view_projection, dtype=np.float64).reshape(4, 4)
+    w = m[3] * (1.0 + margin)
+    planes = np.array([w + m[0], w - m[0], w + m[1], w - m[1], m[3] + m[2], m[3] - m[2]])
+    planes /= np.maximum(np.linalg.norm(planes[:, :3], axis=1), 1e-12)[:, None]
+    return planes
+
+
+def spheres_outside(centers, radii, planes):
+    """Mask of spheres entirely behind at least one plane."""
+    if not len(centers):
+        return np.zeros(0, dtype=bool)
+    signed = centers @ planes[:, :3].T + planes[:, 3]
+    return (signed < -radii[:, None]).any(axis=1)
+
+
+# LOD chain problems found by validate_chains (bit flags)
+ISSUE_GAP = 1
+ISSUE_DUPLICATE = 2
+ISSUE_NO_REDUCTION = 4
+ISSUE_BOUNDS = 8
+ISSUE_NAMES = {ISSUE_GAP: "level_gap", ISSUE_DUPLICATE: "duplicate_level",
+               ISSUE_NO_REDUCTION: "no_reduction", ISSUE_BOUNDS: "bounds_mismatch"}
+
+
+def validate_chains(levels, tris, box_min, box_max, min_reduction=0.0, bounds_tolerance=0.05):
+    """Check the LOD chain of every group in one pass over (groups, slots) arrays.
+
+    levels holds the LOD number of each slot in ascending order, -1 for
+    unused slots; tris the triangles and box_min / box_max (groups,
+    slots, 3) the world-space bounds of each slot. A level must keep at
+    most (1 - min_reduction) of the previous level's triangles. Bounds
+    deviation is the largest corner offset from the LOD0 box relative
+    to its diagonal. Returns (issue flags, worst triangle ratio, worst
+    bounds deviation) per group.
+    """
+    groups, slots = levels.shape
+    used = levels >= 0
+    pairs = used[:, 1:] & used[:, :-1]
+    steps = levels[:, 1:] - levels[:, :-1]
+    gap = (pairs & (steps > 1)).any(axis=1) | (used[:, 0] & (levels[:, 0] != 0)) if slots else np.zeros(groups, dtype=bool)
+    duplicate = (pairs & (steps == 0)).any(axis=1)
+    previous = np.maximum(tris[:, :-1], 1).astype(np.float64)
+    ratios = np.where(pairs, tris[:, 1:] / previous, 0.0)
+    worst_ratio = ratios.max(axis=1) if slots > 1 else np.zeros(groups, dtype=np.float64)
+    no_reduction = (pairs & (ratios > 1.0 - min_reduction)).any(axis=1)
+    if slots:
+        diagonal = np.linalg.norm(box_max[:, 0] - box_min[:, 0], axis=1)
+        offsets = np.maximum(np.abs(box_min - box_min[:, :1]), np.abs(box_max - box_max[:, :1])).max(axis=2)
+        deviation = np.where(used, offsets / np.maximum(diagonal, 1e-9)[:, None], 0.0).max(axis=1)
+    else:
+        deviation = np.zeros(groups, dtype=np.float64)
+    issues = (gap * ISSUE_GAP | duplicate * ISSUE_DUPLICATE | no_reduction * ISSUE_NO_REDUCTION
+              | (deviation > bounds_tolerance) * ISSUE_BOUNDS)
+    return issues.astype(np.int64), worst_ratio, deviation
+
+
+def screen_error(coverage, tris):
+    """Pixel length of an average triangle edge at each LOD, minus the value at the first available LOD."""
+    edge = 1.0 / np.sqrt(np.maximum(tris, 1.0))
+    first = np.isfinite(tris).argmax(axis=1)
+    return coverage[:, None] * (edge - edge[np.arange(len(edge)), first][:, None])
+
+
+def solve_budget(coverage, tris, budget, max_index):
+    """LOD index of every group with the least screen-space error whose triangles fit budget.
+
+    The screen-space error of a group at LOD i is estimated from the
+    projected triangle edge length, coverage / sqrt(tris), relative to
+    LOD0, so the first reductions of a dense mesh are the cheapest ones.
+    Starting from LOD0 everywhere, steps to the next LOD are taken
+    greedily in order of error added per triangle saved until the total
+    fits the budget. All steps are sorted at once instead of popping a
+    priority queue.
+
+    LODs whose object is missing have an infinite triangle count and are
+    never picked: a group starts at its first available LOD and never
+    steps into (or past) a missing one.
+    """
+    count = len(max_index)
+    slots = tris.shape[1] if tris.ndim == 2 else 0
+    if not count or not slots:
+        return np.zeros(count, dtype=np.int64)
+    available = np.isfinite(tris)
+    start = np.minimum(available.argmax(axis=1), max_index)
+    rows = np.arange(count)
+    first = tris[rows, start]
+    total = float(first[np.isfinite(first)].sum())
+    excess = total - budget
+    raw = start.astype(np.int64)
+    if excess > 0 and slots > 1:
+        error = screen_error(coverage, tris)
+        # Only between available LODs (inf - inf is not a number)
+        saved = np.subtract(tris[:, :-1], tris[:, 1:], out=np.zeros((count, slots - 1)),
+                            where=available[:, :-1] & available[:, 1:])
+        step = np.arange(slots - 1)[None, :]
+        valid = (step + 1 <= max_index[:, None]) & (step >= start[:, None]) & (saved > 0)
+        ratio = np.where(valid, (error[:, 1:] - error[:, :-1]) / np.where(valid, saved, 1.0), np.inf)
+        # Steps before a group's first available LOD never block the ones after it
+        ratio = np.where(step < start[:, None], -np.inf, ratio)
+        # Steps of one group must be taken in order: make their ratios non-decreasing
+        ratio = np.maximum.accumulate(ratio, axis=1).ravel()
+        steps = np.tile(np.arange(slots - 1), count)
+        order = np.lexsort((steps, ratio))
+        order = order[np.isfinite(ratio[order])]
+        savings = np.cumsum(np.where(valid, saved, 0.0).ravel()[order])
+        taken = order[:int(np.searchsorted(savings, excess, side='left')) + 1]
+        raw += np.bincount(taken // (slots - 1), minlength=count).astype(np.int64)
+    return raw
+
+
+def budget_usage(coverage, tris, lod_indices):
+    """(triangles, screen-space error) of a LOD selection."""
+    if not len(lod_indices) or tris.ndim != 2 or not tris.shape[1]:
+        return 0, 0.0
+    rows = np.arange(len(lod_indices))
+    available = np.isfinite(tris)
+    picked = available[rows, lod_indices]
+    error = screen_error(coverage, tris)[rows, lod_indices]
+    return int(tris[rows, lod_indices][picked].sum()), float(error[picked].sum())
+
+
+def stabilize_lods(raw, state, switch_frames, metric, thresholds, margins, max_index, dwell_frames, frame):
+    """Apply hysteresis and minimum dwell time against the previous per-group state.
+
+    With margins, a group moves to a farther LOD only once it is past
+    thr + margin and back to a nearer LOD only once it is inside
+    thr - margin. A group that switched less than dwell_frames frames
+    ago keeps its LOD (a later or repeated evaluation on the same frame
+    is never held, so editing a still frame stays responsive).
+    switch_frames is updated in place. Returns the new state.
+    """
+    if state is None or len(state) != len(raw):
+        return raw.copy()
+    if margins.any():
+        d = metric[:, None]
+        farther = (d >= (thresholds + margins)[None, :]).sum(axis=1)
+        nearer = (d >= (thresholds - margins)[None, :]).sum(axis=1)
+        stable = np.minimum(np.clip(state, farther, nearer), max_index)
+    else:
+        stable = raw.copy()
+    switched = stable != state
+    if dwell_frames > 0:
+        age = frame - switch_frames
+        held = switched & (age > 0) & (age < dwell_frames)
+        stable[held] = state[held]
+        switched &= ~held
+    switch_frames[switched] = frame
+    return stable
+
+
+def encode_schedule(frame_start, lod_table):
+    """Run-length encode a (frames, groups) table of LOD indices.
+
+    Returns one flat [frame, lod, frame, lod, ...] list per group, with an
+    entry for the first frame and for every frame where the LOD changes.
+    """
+    lods = np.asarray(lod_table, dtype=np.int64)
+    count = lods.shape[1]
+    if not count:
+        # np.split would still return one (empty) run list
+        return []
+    change = np.ones(lods.shape, dtype=bool)
+    change[1:] = lods[1:] != lods[:-1]
+    # Transposed: changes sorted by group, then by frame
+    groups, frames = np.nonzero(change.T)
+    runs = np.stack((frames + frame_start, lods[frames, groups]), axis=1)
+    return [run.ravel().tolist() for run in np.split(runs, np.searchsorted(groups, np.arange(1, count)))]
+
+
+class LODSchedule:
+    """Baked LOD index of every group over a frame range, looked up without evaluation."""
+
+    def __init__(self, frame_start, frame_end, runs):
+        self.frame_start = int(frame_start)
+        self.frame_end = int(frame_end)
+        span = self.frame_end - self.frame_start + 1
+        pairs = [np.asarray(run, dtype=np.int64).reshape(-1, 2) for run in runs]
+        groups = np.repeat(np.arange(len(pairs)), [len(pair) for pair in pairs])
+        merged = np.concatenate(pairs) if pairs else np.zeros((0, 2), dtype=np.int64)
+        # One sorted key per run start: group * span + frame offset
+        self.keys = groups * span + (merged[:, 0] - self.frame_start)
+        self.lods = merged[:, 1]
+        self.group_keys = np.arange(len(pairs), dtype=np.int64) * span
+
+    def __len__(self):
+        return len(self.group_keys)
+
+    def covers(self, frame):
+        return self.frame_start <= frame <= self.frame_end
+
+    def lookup(self, frame):
+        """LOD index of every group at frame, or None outside the baked range."""
+        if not self.covers(frame):
+            return None
+        # Last run of each group starting at or before the frame
+        return self.lods[np.searchsorted(self.keys, self.group_keys + (frame - self.frame_start), side='right') - 1]
@@ -0,0 +1,228 @@
+"""LOD generation for LOD Manager: decimation in-process or in background Blender workers.
+
+This module is imported by the add-on and is also the script run by the
+workers (blender -b --python lod_workers.py -- ...), so it must not use
+relative imports.
+
+A job is a dict {"object": LOD0 object name, "base": base name,
+"levels": [[level, target], ...]}; target is a decimation ratio or a
+triangle count depending on the mode.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+import bpy
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+# Below this many objects the pool start-up costs more than it saves
+POOL_MIN_OBJECTS = 16
+# Source vertices measure_error checks per LOD
+ERROR_SAMPLES = 2000
+
+
+def lod_name(base_name, level):
+    # Naming convention of LOD_PATTERN
+    return f"{base_name}_LOD{level}"
+
+
+def parse_targets(text):
+    """Comma separated ratios / triangle counts, one per generated level."""
+    targets = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip()
+        if part:
+            targets.append(float(part))
+    return targets
+
+
+def count_tris(mesh):
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(loop_totals.sum()) - 2 * len(mesh.polygons)
+
+
+def level_ratio(mode, target, tris):
+    if mode == 'TRIANGLES':
+        return min(1.0, target / tris) if tris else 1.0
+    return min(max(target, 0.0), 1.0)
+
+
+def measure_error(source_mesh, lod_mesh, samples=ERROR_SAMPLES):
+    """Geometric error of a LOD in object space.
+
+    One-sided Hausdorff distance estimated at up to `samples` source
+    vertices spread evenly over the vertex order: the largest distance
+    from a sampled LOD0 vertex to the LOD surface. Coordinates are read
+    with foreach_get, so the cost is bounded by the sample count.
+    """
+    count = len(source_mesh.vertices)
+    if not len(lod_mesh.polygons) or not count:
+        return 0.0
+    lod_coords = np.empty(len(lod_mesh.vertices) * 3, dtype=np.float32)
+    lod_mesh.vertices.foreach_get("co", lod_coords)
+    lod_mesh.calc_loop_triangles()
+    triangles = np.empty(len(lod_mesh.loop_triangles) * 3, dtype=np.int32)
+    lod_mesh.loop_triangles.foreach_get("vertices", triangles)
+    tree = BVHTree.FromPolygons(lod_coords.reshape(-1, 3).tolist(), triangles.reshape(-1, 3).tolist())
+    coords = np.empty(count * 3, dtype=np.float32)
+    source_mesh.vertices.foreach_get("co", coords)
+    picked = np.linspace(0, count - 1, min(count, samples)).astype(np.int64)
+    error = 0.0
+    for co in coords.reshape(count, 3)[picked].tolist():
+        nearest = tree.find_nearest(co)
+        if nearest[0] is not None:
+            error = max(error, nearest[3])
+    return error
+
+
+def generate_lods(scene, jobs, mode, objects):
+    """Decimate every job's LOD0 into its levels. Returns the new objects.
+
+    New objects are linked to the scene collection and tagged with
+    lod_source, lod_level and lod_error custom properties. All decimate
+    modifiers are evaluated in one depsgraph update.
+    """
+    pending = []
+    for job in jobs:
+        source = objects.get(job["object"])
+        if source is None or source.type != 'MESH':
+            continue
+        tris = count_tris(source.data)
+        for level, target in job["levels"]:
+            obj = bpy.data.objects.new(lod_name(job["base"], level), source.data)
+            scene.collection.objects.link(obj)
+            mod = obj.modifiers.new("Decimate", 'DECIMATE')
+            mod.ratio = level_ratio(mode, target, tris)
+            pending.append((source, level, obj))
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    created = []
+    for source, level, obj in pending:
+        mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        mesh.name = obj.name
+        obj.modifiers.clear()
+        obj.data = mesh
+        obj["lod_source"] = source.name
+        obj["lod_level"] = level
+        obj["lod_error"] = measure_error(source.data, mesh)
+        created.append(obj)
+    return created
+
+
+def start_pool(jobs, mode, workers):
+    """Start background Blender workers, one shard of jobs each. Does not wait for them.
+
+    Sources go to the workers and results come back through temporary
+    .blend libraries. Returns the run state for poll_pool / finish_pool /
+    cancel_pool.
+    """
+    workers = max(1, min(workers, len(jobs)))
+    shards = [jobs[i::workers] for i in range(workers)]
+    tmp_dir = tempfile.mkdtemp(prefix="lod_generate_")
+    processes = []
+    try:
+        for i, shard in enumerate(shards):
+            source_path = os.path.join(tmp_dir, f"shard_{i}_source.blend")
+            jobs_path = os.path.join(tmp_dir, f"shard_{i}_jobs.json")
+            result_path = os.path.join(tmp_dir, f"shard_{i}_result.blend")
+            log_path = os.path.join(tmp_dir, f"shard_{i}.log")
+            bpy.data.libraries.write(source_path, {bpy.data.objects[job["object"]] for job in shard}, fake_user=True)
+            with open(jobs_path, "w") as f:
+                json.dump({"mode": mode, "jobs": shard}, f)
+            with open(log_path, "w") as log:
+                process = subprocess.Popen(
+                    [bpy.app.binary_path, "-b", "--factory-startup", "-noaudio", "--python", __file__,
+                     "--", source_path, jobs_path, result_path],
+                    stdout=log, stderr=subprocess.STDOUT,
+                )
+            processes.append((process, result_path, log_path))
+    except BaseException:
+        cancel_pool({"tmp_dir": tmp_dir, "processes": processes})
+        raise
+    return {"tmp_dir": tmp_dir, "processes": processes}
+
+
+def poll_pool(run):
+    """(finished workers, all workers)."""
+    finished = sum(1 for process, _, _ in run["processes"] if process.poll() is not None)
+    return finished, len(run["processes"])
+
+
+def finish_pool(run):
+    """Load the workers' results and clean up. Returns the new objects appended to the current
+    file (not linked to any collection yet); raises RuntimeError if a worker failed, leaving
+    nothing of the run in the file.
+    """
+    created = []
+    try:
+        for process, result_path, log_path in run["processes"]:
+            process.wait()
+            if process.returncode != 0 or not os.path.exists(result_path):
+                with open(log_path) as log:
+                    tail = log.read()[-2000:]
+                raise RuntimeError(f"LOD worker failed ({process.returncode}):\n{tail}")
+            with bpy.data.libraries.load(result_path, link=False) as (data_from, data_to):
+                data_to.objects = data_from.objects
+            created.extend(obj for obj in data_to.objects if obj is not None)
+        return created
+    except RuntimeError:
+        # Results of the shards that did succeed
+        for obj in created:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            if mesh is not None and not mesh.users:
+                bpy.data.meshes.remove(mesh)
+        raise
+    finally:
+        shutil.rmtree(run["tmp_dir"], ignore_errors=True)
+
+
+def cancel_pool(run):
+    for process, _, _ in run["processes"]:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    shutil.rmtree(run["tmp_dir"], ignore_errors=True)
+
+
+def run_pool(jobs, mode, workers, progress=None):
+    """start_pool and wait for all workers (headless use; the add-on polls from a modal operator)."""
+    run = start_pool(jobs, mode, workers)
+    try:
+        done, total = poll_pool(run)
+        while done < total:
+            if progress is not None:
+                progress(done, total)
+            time.sleep(0.1)
+            done, total = poll_pool(run)
+    except BaseException:
+        cancel_pool(run)
+        raise
+    if progress is not None:
+        progress(done, total)
+    return finish_pool(run)
+
+
+def worker_main(argv):
+    # blender -b --factory-startup --python lod_workers.py -- <source.blend> <jobs.json> <result.blend>
+    source_path, jobs_path, result_path = argv[argv.index("--") + 1:][:3]
+    with open(jobs_path) as f:
+        params = json.load(f)
+    with bpy.data.libraries.load(source_path, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    # Library names are the original names, loaded objects may have been renamed
+    objects = {name: obj for name, obj in zip(data_from.objects, data_to.objects) if obj is not None}
+    scene = bpy.context.scene
+    created = generate_lods(scene, params["jobs"], params["mode"], objects)
+    bpy.data.libraries.write(result_path, set(created), fake_user=True)
+    print(f"LOD worker: {len(created)} LODs written to {result_path}")
+
+
+if __name__ == "__main__":
+    worker_main(sys.argv)
@@ -0,0 +1,27 @@
+"""Tests of the bpy-free LOD Manager logic (python -m pytest tests)."""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "LOD_manager"))
+
+from lod_logic import LODSchedule, encode_schedule  # noqa: E402
+
+
+def test_encode_schedule_without_groups():
+    assert encode_schedule(1, np.zeros((10, 0), dtype=np.int64)) == []
+    schedule = LODSchedule(1, 10, encode_schedule(1, np.zeros((10, 0), dtype=np.int64)))
+    assert len(schedule) == 0
+    assert schedule.lookup(5).tolist() == []
+
+
+def test_encode_schedule_round_trip():
+    table = np.array([[0, 2], [0, 2], [1, 2], [1, 0]])
+    runs = encode_schedule(5, table)
+    assert runs == [[5, 0, 7, 1], [5, 2, 8, 0]]
+    schedule = LODSchedule(5, 8, runs)
+    for offset, row in enumerate(table):
+        assert schedule.lookup(5 + offset).tolist() == row.tolist()
+    assert schedule.lookup(9) is None